@@ -0,0 +1,52 @@
+import tracemalloc
+
+import pytest
+
+import osmdatapy
+
+DEFAULTS = ["highways", "buildings", "pois"]
+VARIANTS = {
+    "tags": {},
+    "geometry": {"geometry": True},
+    "topology": {"geometry": True, "topology": True},
+}
+
+
+def peak_memory(func, *args):
+    """Peak memory allocated while running func, in MB"""
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def bench_open(benchmark, pbf_path):
+    benchmark.extra_info["peak_memory_mb"] = peak_memory(osmdatapy.OSM, pbf_path)
+    benchmark(osmdatapy.OSM, pbf_path)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("default", DEFAULTS)
+def bench_query(benchmark, osm, default, variant):
+    query = osmdatapy.Query(default, **VARIANTS[variant])
+    benchmark.extra_info["peak_memory_mb"] = peak_memory(osm.query, query)
+    benchmark(osm.query, query)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("default", DEFAULTS)
+def bench_to_dataframe(benchmark, osm, default, variant):
+    query = osmdatapy.Query(default, **VARIANTS[variant])
+    results = osm._results(query)
+    benchmark.extra_info["peak_memory_mb"] = peak_memory(osm.to_dataframe, query, *results)
+    benchmark(osm.to_dataframe, query, *results)
+
+
+def bench_graph(benchmark, osm):
+    query = osmdatapy.Query("highways")
+    benchmark.extra_info["peak_memory_mb"] = peak_memory(osm.graph, query)
+    benchmark(osm.graph, query)
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synthetic import generate
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--scale",
+        type=float,
+        default=float(os.environ.get("OSMDATAPY_BENCH_SCALE", 1.0)),
+        help="size factor of the synthetic pbf file",
+    )
+    parser.addoption(
+        "--seed", type=int, default=0, help="random seed of the synthetic pbf file"
+    )
+
+
+@pytest.fixture(scope="session")
+def pbf_path(request, tmp_path_factory):
+    """Path of a synthetic pbf file, generated once per session"""
+
+    scale = request.config.getoption("--scale")
+    seed = request.config.getoption("--seed")
+    path = tmp_path_factory.mktemp("osm") / "synthetic_{0}_{1}.osm.pbf".format(scale, seed)
+    generate(str(path), scale=scale, seed=seed)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def osm(pbf_path):
+    import osmdatapy
+
+    return osmdatapy.OSM(pbf_path)
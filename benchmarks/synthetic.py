@@ -0,0 +1,240 @@
+# Deterministic synthetic pbf generator for benchmarks, no network access needed
+
+import random
+import struct
+import zlib
+
+BLOCK_SIZE = 8000
+TIMESTAMP = 1600000000
+
+HIGHWAY_TYPES = ["primary", "secondary", "tertiary", "residential", "service", "footway"]
+AMENITIES = ["cafe", "restaurant", "bench", "school", "pharmacy", "parking"]
+SHOPS = ["bakery", "supermarket", "clothes", "books"]
+
+
+def generate(filepath, scale=1.0, seed=0, block_size=BLOCK_SIZE):
+    """
+    Write a synthetic pbf file of a street grid, with pois, buildings and multipolygons
+
+    counts are proportional to scale, scale 1 is about 30 000 nodes, 3 000 ways and 300 relations.
+    The same scale and seed always produce the same file.
+
+    Parameters
+    ----------
+    filepath : path of the pbf file to write
+    scale : size factor of the file
+    seed : random seed
+    block_size : maximum number of osm objects in a block
+    """
+
+    rnd = random.Random(seed)
+    nodes, ways, rels = _content(rnd, scale)
+
+    with open(filepath, "wb") as f:
+        f.write(_header())
+        for i in range(0, len(nodes), block_size):
+            f.write(_dense_block(nodes[i : i + block_size]))
+        for i in range(0, len(ways), block_size):
+            f.write(_way_block(ways[i : i + block_size]))
+        for i in range(0, len(rels), block_size):
+            f.write(_relation_block(rels[i : i + block_size]))
+
+    return {"nodes": len(nodes), "ways": len(ways), "relations": len(rels)}
+
+
+def _content(rnd, scale):
+    """Lists of nodes (id, lon, lat, tags), ways (id, refs, tags) and relations (id, members, tags)"""
+
+    n = max(int(150 * scale**0.5), 10)
+    nodes, ways, rels = [], [], []
+
+    def add_node(lon, lat, tags=None):
+        nodes.append((len(nodes) + 1, lon, lat, tags or {}))
+        return len(nodes)
+
+    def add_way(refs, tags=None):
+        ways.append((len(ways) + 1, refs, tags or {}))
+        return len(ways)
+
+    # street grid, a node at each crossing and dense tags on some nodes
+    grid = {}
+    for i in range(n):
+        for j in range(n):
+            tags = {}
+            if rnd.random() < 0.1:
+                tags = {"amenity": rnd.choice(AMENITIES), "name": "poi %d %d" % (i, j)}
+            elif rnd.random() < 0.05:
+                tags = {"shop": rnd.choice(SHOPS), "opening_hours": "Mo-Sa 08:00-20:00"}
+            elif rnd.random() < 0.05:
+                tags = {"highway": "crossing", "crossing": "zebra"}
+            lon = 2.0 + j * 0.001 + rnd.uniform(-0.0002, 0.0002)
+            lat = 48.0 + i * 0.001 + rnd.uniform(-0.0002, 0.0002)
+            grid[i, j] = add_node(lon, lat, tags)
+
+    for i in range(n):
+        tags = {"highway": rnd.choice(HIGHWAY_TYPES), "name": "row %d" % i}
+        if rnd.random() < 0.2:
+            tags["oneway"] = rnd.choice(["yes", "-1"])
+        add_way([grid[i, j] for j in range(n)], tags)
+
+    for j in range(n):
+        tags = {"highway": rnd.choice(HIGHWAY_TYPES), "name": "column %d" % j}
+        add_way([grid[i, j] for i in range(n)], tags)
+
+    # buildings in blocks between streets
+    squares = [(i, j) for i in range(n - 1) for j in range(n - 1)]
+    for i, j in rnd.sample(squares, min(len(squares), int(2000 * scale))):
+        lon, lat = 2.0 + j * 0.001 + 0.0003, 48.0 + i * 0.001 + 0.0003
+        d = 0.0003
+        ring = [
+            add_node(lon, lat),
+            add_node(lon + d, lat),
+            add_node(lon + d, lat + d),
+            add_node(lon, lat + d),
+        ]
+        tags = {"building": rnd.choice(["yes", "house", "apartments"])}
+        if rnd.random() < 0.3:
+            tags["building:levels"] = str(rnd.randint(1, 10))
+        add_way(ring + ring[:1], tags)
+
+    # multipolygons with an outer ring made of two ways and an inner ring
+    for k in range(int(300 * scale)):
+        lon, lat = 2.0 + rnd.uniform(0, n * 0.001), 48.0 + rnd.uniform(0, n * 0.001)
+        d = 0.0005
+        outer = [
+            add_node(lon, lat),
+            add_node(lon + 4 * d, lat),
+            add_node(lon + 4 * d, lat + 4 * d),
+            add_node(lon, lat + 4 * d),
+        ]
+        inner = [
+            add_node(lon + d, lat + d),
+            add_node(lon + 2 * d, lat + d),
+            add_node(lon + 2 * d, lat + 2 * d),
+        ]
+        w1 = add_way(outer[:3])
+        w2 = add_way(outer[2:] + outer[:1])
+        w3 = add_way(inner + inner[:1])
+        members = [(1, w1, "outer"), (1, w2, "outer"), (1, w3, "inner")]
+        tags = {"type": "multipolygon", rnd.choice(["building", "landuse"]): "yes"}
+        rels.append((len(rels) + 1, members, tags))
+
+    return nodes, ways, rels
+
+
+# -------------------------------------------------------------
+# minimal pbf encoder
+
+
+def _varint(value):
+    res = bytearray()
+    value &= (1 << 64) - 1
+    while value > 0x7F:
+        res.append((value & 0x7F) | 0x80)
+        value >>= 7
+    res.append(value)
+    return bytes(res)
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _field_varint(key, value):
+    return _varint(key << 3) + _varint(value)
+
+
+def _field_bytes(key, value):
+    return _varint((key << 3) | 2) + _varint(len(value)) + value
+
+
+def _field_packed(key, values, signed=False, delta=False):
+    # empty fields are omitted, as most encoders do
+    if not values:
+        return b""
+    res, prev = bytearray(), 0
+    for v in values:
+        d = v - prev if delta else v
+        prev = v
+        res += _varint(_zigzag(d) if signed else d)
+    return _field_bytes(key, bytes(res))
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings = {"": 0}
+
+    def __call__(self, value):
+        return self.strings.setdefault(value, len(self.strings))
+
+    def encode(self):
+        return _field_bytes(1, b"".join(_field_bytes(1, s.encode()) for s in self.strings))
+
+
+def _blob(blobtype, data):
+    blob = _field_varint(2, len(data)) + _field_bytes(3, zlib.compress(data))
+    header = _field_bytes(1, blobtype.encode()) + _field_varint(3, len(blob))
+    return struct.pack("!L", len(header)) + header + blob
+
+
+def _header():
+    data = _field_bytes(4, b"OsmSchema-V0.6") + _field_bytes(4, b"DenseNodes")
+    data += _field_bytes(5, b"Sort.Type_then_ID") + _field_bytes(16, b"osmdatapy benchmarks")
+    return _blob("OSMHeader", data)
+
+
+def _primitive_block(strings, group):
+    return _blob("OSMData", strings.encode() + _field_bytes(2, group))
+
+
+def _dense_block(nodes):
+    strings = _StringTable()
+    keyvals = []
+    for n in nodes:
+        for k, v in n[3].items():
+            keyvals += [strings(k), strings(v)]
+        keyvals.append(0)
+
+    info = _field_packed(1, [1] * len(nodes))
+    info += _field_packed(2, [TIMESTAMP + n[0] for n in nodes], True, True)
+    info += _field_packed(3, [n[0] for n in nodes], True, True)
+
+    dense = _field_packed(1, [n[0] for n in nodes], True, True)
+    dense += _field_bytes(5, info)
+    dense += _field_packed(8, [round(n[2] * 1e7) for n in nodes], True, True)
+    dense += _field_packed(9, [round(n[1] * 1e7) for n in nodes], True, True)
+    dense += _field_packed(10, keyvals)
+
+    return _primitive_block(strings, _field_bytes(2, dense))
+
+
+def _info(elemid):
+    return _field_varint(1, 1) + _field_varint(2, TIMESTAMP + elemid) + _field_varint(3, elemid)
+
+
+def _way_block(ways):
+    strings = _StringTable()
+    group = bytearray()
+    for elemid, refs, tags in ways:
+        way = _field_varint(1, elemid)
+        way += _field_packed(2, [strings(k) for k in tags])
+        way += _field_packed(3, [strings(v) for v in tags.values()])
+        way += _field_bytes(4, _info(elemid))
+        way += _field_packed(8, refs, True, True)
+        group += _field_bytes(3, way)
+    return _primitive_block(strings, bytes(group))
+
+
+def _relation_block(rels):
+    strings = _StringTable()
+    group = bytearray()
+    for elemid, members, tags in rels:
+        rel = _field_varint(1, elemid)
+        rel += _field_packed(2, [strings(k) for k in tags])
+        rel += _field_packed(3, [strings(v) for v in tags.values()])
+        rel += _field_bytes(4, _info(elemid))
+        rel += _field_packed(8, [strings(m[2]) for m in members])
+        rel += _field_packed(9, [m[1] for m in members], True, True)
+        rel += _field_packed(10, [m[0] for m in members])
+        group += _field_bytes(4, rel)
+    return _primitive_block(strings, bytes(group))
@@ -2,4 +2,10 @@
 
 from .osmdata import OSM
 from .osmquery import Query
-from .datasource.OSMdatasource import OSM_datasource
\ No newline at end of file
+from .datasource.OSMdatasource import OSM_datasource
+from .graph import Graph
+from .cache import ResultCache
+from .stats import Stats
+from .progress import CancelToken, Cancelled
+from .collection import OSMCollection
+from .ragged import RaggedGeometry
@@ -1,39 +1,63 @@
+import copy
+
 import numpy as np
 import pandas as pd
+import geopandas as gpd
+import shapely as sh
 
-from ._geometry import points, linestrings, polygons, _simple_ix
+from ._geometry import from_offsets
+from ._topology import segments, row_offsets, concat_ranges, assemble_rings
+from .ragged import RaggedGeometry
 
 
 class Frame:
     def to_dataframe(self, query, ids, tags, rels, ways=None):
         """Convert query results to a dataframe"""
 
+        stats = self._stats()
+
         cols = ["osmid", "osmtype"]
         if query.metadata:
-            cols = cols + ["changeset", "timestamp", "version"]
-        df = pd.DataFrame(data=ids[:, 0 : len(cols) + 1], columns=cols)
+            cols = cols + ["version", "timestamp", "changeset"]
+        if ids is None:
+            return pd.DataFrame(columns=cols).set_index("osmid")
+
+        with stats.stage("ids_frame"):
+            df = pd.DataFrame(data=ids[:, : len(cols)], columns=cols)
+
+            if query.metadata:
+                df = df.astype({"version": "int32", "changeset": "int64"})
+                df["timestamp"] = df["timestamp"].to_numpy().astype("datetime64[s]")
+        stats.add("ids_frame", rows=len(df))
 
         # convert tags to columns and add to results
         if tags is not None and tags.shape[0] > 0:
-            df_tags = self._prepare_tags(tags)
-            df.loc[df_tags.index, df_tags.columns] = df_tags
+            with stats.stage("tags"):
+                df_tags = self._prepare_tags(tags)
+                df.loc[df_tags.index, df_tags.columns] = df_tags
+            stats.add("tags", rows=len(tags), columns=len(df_tags.columns))
 
         # expand relations with ways
         if rels is not None and rels.shape[0] > 0:
-            df_r = self._prepare_relations(rels)
-            df_w = self._prepare_ways(ways)
-
-            # drop duplicated ways also in df
-            if df_w is not None:
-                df = df.loc[~df.osmid.isin(df_w["memid"])]
+            with stats.stage("relations"):
+                # drop duplicated ways also in df
+                if ways is not None:
+                    df = df.loc[~((df.osmtype == 1) & df.osmid.isin(ways[:, 0]))]
+                if query.topology or not query.geometry:
+                    df_r = self._prepare_relations(rels)
+            stats.add("relations", rows=len(rels))
 
             if query.topology:
-                df_r = self.relation_topology(df_r)
-                df_r = self.make_topo_geom(df_r)
+                with stats.stage("topology"):
+                    df_r, ptids, ix = self.relation_topology(df_r)
+                    df_r = self.make_topo_geom(df_r, ptids, ix)
+                stats.add("topology", rows=len(df_r))
                 df = pd.merge(df, df_r, left_index=True, right_on="row", how="inner")
 
             elif query.geometry:
-                df_r = self.relation_geometry(df_r, df_w)
+                with stats.stage("geometry"):
+                    df_r = self.relation_geometry(rels, ways)
+                stats.add("geometry", rows=len(df_r))
                 df = pd.merge(df, df_r, left_index=True, right_on="row", how="left")
 
             else:
@@ -42,19 +66,73 @@ class Frame:
             df = df.drop(columns="row")
 
         # add node geometries
-        pts = df.loc[df.osmtype == 0]
-        if query.geometry and len(pts) > 0:
-
-            pts = self.make_points(pts.copy(), "osmid")
-            df = df.set_index("osmid")
-            pts = pts.set_index("osmid")
-            df.loc[pts.index, "geometry"] = pts["geometry"]
-            return df.sort_index()
+        pts = df.osmtype == 0
+        if query.geometry and pts.any():
+            with stats.stage("points"):
+                if "geometry" not in df.columns:
+                    df["geometry"] = None
+                df.loc[pts, "geometry"] = sh.points(self.coords(df.loc[pts, "osmid"]))
+            stats.add("points", rows=int(pts.sum()))
+
+        with stats.stage("finalize"):
+            if query.geometry:
+                df = df.set_geometry("geometry", crs=4326)
+            df = df.set_index("osmid").sort_index(kind="stable")
+        stats.add("finalize", rows=len(df))
 
-        if query.geometry:
-            df = df.set_geometry("geometry", crs=4326)
+        return df
 
-        return df.set_index("osmid").sort_index()
+    def to_ragged(self, query, ids, tags, rels, ways=None, member_ways=None):
+        """
+        Convert query results to a dataframe without geometry column
+        and a RaggedGeometry of coordinates and offsets, with rows in the same order
+
+        member ways of relations in ways and ways with ids in member_ways are dropped
+        """
+
+        df_query = copy.copy(query)
+        df_query.geometry = False
+        df = self.to_dataframe(df_query, ids, tags, None)
+
+        if ids is None:
+            empty = np.zeros(1, dtype=np.int64)
+            return df, RaggedGeometry(empty[:0], self._geo_coords[:0], empty, empty, empty)
+
+        with self._stats().stage("ragged"):
+            # rows of the dataframe are sorted by osmid, in the order of ids if equal
+            order = np.argsort(ids[:, 0], kind="stable")
+
+            # points of nodes, lines and areas of ways and relations
+            nodes = np.flatnonzero(ids[:, 1] == 0)
+            single = np.arange(len(nodes) + 1)
+            pieces = [(nodes, 1, ids[nodes, 0], [single, single, single])]
+            if rels is not None:
+                rows, ptids, offsets = self._line_parts(rels, ways)
+                lines = np.arange(len(offsets[0]))
+                pieces.append((rows, 2, ptids, [offsets[0], lines, offsets[1]]))
+                rows, ptids, offsets = self._area_parts(rels, ways)
+                pieces.append((rows, 3, ptids, offsets))
+
+            # geometries of pieces, and a last geometry without part
+            rows = np.concatenate([p[0] for p in pieces])
+            geom_types = np.concatenate([np.full(len(p[0]), p[1]) for p in pieces] + [[0]])
+            ptids = np.concatenate([p[2] for p in pieces])
+            offsets = [_concat_offsets([p[3][i] for p in pieces]) for i in range(3)]
+            offsets[2] = np.append(offsets[2], offsets[2][-1])
+            geoms = RaggedGeometry(geom_types, self.coords(ptids), *offsets)
+
+            index = np.full(len(ids), len(rows), dtype=np.int64)
+            index[rows] = np.arange(len(rows))
+            res = geoms.take(index[order])
+
+            # member ways of relations are not returned as ways
+            drop = [w for w in (None if ways is None else ways[:, 0], member_ways) if w is not None]
+            if drop:
+                keep = ~((df["osmtype"] == 1) & df.index.isin(np.concatenate(drop))).to_numpy()
+                df, res = df.loc[keep], res.take(np.flatnonzero(keep))
+        self._stats().add("ragged", rows=len(res))
+
+        return df, res
 
     def _prepare_tags(self, tags):
         df = pd.DataFrame(data=tags, columns=["osmpos", "tags", "values"])
@@ -72,232 +150,170 @@ class Frame:
         df_r["role"] = self.map_to_strings(df_r["role"])
         return df_r
 
-    def _prepare_ways(self, ways):
-        """create ways dataframe, add _s and _t columns with first and last node ids"""
-        if ways is None:
-            return None
-
-        res = pd.DataFrame(ways, columns=["memid", "ptid"], dtype=np.uint64)
-        res[["_s", "_t"]] = self.end_values(res, "memid", "ptid")
-        return res
-
     # ---------------------------------
     # geometry
 
-    def relation_geometry(self, df_r, ways):
-        """Simplify relations as geometries, results with one row of each osmid and geometry type"""
-
-        # dispatch geometries depending on geom type
-        res = []
-        res.append(self.make_points(df_r.loc[df_r.geom == 1].copy(), "memid"))
-        res.append(self.make_lines(df_r.loc[df_r.geom == 2].copy()))
-        res.append(self.make_areas(df_r.loc[df_r.geom == 3].copy(), ways))
-
-        res = pd.concat(res, ignore_index=True).reset_index(drop=True)
-        return res.drop(columns=["geom", "type", "role", "ptid"])
-
-    def make_points(self, df, ptcol):
-        coords = self.coords(df[ptcol])
-        return points(df, 4326, coords).drop(columns=ptcol)
-
-    def make_lines(self, df):
-        coords = self.coords(df["memid"])
-        return linestrings(df, 4326, coords, "row").drop(columns=["memid"])
-
-    def make_areas(self, df, ways):
-        """Add a polygon/multipolygon geometry column to a relation dataframe grouped by osm id"""
-
-        res = []
-        ringmax = 0
-
-        # simple areas from ways, nodes already expanded
-        mask = ~df.role.isin(["outer", "inner"])
-
-        if mask.any():
-            simple = df.loc[mask].rename(columns={"memid": "ptid"})
-            simple["ring"] = simple["row"]
-            simple["role"] = "outer"
-            ringmax = simple["ring"].max()
-            res.append(simple.drop(columns=["geom", "type"]))
-
-        # simple areas from relations : one way and closed
-        if ways is not None:
-            areas = df.loc[~mask].copy()
-            w = ways.drop_duplicates("memid")[["memid", "_s", "_t"]]
-            areas = pd.merge(areas, w, on="memid", how="left")
-            mask = areas["_s"] == areas["_t"]
-
-        # expand closed ways
-        if ways is not None and mask.any():
-            closed = areas.loc[mask].drop(columns=["_s", "_t", "geom", "type"])
-            closed = pd.merge(closed, ways, on="memid", how="left")
-            closed["ring"] = _simple_ix(closed["memid"]) + ringmax + 1
-            ringmax = closed["ring"].max()
-            res.append(closed.drop(columns=["memid", "_s", "_t"]))
-
-        # expand complex ways
-        if ways is not None and not mask.all():
-            areas = areas.loc[~mask].copy()
-
-            # reorder rings and create ring indices
-            cols = ["row", "role"]
-            res_col = ["pos", "dir", "ring"]
-            areas[res_col] = areas.groupby(cols, sort=False).apply(self._reorder_ring)
-            areas["ring"] = _simple_ix(areas["row"]) + areas["ring"] + ringmax + 1
-
-            # remove inner rings if multiple outer rings
-            areas = self._drop_complex_rings(areas)
-
-            w = ways.loc[ways.memid.isin(areas.memid)].copy()
-            w["node_pos"] = self._position_ix(w, "memid")
-
-            # reorder rows, if dir is -1, order is reversed
-            areas = areas.drop(columns=["_s", "_t"])
-            areas = pd.merge(areas, w, on="memid", how="left")
-            areas["node_pos"] = areas["node_pos"] * areas["dir"]
-            cols = ["row", "role", "ring", "pos", "node_pos"]
-            areas = areas.sort_values(cols, kind="stable")
-
-            # drop intermediate duplicated nodes
-            areas = areas.loc[(areas.pos == 0) | (areas.node_pos != 0)]
-            cols = ["node_pos", "dir", "pos", "geom", "type", "memid"]
-            areas = areas.drop(columns=cols)
-
-            # add node if last node in a ring is not the same as first
-            areas = self._close_rings(areas, "ring")
-            areas = areas.sort_values(["row", "role", "ring"], kind="stable")
-            res.append(areas.drop(columns=["_s", "_t"]))
-
-        areas = pd.concat(res, ignore_index=True)
-
-        # polygon indices
-        areas["poly"] = self._polygon_indices(areas)
-
-        # create geometries
-        coords = self.coords(areas["ptid"])
-        areas = polygons(areas, 4326, coords, "ring", "poly", multi_indices="row")
-        return areas.drop(columns=["ring", "poly"])
-
-    @staticmethod
-    def _reorder_ring(grp):
-        """Add columns pos (way order in ring) and direction (1 = same as way, -1 reverse"""
-
-        df = grp.assign(trav=False, pos=0, direction=1, ring=0)
-        ix = df.head(1).index[0]
-        node = df.loc[ix, "_t"]
-        df.loc[ix, "trav"] = True
-        l = len(df)
-
-        pos = 1
-        ring = 0
-
-        while pos < l:
-            mask = (~df.trav) & (df["_s"] == node)
-            if mask.any():
-                ix = df.loc[mask].index[0]
-                node = df.loc[ix, "_t"]
-                df.loc[ix, ["trav", "pos"]] = [True, pos]
-
-            elif len(df.loc[(~df.trav) & (df["_t"] == node)]) > 0:
-                ix = df.loc[(df["_t"] == node) & (~df.trav)].index[0]
-                node = df.loc[ix, "_s"]
-                df.loc[ix, ["trav", "direction", "pos"]] = [True, -1, pos]
-
-            else:
-                ring += 1
-                ix = df.loc[~df.trav].head(1).index[0]
-                node = df.loc[ix, "_t"]
-                df.loc[ix, ["trav", "pos"]] = [True, pos]
-                df.loc[~df.trav, "ring"] = ring
-
-            pos += 1
-
-        return df[["pos", "direction", "ring"]]
-
-    @staticmethod
-    def _close_rings(df, ringcol="ringid"):
-        """Add an ending node equal to first node in ring if it does not exists"""
-
-        closer = df.groupby(ringcol).agg(
-            first=("ptid", "first"),
-            last=("ptid", "last"),
-            role=("role", "first"),
-            row=("row", "first"),
+    def relation_geometry(self, rels, ways):
+        """
+        Linestring, polygon and multi geometries of ways and relations in rels, built from
+        coordinates and offsets arrays, one row of each row of rels with a geometry
+
+        Parameters
+        ----------
+        rels : relation results, node ids of ways and member ways of relations
+        ways : array of way id and node id of member ways, way after way, or None
+        """
+
+        rows, geoms = [], []
+
+        lines, ptids, offsets = self._line_parts(rels, ways)
+        if len(lines) > 0:
+            rows.append(lines)
+            geoms.append(from_offsets(self.coords(ptids), offsets))
+
+        areas, ptids, offsets = self._area_parts(rels, ways)
+        if len(areas) > 0:
+            rows.append(areas)
+            geoms.append(from_offsets(self.coords(ptids), offsets, polygon=True))
+
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        geoms = np.concatenate(geoms) if geoms else np.zeros(0, dtype=object)
+        return gpd.GeoDataFrame({"row": rows}, geometry=gpd.array.GeometryArray(geoms), crs=4326)
+
+    def _line_parts(self, rels, ways):
+        """
+        Rows, node ids and offsets of linestrings of ways and multilinestrings of relations,
+        offsets are start positions of lines in node ids and of the lines of each row
+        """
+
+        refs, starts, counts, rows, _ = self._member_nodes(rels[rels[:, 4] == 2], ways)
+
+        valid = counts >= 2
+        starts, counts, rows = starts[valid], counts[valid], rows[valid]
+        ptids = refs[concat_ranges(starts, counts)]
+
+        line_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        geom_offsets = row_offsets(rows)
+        return rows[geom_offsets[:-1]], ptids, [line_offsets, geom_offsets]
+
+    def _area_parts(self, rels, ways):
+        """
+        Rows, node ids and offsets of polygons of ways and multipolygons of relations,
+        offsets are start positions of rings in node ids, of the rings of each polygon
+        and of the polygons of each row
+
+        member ways of a relation are assembled in outer and inner rings,
+        inner rings are holes of the last outer ring, or dropped if a relation
+        has many outer and inner rings
+        """
+
+        refs, starts, counts, rows, roles = self._member_nodes(rels[rels[:, 4] == 3], ways)
+        inner = (roles == self._string_position("inner")).astype(np.int64)
+
+        groups = 2 * rows + inner
+        order = np.argsort(groups, kind="stable")
+        ptids, ring_offsets, groups = assemble_rings(
+            groups[order], starts[order], counts[order], refs
         )
-        cols = ["first", "role", "row"]
-        closer = closer.loc[closer["first"] != closer["last"]][cols]
-        closer = closer.rename(columns={"first": "ptid"})
-
-        res = pd.concat([df, closer.reset_index()])
-        return res
-
-    @staticmethod
-    def _drop_complex_rings(df):
-        """Remove inner rings if multiple inner and multiple outer rings"""
-
-        if "inner" not in df["role"]:
-            return df
-
-        dup = df.drop_duplicates("ring").groupby(["row", "role"]).size()
-        dup = dup.unstack("role")
-        dup = dup.loc[(dup.inner > 1) & (dup.outer > 1)]
-        return df.loc[(df.role == "outer") | (~df.row.isin(dup.index))].copy()
+        ring_rows, inner = groups // 2, groups % 2 == 1
+
+        uniq, inverse = np.unique(ring_rows, return_inverse=True)
+        n_inner = np.bincount(inverse, weights=inner, minlength=len(uniq))
+        n_outer = np.bincount(inverse, weights=~inner, minlength=len(uniq))
+        keep = ~inner | ((n_inner <= 1) | (n_outer <= 1))[inverse]
+        if not keep.all():
+            ring_counts = np.diff(ring_offsets)[keep]
+            ptids = ptids[concat_ranges(ring_offsets[:-1][keep], ring_counts)]
+            ring_offsets = np.concatenate([[0], np.cumsum(ring_counts)]).astype(np.int64)
+            ring_rows, inner = ring_rows[keep], inner[keep]
+
+        # a polygon starts on each outer ring and on the first ring of a row
+        first = np.ones(len(ring_rows), dtype=bool)
+        first[1:] = ring_rows[1:] != ring_rows[:-1]
+        polygon = ~inner | first
+        poly_offsets = np.append(np.flatnonzero(polygon), len(ring_rows)).astype(np.int64)
+
+        poly_rows = ring_rows[polygon]
+        geom_offsets = row_offsets(poly_rows)
+        return poly_rows[geom_offsets[:-1]], ptids, [ring_offsets, poly_offsets, geom_offsets]
 
     @staticmethod
-    def _position_ix(df, column):
-        """Create a position index, reset to 0 when column value changes"""
-        return df.groupby(column).cumcount()
+    def _member_nodes(rels, ways):
+        """
+        Node ids of the ways of rels rows with start, count, row and role of each way,
+        in the order of rows then members
+
+        node ids of ways are rels member ids, member ways of relations are found in ways,
+        missing member ways are skipped, roles of ways are -1
+        """
+
+        own = rels[rels[:, 2] == 0]
+        offsets = row_offsets(own[:, 0])
+        refs = [own[:, 1]]
+        starts, counts = [offsets[:-1]], [np.diff(offsets)]
+        rows, roles = [own[offsets[:-1], 0]], [np.full(len(offsets) - 1, -1, dtype=np.int64)]
+
+        members = rels[rels[:, 2] == 1]
+        if ways is not None and len(members) > 0 and len(ways) > 0:
+            way_offsets = row_offsets(ways[:, 0])
+            way_ids, first = np.unique(ways[way_offsets[:-1], 0], return_index=True)
+            pos = np.minimum(np.searchsorted(way_ids, members[:, 1]), len(way_ids) - 1)
+            found = way_ids[pos] == members[:, 1]
+            pos = first[pos[found]]
+
+            starts.append(way_offsets[:-1][pos] + len(own))
+            counts.append(np.diff(way_offsets)[pos])
+            rows.append(members[found, 0])
+            roles.append(members[found, 3])
+            refs.append(ways[:, 1])
+
+        rows = np.concatenate(rows).astype(np.int64)
+        order = np.argsort(rows, kind="stable")
+        return (
+            np.concatenate(refs).astype(np.int64),
+            np.concatenate(starts)[order].astype(np.int64),
+            np.concatenate(counts)[order].astype(np.int64),
+            rows[order],
+            np.concatenate(roles)[order].astype(np.int64),
+        )
 
-    @staticmethod
-    def _polygon_indices(df):
-        pix = df.index == 0
-        pix |= df["row"] != df["row"].shift(1)
-        pix |= (df["role"] == "outer") & (df["ring"] != df["ring"].shift(1))
-        return pix.astype(int).cumsum() - 1
+    def _string_position(self, string):
+        """Position of a string in strings, -1 if not found"""
+        try:
+            return self.strings.index(string)
+        except ValueError:
+            return -1
 
     # ---------------------------------
     # topology
 
-    def make_topo_geom(self, topo):
-        """Simplify relations as geometries, one row per topology segment"""
-        coords = self.coords(topo["ptid"])
-        res = linestrings(topo, 4326, coords, "ix")
+    def make_topo_geom(self, topo, ptids, ix):
+        """Add a linestring geometry column to a segment dataframe, one row per topology segment"""
+        geoms = sh.linestrings(self.coords(ptids), indices=ix)
+        res = topo.set_geometry(gpd.array.GeometryArray(geoms), crs=4326)
         return res[["row", "geometry", "source", "target"]]
 
     def relation_topology(self, df):
-        """Add topologoly to relations : segment ix index, source and target columns, duplicate end points"""
-
-        cols = ["role", "type", "geom"]
-        res = df.drop(columns=cols).rename(columns={"memid": "ptid"})
-        res = res.reset_index(drop=True)
-        res[["_s", "_t"]] = self.end_values(res, "row", "ptid")
+        """
+        Split relation ways in topology segments at nodes shared by many ways
 
-        # mask of nodes on multiple ways
-        dup = res.ptid.duplicated(keep=False)
+        Returns a segment dataframe with row, source and target columns,
+        node ids of all segments and their segment index
+        """
 
-        # mask of start and end node
-        st = (res["ptid"] == res["_s"]) & (res["row"] != res["row"].shift(1))
-        end = (res["ptid"] == res["_t"]) & (res["row"] != res["row"].shift(-1))
-        res["ix"] = st | (dup & (~end))
-        res["ix"] = res["ix"].astype(int)
+        rows = df["row"].to_numpy()
+        offsets = row_offsets(rows)
+        ptids, ix, _, ways, source, target = segments(df["memid"].to_numpy(), offsets)
 
-        # insert segment rows
-        dup_nodes = res.loc[dup & (~st) & (~end)].index.to_numpy()
-        arr = np.insert(arr=res.index.to_numpy(), obj=dup_nodes, values=dup_nodes)
-        res = res.reindex(arr).sort_index()
-        res.loc[res.index.duplicated(keep="last"), "ix"] = 0
-
-        res["ix"] = res["ix"].cumsum() - 1
+        res = pd.DataFrame(
+            {"row": rows[offsets[:-1]][ways], "source": source, "target": target}
+        )
+        return res, ptids, ix
 
-        # reset values of start and end node
-        res = res.drop(columns=["_s", "_t"]).reset_index(drop=True)
-        res[["source", "target"]] = self.end_values(res, "ix", "ptid")
 
-        return res
+def _concat_offsets(offsets):
+    """Concatenate offsets arrays, each shifted by the total of the previous ones"""
 
-    @staticmethod
-    def end_values(df, idcol, col):
-        grp = df.groupby(idcol).agg(_s=(col, "first"), _t=(col, "last"))
-        res = grp.loc[df[idcol]]
-        res.index = df.index
-        return res
\ No newline at end of file
+    shifts = np.cumsum([0] + [o[-1] for o in offsets])
+    res = [o[:-1] + shift for o, shift in zip(offsets, shifts)]
+    return np.concatenate(res + [shifts[-1:]]).astype(np.int64)
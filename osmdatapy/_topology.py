@@ -0,0 +1,197 @@
+import numpy as np
+
+
+def segments(refs, offsets, counts=None):
+    """
+    Split ways into topological segments at nodes used more than once
+
+    Parameters
+    ----------
+    refs : array of node ids of all ways, way after way
+    offsets : array of way start positions in refs, last value is len(refs),
+              ways may have no node
+    counts : optional array of node usage count for each value in refs,
+             computed from refs if None
+
+    Returns
+    -------
+    ptids : node ids of segments, split nodes are repeated as last and first node
+    ix : segment index of each node in ptids, to use as shapely.linestrings indices
+    seg_offsets : segment start positions in ptids, last value is len(ptids)
+    ways : way position of each segment
+    source, target : first and last node id of each segment
+    """
+
+    refs = np.asarray(refs)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    length = len(refs)
+
+    if counts is None:
+        counts = node_counts(refs)
+
+    # way start and end masks, ways without nodes have no start and end
+    full = offsets[1:] > offsets[:-1]
+    start = np.zeros(length, dtype=bool)
+    start[offsets[:-1][full]] = True
+    end = np.zeros(length, dtype=bool)
+    end[offsets[1:][full] - 1] = True
+
+    # inner nodes shared with another way or used twice in the same way are split
+    split = (counts > 1) & ~start & ~end
+    repeat = split.astype(np.int64) + 1
+    ptids = np.repeat(refs, repeat)
+
+    # a segment starts on a way start and on the second copy of a split node
+    first = np.cumsum(repeat) - repeat
+    new_seg = np.zeros(len(ptids), dtype=bool)
+    new_seg[first[start]] = True
+    new_seg[first[split] + 1] = True
+
+    ix = np.cumsum(new_seg) - 1
+    seg_offsets = np.append(np.flatnonzero(new_seg), len(ptids))
+
+    way_pos = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    ways = np.repeat(way_pos, repeat)[seg_offsets[:-1]]
+
+    source = ptids[seg_offsets[:-1]]
+    target = ptids[seg_offsets[1:] - 1]
+
+    return ptids, ix, seg_offsets, ways, source, target
+
+
+def node_counts(refs):
+    """Number of uses of each node in refs, aligned on refs"""
+
+    _, inverse, counts = np.unique(refs, return_inverse=True, return_counts=True)
+    return counts[inverse]
+
+
+def row_offsets(rows):
+    """Start positions of runs of identical values in a sorted rows array, last value is len(rows)"""
+
+    rows = np.asarray(rows)
+    if len(rows) == 0:
+        return np.array([0], dtype=np.int64)
+    change = np.flatnonzero(rows[1:] != rows[:-1]) + 1
+    return np.concatenate([[0], change, [len(rows)]]).astype(np.int64)
+
+
+def concat_ranges(starts, counts):
+    """Concatenated ranges of counts positions from starts"""
+    total = int(counts.sum())
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return np.arange(total, dtype=np.int64) + shift
+
+
+def assemble_rings(groups, starts, counts, refs):
+    """
+    Chain ways of groups into closed rings, ways sharing an end node follow each other,
+    reversed if needed, ways of a group that do not close are closed by their first node
+
+    Parameters
+    ----------
+    groups : sorted group of each way, e.g. relation and role, rings do not cross groups
+    starts, counts : start position and number of nodes of each way in refs
+    refs : array of node ids
+
+    Returns
+    -------
+    ptids : node ids of rings, ring after ring, rings have at least 4 nodes
+    ring_offsets : ring start positions in ptids, last value is len(ptids)
+    ring_groups : group of each ring, rings of a group are ordered by their first way
+    """
+
+    groups = np.asarray(groups, dtype=np.int64)
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+    n = 2 * len(groups)
+
+    # way ends 2w (first node) and 2w + 1 (last node), ends on the same node are paired
+    end_nodes = np.empty(n, dtype=np.int64)
+    end_nodes[0::2] = refs[starts]
+    end_nodes[1::2] = refs[starts + counts - 1]
+    end_groups = np.repeat(groups, 2)
+    order = np.lexsort((np.arange(n), end_nodes, end_groups))
+
+    end_groups, end_nodes = end_groups[order], end_nodes[order]
+    same = (end_groups[1:] == end_groups[:-1]) & (end_nodes[1:] == end_nodes[:-1])
+    run_start = np.concatenate([[0], np.flatnonzero(~same) + 1])
+    rank = np.arange(n) - np.repeat(run_start, np.diff(np.append(run_start, n)))
+    first = np.flatnonzero((rank[:-1] % 2 == 0) & same)
+
+    link = np.full(n, -1, dtype=np.int64)
+    link[order[first]] = order[first + 1]
+    link[order[first + 1]] = order[first]
+
+    # state 2w + d is way w entered by end d, next state is entered by the end paired with its exit
+    nxt = link[np.arange(n) ^ 1]
+    prv = np.arange(n)
+    prv[nxt[nxt >= 0]] = np.flatnonzero(nxt >= 0)
+
+    # each chain is found in both directions, keep the direction of the first way of the chain
+    smallest = _chain_min(prv, np.where(nxt >= 0, nxt, np.arange(n)))
+    keep = smallest % 2 == 0
+
+    # closed chains start at their first way
+    head, _ = _chain_rank(prv)
+    ring = keep & (prv[head] != head) & (smallest == np.arange(n))
+    prv[ring] = np.flatnonzero(ring)
+    head, pos = _chain_rank(prv)
+
+    states = np.flatnonzero(keep)
+    states = states[np.lexsort((pos[states], smallest[states]))]
+    ways, reverse, pos = states // 2, states % 2 == 1, pos[states]
+
+    # nodes of ways, shared end nodes are kept once
+    skip = (pos > 0).astype(np.int64)
+    node_counts = counts[ways] - skip
+    local = concat_ranges(skip, node_counts)
+    way_pos = np.repeat(np.arange(len(ways)), node_counts)
+    ptids = refs[
+        np.where(
+            reverse[way_pos],
+            starts[ways][way_pos] + counts[ways][way_pos] - 1 - local,
+            starts[ways][way_pos] + local,
+        )
+    ]
+
+    new_ring = np.flatnonzero(pos == 0)
+    ring_counts = np.add.reduceat(node_counts, new_ring) if len(new_ring) > 0 else new_ring
+    ring_offsets = np.concatenate([[0], np.cumsum(ring_counts)]).astype(np.int64)
+    ring_groups = groups[ways[new_ring]]
+
+    # close rings
+    open_ring = ptids[ring_offsets[:-1]] != ptids[ring_offsets[1:] - 1]
+    ptids = np.insert(ptids, ring_offsets[1:][open_ring], ptids[ring_offsets[:-1]][open_ring])
+    ring_counts = ring_counts + open_ring
+
+    valid = ring_counts >= 4
+    ptids = ptids[concat_ranges(np.cumsum(ring_counts) - ring_counts, ring_counts * valid)]
+    ring_offsets = np.concatenate([[0], np.cumsum(ring_counts[valid])]).astype(np.int64)
+
+    return ptids, ring_offsets, ring_groups[valid]
+
+
+def _chain_min(prv, nxt):
+    """Smallest position in the chain of each position, prv and nxt are fixed at chain ends"""
+
+    smallest = np.arange(len(prv))
+    for _ in range(_jumps(len(prv))):
+        smallest = np.minimum(smallest, np.minimum(smallest[prv], smallest[nxt]))
+        prv, nxt = prv[prv], nxt[nxt]
+    return smallest
+
+
+def _chain_rank(prv):
+    """First position of the chain of each position and distance to it, by pointer jumping"""
+
+    head = prv.copy()
+    dist = (head != np.arange(len(prv))).astype(np.int64)
+    for _ in range(_jumps(len(prv))):
+        dist = dist + dist[head]
+        head = head[head]
+    return head, dist
+
+
+def _jumps(length):
+    return max(1, int(np.ceil(np.log2(max(length, 1)))) + 1)
@@ -1,7 +1,7 @@
-import zlib
 import numpy as np
 
-from .primitives import node, way, relation
+from .headers import decompress
+from .primitives import node, way, relation, way_geotypes
 from .dense import dense
 
 
@@ -14,61 +14,71 @@ def parse_block(data, strmap, query, compression="zlib"):
     data : a data buffer
     stringmap : map from local to global string integer, cached in OSM object
     query : a query dictionnary made from query object for this block
-    compression : None or compression type string, "zlib" is the only format supported
+    compression : None for decompressed data or compression type string, "zlib" is the only format supported
     """
 
-    if compression == "zlib":
-        bl = zlib.decompress(data)
-    else:
-        raise NotImplementedError("Compression {0} not implemented".format(compression))
+    bl = decompress(data, compression)
 
     res = []
-    geom = query['geometry']
 
     i = query["node_offsets"]
     pack_nodes(res, [node(bl[p : p + l], l, query) for eid, p, l in i], strmap)
     i = query["way_offsets"]
-    pack_ways(res, [way(bl[p : p + l], l, query) for eid, p, l in i], strmap, geom)
+    pack_ways(res, [way(bl[p : p + l], l, query) for eid, p, l in i], strmap, query)
     i = query["rel_offsets"]
     pack_rels(res, [relation(bl[p : p + l], l, query) for eid, p, l in i], strmap)
     pack_dense(res, dense, query, bl, strmap)
 
+    if query["metadata"]:
+        _scale_timestamps(res, query["date_granularity"])
+
     return res
 
 
+def _scale_timestamps(res, date_granularity):
+    """convert timestamps in ids results from date granularity units to seconds"""
+
+    if date_granularity == 1000:
+        return None
+    for ids, _, _ in res:
+        ids[:, 3] = ids[:, 3] * date_granularity // 1000
+
+
 def pack_nodes(res, nodes, strmap):
     """Merge list of nodes in a result tuple"""
 
-    if nodes is None or not nodes or len(nodes)==0:
+    if _is_empty_list(nodes):
         return None
-    ids, meta, tags, vals = zip(*[x for x in nodes if x])
-    id_length= len(ids)
+    ids, meta, tags, vals = zip(*[x for x in nodes if x is not None])
+    id_length = len(ids)
 
     ids = pack_ids(0, ids, meta)
-    relids = np.repeat(range(id_length), 0)
-    z = np.zeros(id_length, dtype="int")
-    relres = np.array([relids, z, z, z, z])
 
-    res.append((ids, pack_tags(tags, vals, strmap, id_length), relres))
+    res.append((ids, pack_tags(tags, vals, strmap, id_length), None))
 
 
-def pack_ways(res, ways, strmap, geometry):
+def pack_ways(res, ways, strmap, query):
     """Merge list of ways in a result tuple"""
 
     if _is_empty_list(ways):
         return None
 
-    ids, meta, tags, vals, mems, geoms = zip(*[x for x in ways if x is not None])
+    ids, meta, tags, vals, mems, area_tags = zip(*[x for x in ways if x is not None])
 
     id_length = len(ids)
 
     ids = pack_ids(1, ids, meta)
     
-    if geometry:
+    if query["geometry"]:
         relids = _local_ids(id_length, mems)
+        refs = np.hstack(mems)
+        offsets = np.zeros(id_length + 1, dtype="int64")
+        offsets[1:] = np.cumsum([len(x) for x in mems])
+        geoms = way_geotypes(query, refs, offsets, *_pack_area_tags(area_tags))
+
         z = np.zeros(len(relids), dtype="int")
-        g = np.repeat(geoms, [len(x) for x in mems])
-        relres = np.array([relids, np.hstack(mems), z, z, g]).T
+        g = np.repeat(geoms, np.diff(offsets))
+        relres = np.array([relids, refs, z, z, g]).T
     else:
         relres = None
 
@@ -78,9 +88,9 @@ def pack_ways(res, ways, strmap, geometry):
 def pack_rels(res, rels, strmap):
     """Merge list of ways in a result tuple"""
 
-    if rels is None or not rels or len(rels)==0:
+    if _is_empty_list(rels):
         return None
-    ids, meta, tags, vals, mems, types, roles, geoms = zip(*[x for x in rels if x])
+    ids, meta, tags, vals, mems, types, roles, geoms = zip(*[x for x in rels if x is not None])
     id_length = len(ids)
 
     ids = pack_ids(2, ids, meta)
@@ -93,16 +103,30 @@ def pack_rels(res, rels, strmap):
 
 
 def pack_dense(res, dense, query, block, strmap):
-    if query["dense_offsets"] is None:
+    """Parse dense nodes groups, add results to res"""
+
+    if not query["dense_offsets"]:
         return None
 
-    offset, id_length = query["dense_offsets"]
-    ids, tags, rels = dense(query, block[offset : offset + id_length], id_length)
+    for offset, length in query["dense_offsets"]:
+        group = dense(query, block[offset : offset + length], length)
+        if group is None:
+            continue
+
+        ids, tags, rels = group
+        tags[:, 1] = strmap[tags[:, 1]]
+        tags[:, 2] = strmap[tags[:, 2]]
+
+        res.append((ids, tags, rels))
+
 
-    tags[:, 1] = strmap[tags[:, 1]]
-    tags[:, 2] = strmap[tags[:, 2]]
+def _pack_area_tags(area_tags):
+    """Way positions, tags and values arrays of all tags of ways, before tags filter of query"""
 
-    res.append((ids, tags, rels))
+    tags = [np.asarray(t if t is not None else [], dtype="int64") for t, _ in area_tags]
+    vals = [np.asarray(v if v is not None else [], dtype="int64") for _, v in area_tags]
+    tagids = _local_ids(len(tags), tags)
+    return tagids, np.concatenate(tags), np.concatenate(vals)
 
 
 def _local_ids(id_length, array):
@@ -113,12 +137,13 @@ def pack_tags(tags, vals, strmap, id_length):
     if tags is None:
         return None
 
-    t = [x for x in tags if x is not None]
-    if not t:
+    # objects without tags keep an empty array, so that tag ids are object positions
+    t = [np.asarray(x if x is not None else [], dtype="int64") for x in tags]
+    if not any(len(x) for x in t):
         return None
-    v = [x for x in vals if x is not None]
+    v = [np.asarray(x if x is not None else [], dtype="int64") for x in vals]
     tagids = _local_ids(id_length, t)
-    return np.column_stack([tagids, strmap[np.hstack(t)], strmap[np.hstack(v)]])
+    return np.column_stack([tagids, strmap[np.concatenate(t)], strmap[np.concatenate(v)]])
 
 
 def pack_ids(osmtype, ids, meta):
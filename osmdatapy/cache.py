@@ -0,0 +1,166 @@
+import os
+import json
+import hashlib
+import tempfile
+from importlib import metadata
+
+import pandas as pd
+
+
+def _version():
+    """Installed osmdatapy version, a hash of the package sources when running from a source tree"""
+    try:
+        return metadata.version("osmdatapy")
+    except metadata.PackageNotFoundError:
+        return _source_hash()
+
+
+def _source_hash():
+    """Hash of the python and cython source files of the package"""
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(root)):
+        if name.endswith((".py", ".pyx")):
+            digest.update(name.encode())
+            with open(os.path.join(root, name), "rb") as f:
+                digest.update(f.read())
+    return "source-" + digest.hexdigest()
+
+
+VERSION = _version()
+
+
+class ResultCache:
+    """
+    On disk cache of query results stored as parquet files, requires pyarrow
+
+    results are keyed by a fingerprint of the query, of the pbf file identity
+    and of the osmdatapy version, or of its sources in a source tree,
+    so that results of a previous version are not reused,
+    least recently used results are evicted when the cache exceeds max_size
+
+    Parameters
+    ----------
+    path : cache directory, created if it does not exist
+    max_size : maximum size of cached results in bytes
+    """
+
+    def __init__(self, path, max_size=1024 * 1024 * 1024):
+        self.path = path
+        self.max_size = max_size
+        os.makedirs(path, exist_ok=True)
+
+    def key(self, query, identity):
+        """Fingerprint of a Query, a file identity and the library version"""
+
+        content = {
+            "query": _normalize(query.as_dict()),
+            "file": _normalize(identity),
+            "version": VERSION,
+        }
+        content = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key):
+        """Return a cached DataFrame or GeoDataFrame, None if key is not in cache"""
+
+        for geo, filepath in self._filepaths(key):
+            if not os.path.exists(filepath):
+                continue
+            # results may be evicted by another process
+            try:
+                os.utime(filepath)
+                if geo:
+                    import geopandas as gpd
+
+                    return _restore_types(gpd.read_parquet(filepath))
+                return _restore_types(pd.read_parquet(filepath))
+            except FileNotFoundError:
+                continue
+        return None
+
+    def put(self, key, df):
+        """Store a DataFrame or GeoDataFrame in cache, evict old results if cache is full"""
+
+        geo = hasattr(df, "geometry") and "geometry" in df.columns
+        filepath = dict(self._filepaths(key))[geo]
+
+        # write in a unique temporary file so that readers never see partial results,
+        # and concurrent writers of the same key do not write the same file
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def clear(self):
+        """Remove all cached results"""
+        for filepath in self._files():
+            os.remove(filepath)
+
+    def size(self):
+        """Size of cached results in bytes"""
+        return sum(os.path.getsize(f) for f in self._files())
+
+    def _filepaths(self, key):
+        return [
+            (False, os.path.join(self.path, key + ".parquet")),
+            (True, os.path.join(self.path, key + ".geo.parquet")),
+        ]
+
+    def _files(self):
+        return [
+            os.path.join(self.path, f)
+            for f in os.listdir(self.path)
+            if f.endswith(".parquet")
+        ]
+
+    def _evict(self):
+        """Remove least recently used results until cache size is under max_size"""
+
+        # files may be removed by another process at any time
+        files = []
+        for filepath in self._files():
+            try:
+                files.append((os.stat(filepath), filepath))
+            except FileNotFoundError:
+                pass
+        files = sorted(files, key=lambda x: x[0].st_mtime_ns)
+        size = sum(st.st_size for st, _ in files)
+
+        for st, filepath in files:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                pass
+            size -= st.st_size
+
+
+def _restore_types(df):
+    """parquet stores timestamps in milliseconds, restore timestamps in seconds"""
+    cols = df.select_dtypes("datetime64").columns
+    return df.astype({c: "datetime64[s]" for c in cols})
+
+
+def file_identity(filepath):
+    """Identity of a file from its absolute path, size and modification time"""
+    st = os.stat(filepath)
+    return [os.path.abspath(filepath), st.st_size, st.st_mtime_ns]
+
+
+def _normalize(value):
+    """Convert sets and lists to sorted lists to get stable fingerprints"""
+
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, set, tuple)):
+        return sorted([_normalize(v) for v in value], key=str)
+    return value
@@ -0,0 +1,298 @@
+# OsmChange (.osc) parser and overlay of changed osm objects
+
+import gzip
+from array import array
+from datetime import datetime
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from .block import pack_nodes, pack_ways, pack_rels
+from .primitives import _validate_tag, _validate_time, _validate_tagval, _filter_tags
+from .primitives import _rel_geotype
+
+OSM_TYPES = {"node": 0, "way": 1, "relation": 2}
+ACTIONS = ["create", "modify", "delete"]
+
+
+class Changes:
+    """
+    Overlay of created, modified and deleted osm objects applied over a pbf file
+
+    Attributes
+    ----------
+    elements : dictionary of osm type (0 node, 1 way, 2 relation) to a dictionary of
+               osm id to element tuple, for created and modified objects
+    deleted : dictionary of osm type to a set of deleted osm ids
+    coords : dictionary of node id to integer longitude and latitude in nanodegrees,
+             for created and modified nodes
+    files : list of applied files
+    """
+
+    def __init__(self):
+        self.elements = {t: {} for t in OSM_TYPES.values()}
+        self.deleted = {t: set() for t in OSM_TYPES.values()}
+        self.coords = {}
+        self.files = []
+
+    def __len__(self):
+        return sum(len(x) for x in self.elements.values()) + sum(
+            len(x) for x in self.deleted.values()
+        )
+
+    def superseded(self, osmtype):
+        """Sorted array of osm ids of a type replaced or deleted by changes"""
+        ids = set(self.elements[osmtype]).union(self.deleted[osmtype])
+        return np.sort(np.fromiter(ids, dtype=np.int64, count=len(ids)))
+
+    def read(self, filepath, strings):
+        """
+        Stream an OsmChange file, add changes to the overlay
+
+        strings is the list of global strings, extended with new tags, values and roles.
+        Returns node changes as arrays of deleted ids, changed ids and changed coordinates
+        """
+
+        mapper = dict(zip(strings, range(len(strings))))
+
+        def pos(s):
+            if s not in mapper:
+                mapper[s] = len(strings)
+                strings.append(s)
+            return mapper[s]
+
+        deleted, changed = [], {}
+        action = None
+
+        opener = gzip.open if filepath.endswith(".gz") else open
+        with opener(filepath, "rb") as f:
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+
+                if elem.tag in ACTIONS:
+                    action = elem.tag if event == "start" else None
+                    if event == "end":
+                        elem.clear()
+                    continue
+
+                if event != "end" or elem.tag not in OSM_TYPES or action is None:
+                    continue
+
+                osmtype = OSM_TYPES[elem.tag]
+                elemid = int(elem.get("id"))
+
+                if action == "delete":
+                    self.elements[osmtype].pop(elemid, None)
+                    self.deleted[osmtype].add(elemid)
+                    if osmtype == 0:
+                        deleted.append(elemid)
+                        changed.pop(elemid, None)
+                        self.coords.pop(elemid, None)
+                else:
+                    self.deleted[osmtype].discard(elemid)
+                    self.elements[osmtype][elemid] = _element(elem, osmtype, pos)
+                    if osmtype == 0:
+                        changed[elemid] = _nanodegrees(elem.get("lon"), elem.get("lat"))
+                        self.coords[elemid] = changed[elemid]
+
+                elem.clear()
+
+        self.files.append(filepath)
+
+        ids = np.fromiter(changed.keys(), dtype=np.int64, count=len(changed))
+        coords = np.array(list(changed.values()), dtype=np.int64).reshape((-1, 2)) / 1e9
+        return np.array(deleted, dtype=np.int64), ids, coords.astype(np.float32)
+
+    def node_coords(self, ids):
+        """Integer coordinates in nanodegrees of changed nodes in ids rows, 0 for other rows"""
+
+        coords = np.zeros((len(ids), 2), dtype=np.int64)
+        for i in np.flatnonzero(ids[:, 1] == 0):
+            coords[i] = self.coords[ids[i, 0]]
+        return coords
+
+    def block(self):
+        """Return a pseudo block metadata dictionary of changes, to build block queries"""
+
+        used, times = set(), []
+        for elements in self.elements.values():
+            for e in elements.values():
+                times.append(e[1][1])
+                used.update(e[2])
+                used.update(e[3])
+                if len(e) > 6:
+                    used.update(e[6])
+
+        offsets = [
+            [(k, 0, 0) for k in self.elements[t].keys()] for t in OSM_TYPES.values()
+        ]
+
+        return {
+            "stringtable": np.array(sorted(used), dtype=np.int64),
+            "date_granularity": 1000,
+            "time_range": (min(times), max(times)) if times else None,
+            "dense_offsets": [],
+            "node_offsets": offsets[0],
+            "way_offsets": offsets[1],
+            "rel_offsets": offsets[2],
+        }
+
+    def results(self, query, block):
+        """List of result tuples of changed objects matching a block query dictionary"""
+
+        res = []
+        strmap = block["stringtable"]
+
+        def local(element):
+            return _local_strings(element, strmap)
+
+        nodes = [self.elements[0][k] for k, _, _ in query["node_offsets"]]
+        ways = [self.elements[1][k] for k, _, _ in query["way_offsets"]]
+        rels = [self.elements[2][k] for k, _, _ in query["rel_offsets"]]
+
+        pack_nodes(res, [node(local(e), query) for e in nodes], strmap)
+        pack_ways(res, [way(local(e), query) for e in ways], strmap, query)
+        pack_rels(res, [relation(local(e), query) for e in rels], strmap)
+
+        return res
+
+
+def current_rows(ids, superseded):
+    """Boolean mask of ids rows not replaced or deleted, superseded are sorted ids of each osm type"""
+
+    keep = np.full(len(ids), True)
+    for osmtype, s in enumerate(superseded):
+        if len(s) > 0:
+            keep &= ~((ids[:, 1] == osmtype) & np.isin(ids[:, 0], s))
+    return keep
+
+
+def drop_rows(ids, tags, rels, keep):
+    """Filter a result tuple on a boolean mask of ids rows, renumber tags and rels positions"""
+
+    pos = np.cumsum(keep) - 1
+
+    if tags is not None:
+        tags = tags[keep[tags[:, 0]]]
+        tags[:, 0] = pos[tags[:, 0]]
+    if rels is not None:
+        rels = rels[keep[rels[:, 0]]]
+        rels[:, 0] = pos[rels[:, 0]]
+
+    return ids[keep], tags, rels
+
+
+def _element(elem, osmtype, pos):
+    """Convert an xml osm object to a tuple of id, metadata, tags, values and members"""
+
+    meta = [
+        int(elem.get("version", -1)),
+        _timestamp(elem.get("timestamp")),
+        int(elem.get("changeset", 0)),
+    ]
+    tags = array("q", [pos(t.get("k")) for t in elem.iter("tag")])
+    vals = array("q", [pos(t.get("v")) for t in elem.iter("tag")])
+    elemid = int(elem.get("id"))
+
+    if osmtype == 0:
+        return elemid, meta, tags, vals
+
+    if osmtype == 1:
+        return elemid, meta, tags, vals, array("q", [int(n.get("ref")) for n in elem.iter("nd")])
+
+    members = list(elem.iter("member"))
+    mems = array("q", [int(m.get("ref")) for m in members])
+    types = array("q", [OSM_TYPES[m.get("type")] for m in members])
+    roles = array("q", [pos(m.get("role", "")) for m in members])
+    return elemid, meta, tags, vals, mems, types, roles
+
+
+def _nanodegrees(lon, lat):
+    return int(round(float(lon) * 1e9)), int(round(float(lat) * 1e9))
+
+
+def _timestamp(value):
+    if value is None:
+        return 0
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+
+def _local_strings(element, strmap):
+    """Map global string positions of an element to positions in strmap"""
+
+    res = list(element)
+    res[2] = array("q", np.searchsorted(strmap, element[2]))
+    res[3] = array("q", np.searchsorted(strmap, element[3]))
+    if len(res) > 6:
+        res[6] = array("q", np.searchsorted(strmap, element[6]))
+    return res
+
+
+# -------------------------------------------------------------
+# changed objects filters, same results as primitives parsers
+
+
+def _tags(query, tags, vals):
+    """Return tags, tag set and values as parsed from a pbf object"""
+
+    if not query["get_tags"] or not tags:
+        return None, None, None
+    return tags, set(tags), vals
+
+
+def node(element, query):
+    elemid, meta, tags, vals = element
+    tags, tag_set, vals = _tags(query, tags, vals)
+
+    if query["get_tags"] and not _validate_tag(tag_set, query["must_tags"]):
+        return None
+    if not _validate_time(query, meta[1]):
+        return None
+    if not _validate_tagval(query, tag_set, tags, vals):
+        return None
+
+    meta = meta if query["metadata"] else None
+    tags, vals = _filter_tags(tags, vals, query["tags"])
+
+    return elemid, meta, tags, vals
+
+
+def way(element, query):
+    elemid, meta, tags, vals, mems = element
+    tags, tag_set, vals = _tags(query, tags, vals)
+
+    if query["get_tags"] and not _validate_tag(tag_set, query["must_tags"]):
+        return None
+    if not _validate_time(query, meta[1]):
+        return None
+    if query["geometry"] and len(mems) < 2:
+        return None
+    if not _validate_tagval(query, tag_set, tags, vals):
+        return None
+
+    mems = mems if query["geometry"] else None
+    meta = meta if query["metadata"] else None
+    area_tags = (tags, vals)
+    tags, vals = _filter_tags(tags, vals, query["tags"])
+
+    return elemid, meta, tags, vals, np.asarray(mems), area_tags
+
+
+def relation(element, query):
+    elemid, meta, tags, vals, mems, types, roles = element
+    tags, tag_set, vals = _tags(query, tags, vals)
+
+    if query["get_tags"] and not _validate_tag(tag_set, query["must_tags"]):
+        return None
+    if not _validate_time(query, meta[1]):
+        return None
+    if not _validate_tag(set(types), query["relation_type"]):
+        return None
+    if not _validate_tagval(query, tag_set, tags, vals):
+        return None
+
+    geom = _rel_geotype(query, vals, types)
+
+    meta = meta if query["metadata"] else None
+    tags, vals = _filter_tags(tags, vals, query["tags"])
+
+    return elemid, meta, tags, vals, np.asarray(mems), np.asarray(types), np.asarray(roles), geom
@@ -0,0 +1,187 @@
+import numpy as np
+
+from .osmdata import OSM
+from .osmquery import Query
+from .cache import ResultCache, file_identity
+from .changes import drop_rows
+from .stats import Stats
+
+
+class OSMCollection(OSM):
+    """
+    Several pbf files queried as a single OSM object, e.g. adjacent extracts
+
+    node caches, strings and block indexes of all files are merged, objects found in
+    many files (e.g. on borders of extracts) are returned and extracted once, with their
+    highest version, versions are always parsed for this purpose
+
+    partitions of to_dask are deduplicated separately, objects found in many files
+    may be repeated in partitions of different files, shards are not supported,
+    use shards of each file
+
+    Parameters
+    ----------
+    filepaths : list of paths to pbf files
+    cache : optional ResultCache or directory path, see OSM
+    stats : optional Stats object or True, see OSM
+    progress : optional function, called during the opening of each file as in OSM
+    cancel : optional CancelToken, see OSM
+
+    Attributes
+    ----------
+    filepaths : list of paths to pbf files
+    """
+
+    def __init__(self, filepaths, cache=None, stats=None, progress=None, cancel=None):
+
+        if isinstance(filepaths, str) or len(filepaths) == 0:
+            raise ValueError("'filepaths' should be a non-empty list of pbf files")
+
+        self.stats = Stats() if stats is True else stats
+        stats = self._stats()
+        stats.start("open")
+
+        try:
+            files = [
+                OSM(fp, stats=self.stats, progress=progress, cancel=cancel) for fp in filepaths
+            ]
+            self.filepaths = [f.filepath for f in files]
+            self.filepath = self.filepaths[0]
+
+            self.features = list(dict.fromkeys(x for f in files for x in f.features))
+            # merged blocks are not sorted across files
+            self.optional_features = [
+                x
+                for x in files[0].optional_features
+                if all(x in f.optional_features for f in files) and not x.startswith("Sort.")
+            ]
+
+            with stats.stage("string_cache"):
+                self._merge_strings(files)
+            with stats.stage("geometry_cache"):
+                self._merge_geometry(files)
+            self._context_blocks = []
+            self._way_refs = None
+            self._members = None
+            self._changes = None
+            self._set_id_index()
+
+            if isinstance(cache, str):
+                cache = ResultCache(cache)
+            self.cache = cache
+
+        finally:
+            stats.finish()
+
+    def _merge_strings(self, files):
+        """Merge strings of files, renumber block stringtables and set the file of each block"""
+
+        self.strings = list(dict.fromkeys(s for f in files for s in f.strings))
+        mapper = self._string_to_pos(self.strings)
+
+        self._blocks = []
+        for f in files:
+            remap = np.array([mapper[s] for s in f.strings], dtype=np.int64)
+            for bl in f._blocks:
+                bl = dict(bl)
+                bl["stringtable"] = remap[np.asarray(bl["stringtable"], dtype=np.int64)]
+                bl["filepath"] = f.filepath
+                self._blocks.append(bl)
+
+    def _merge_geometry(self, files):
+        """Merge node caches of files, keep the coordinates of the highest version of shared nodes"""
+
+        index = np.concatenate([f._geo_index for f in files])
+        coords = np.concatenate([f._geo_coords for f in files])
+        versions = np.zeros(len(index), dtype=np.int64)
+
+        # versions of nodes found in many files, parsed from their blocks only
+        uniq, counts = np.unique(index, return_counts=True)
+        shared = uniq[counts > 1].astype(np.int64)
+        if len(shared) > 0:
+            query = Query(nodes=True, node_ids=shared, tags=False, metadata=True, keep_first=False)
+            start = 0
+            for f in files:
+                ids, _, _ = f._process_queries(query, {})
+                if ids is not None:
+                    pos = np.searchsorted(f._geo_index, ids[:, 0].astype("uint64"))
+                    versions[start + pos] = ids[:, 2]
+                start += len(f._geo_index)
+
+        order = np.lexsort((-versions, index))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = index[order][1:] != index[order][:-1]
+        self._geo_index = index[order][first]
+        self._geo_coords = coords[order][first]
+
+    def _identity(self):
+        """Identity of files and applied changes files"""
+        identity = [file_identity(f) for f in self.filepaths]
+        if self._changes is not None:
+            identity.extend([file_identity(f) for f in self._changes.files])
+        return identity
+
+    def _process_queries(self, query, strmap, progress=None, cancel=None, blocks=None, changes=True):
+        """Results of OSM._process_queries, versions are parsed to keep the highest version"""
+
+        q = query.copy()
+        q.metadata = True
+        ids, tags, rels = super()._process_queries(q, strmap, progress, cancel, blocks, changes)
+        if ids is not None and not query.metadata:
+            ids = ids[:, :2]
+        return ids, tags, rels
+
+    def _extract_rows(self, files, selected):
+        """
+        List of boolean masks of written rows of each selected block, objects found in many files
+        are written from the block of their highest version, blocks are parsed a first time
+        to find these blocks
+        """
+
+        keys = []
+        for i, (bl, block_queries) in enumerate(selected):
+            _, ids, _, _ = self._parse_extract_block(files[bl], bl, block_queries)
+            if ids is not None:
+                keys.append(np.column_stack([ids[:, :3], np.full(len(ids), i), np.arange(len(ids))]))
+
+        keep = [None] * len(selected)
+        if not keys:
+            return keep
+
+        keys = np.concatenate(keys)
+        order = np.lexsort((keys[:, 4], keys[:, 3], -keys[:, 2], keys[:, 0], keys[:, 1]))
+        sorted_ids = keys[order, :2]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (sorted_ids[1:] != sorted_ids[:-1]).any(axis=1)
+        written = np.zeros(len(keys), dtype=bool)
+        written[order[first]] = True
+
+        blocks, starts = np.unique(keys[:, 3], return_index=True)
+        for i, rows in zip(blocks, np.split(written, starts[1:])):
+            keep[i] = rows
+        return keep
+
+    @staticmethod
+    def _merge_results(res):
+        """Merge list of results, keep one row of objects found in many files"""
+
+        ids, tags, rels = OSM._merge_results(res)
+        if ids is None:
+            return ids, tags, rels
+        return _drop_shared(ids, tags, rels)
+
+
+def _drop_shared(ids, tags, rels):
+    """Keep the row of the highest version of each osm object, the first row of equal versions"""
+
+    order = np.lexsort((np.arange(len(ids)), -ids[:, 2], ids[:, 0], ids[:, 1]))
+
+    sorted_ids = ids[order, :2]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (sorted_ids[1:] != sorted_ids[:-1]).any(axis=1)
+    if first.all():
+        return ids, tags, rels
+
+    keep = np.full(len(ids), False)
+    keep[order[first]] = True
+    return drop_rows(ids, tags, rels, keep)
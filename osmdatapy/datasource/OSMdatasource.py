@@ -1,3 +1,5 @@
+import os
+
 import pandas as pd
 from . import datasource
 
@@ -10,9 +12,17 @@ class OSM_datasource(datasource.Datasource):
     a Datasource to get osm pbf files from names, extracted from GeoFabrik or BBBike
 
     see www.geofabrik.de and www.bbbike.org
+
+    the catalog of places is loaded on first use and cached on disk,
+    a cached catalog older than max_age is revalidated with the servers
+
+    Args :
+        cache_dir : directory of the cached catalog, default to ~/.cache/osmdatapy
+        offline : if True, only use the cached catalog
+        max_age : seconds during which the cached catalog is used without revalidation
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir=None, offline=False, max_age=datasource.CATALOG_MAX_AGE):
         super().__init__(
             content="Openstreetmap data in pbf format, https://wiki.openstreetmap.org/wiki/PBF_Format",
             license="https://www.openstreetmap.org/copyright/en",
@@ -21,20 +31,37 @@ class OSM_datasource(datasource.Datasource):
             file_ext=".osm.pbf"
         )
 
-        geofabrick_urls = self._parse_geofabrik()
-        bbbike_urls = self._parse_bbbike()
+        self.cache_dir = cache_dir or datasource.default_cache_dir()
+        self.offline = offline
+        self.max_age = max_age
+        self._catalog = None
 
-        # add content from bbbike if not in geofabrick
-        for k, v in bbbike_urls.items():
-            if k not in geofabrick_urls:
-                geofabrick_urls[k] = v
+        return None
 
-        self._urls = geofabrick_urls
+    @property
+    def _urls(self):
+        """dictionary of place name : [urls], loaded on first use"""
 
-        return None
+        if self._catalog is None:
+            geofabrick_urls = self._parse_geofabrik()
+            bbbike_urls = self._parse_bbbike()
+
+            # add content from bbbike if not in geofabrick
+            for k, v in bbbike_urls.items():
+                if k not in geofabrick_urls:
+                    geofabrick_urls[k] = v
+
+            self._catalog = geofabrick_urls
+
+        return self._catalog
+
+    def _cached(self, url, filename):
+        filepath = os.path.join(self.cache_dir, filename)
+        return datasource.cached_file(url, filepath, self.offline, self.max_age)
 
     def _parse_geofabrik(self):
-        json = pd.json_normalize(pd.read_json(GEOFABRICK)["features"])
+        source = self._cached(GEOFABRICK, "geofabrik-index.json")
+        json = pd.json_normalize(pd.read_json(source)["features"])
         json = json[["properties.name", "properties.urls.pbf"]]
         json = json.rename(columns={"properties.name": "name", "properties.urls.pbf": "url"})
 
@@ -47,8 +74,9 @@ class OSM_datasource(datasource.Datasource):
         return urls
 
     def _parse_bbbike(self):
+        source = self._cached(BBBIKE, "bbbike-cities.csv")
         sources = pd.read_csv(
-            BBBIKE, sep=":", header=None, skiprows=5, usecols=[0], names=["place"]
+            source, sep=":", header=None, skiprows=5, usecols=[0], names=["place"]
         )[:-8]
         urls = {
             n: ["https://download.bbbike.org/osm/bbbike/" + n + "/" + n + ".osm.pbf"]
@@ -2,7 +2,26 @@ import threading
 import asyncio
 import aiohttp
 import os
-import pandas as pd 
+import json
+import time
+import urllib.request
+import urllib.error
+import pandas as pd
+
+# size of chunks written to disk while downloading
+CHUNK_SIZE = 1 << 20
+# maximum number of simultaneous downloads
+MAX_CONCURRENT = 4
+# number of attempts to resume an interrupted download
+RETRIES = 3
+# seconds during which a cached catalog is used without revalidation
+CATALOG_MAX_AGE = 24 * 3600
+
+
+def default_cache_dir():
+    """Directory of cached datasource catalogs"""
+    base = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "osmdatapy")
 
 
 class RunThread(threading.Thread):
@@ -30,45 +49,211 @@ def run_async(func, *args, **kwargs):
         return asyncio.run(func(*args, **kwargs))
 
 
-async def _download(url: str, alternate_url: str, name: str) -> bytes:
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as resp:
-            if resp.status == 200:
-                content = await resp.read()
-                return content
-
-            elif alternate_url is not None:
-                async with session.get(alternate_url) as resp2:
-                    if resp2.status == 200:
-                        content = await resp2.read()
-                        return content
-                    else:
-                        print("{0} is missing, error {1}".format(name, resp2.status))
-                        return None
-            else:
-                print("{0} is missing, error {1}".format(name, resp.status))
+async def _download(session, urls, name, filepath, chunk_size=CHUNK_SIZE, retries=RETRIES):
+    """
+    Stream the first available url to filepath, returns filepath or None if all urls are missing
+
+    content is written by chunks to a .part temporary file, renamed to filepath when complete,
+    an interrupted download is resumed with a HTTP Range request, also from a .part file
+    left by a previous call if the remote file did not change
+    """
+
+    status = None
+    part = filepath + ".part"
+
+    for url in urls:
+        if url is None:
+            continue
+        status = await _stream(session, url, part, chunk_size, retries)
+        if status is None:
+            os.replace(part, filepath)
+            _remove(part + ".meta")
+            return filepath
+        _remove(part)
+        _remove(part + ".meta")
+
+    print("{0} is missing, error {1}".format(name, status))
+    return None
+
+
+async def _stream(session, url, part, chunk_size, retries):
+    """
+    Download url into part file, returns None when complete or the HTTP error status
+
+    the ETag or Last-Modified validator of the remote file is stored in part.meta,
+    a part file is resumed only with its validator, so that a changed file is downloaded again
+    """
+
+    validator = _read_validator(part)
+    if validator is None:
+        _remove(part)
+
+    attempt = 0
+    while True:
+        done = os.path.getsize(part) if os.path.exists(part) else 0
+        headers = {}
+        if done > 0:
+            headers["Range"] = "bytes={0}-".format(done)
+            headers["If-Range"] = validator
+
+        try:
+            async with session.get(url, headers=headers) as resp:
+
+                # If-Range matched and the part file is complete
+                if resp.status == 416 and done > 0 and _total_size(resp) == done:
+                    return None
+                # part file larger than the remote file, restart
+                if resp.status == 416 and done > 0:
+                    _remove(part)
+                    continue
+                if resp.status not in (200, 206):
+                    return resp.status
+
+                # server ignored the range or the file changed, restart
+                if resp.status == 200:
+                    done = 0
+                validator = resp.headers.get("ETag", resp.headers.get("Last-Modified"))
+                _write_validator(part, validator)
+                total = _total_size(resp)
+
+                with open(part, "ab" if done > 0 else "wb") as f:
+                    async for chunk in resp.content.iter_chunked(chunk_size):
+                        f.write(chunk)
+                        done += len(chunk)
+
+            if total is None or done >= total:
                 return None
 
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == retries:
+                raise
 
-async def _write(content: bytes, name: str, path: str, file_ext: str) -> None:
-    with open(os.path.join(path, name + file_ext), "wb") as f:
-        if content is not None:
-            f.write(content)
+        # interrupted download, resumed if the remote file has a validator
+        attempt += 1
+        if attempt > retries:
+            raise aiohttp.ClientPayloadError("{0} is incomplete after {1} retries".format(url, retries))
+        if validator is None:
+            _remove(part)
 
 
-async def _get_url(urls, name, path, file_ext) -> None:
-    if len(urls) > 1:
-        content = await _download(urls[0], urls[1], name)
-    else:
-        content = await _download(urls[0], None, name)
-    await _write(content, name, path, file_ext)
+def _read_validator(part):
+    """ETag or Last-Modified validator of the remote file of a part file, None if unknown"""
+
+    if not os.path.exists(part) or not os.path.exists(part + ".meta"):
+        return None
+    with open(part + ".meta") as f:
+        return json.load(f).get("validator")
+
+
+def _write_validator(part, validator):
+    """Store the validator of the remote file of a part file, remove it if None"""
+
+    if validator is None:
+        _remove(part + ".meta")
+        return None
+    with open(part + ".meta", "w") as f:
+        json.dump({"validator": validator}, f)
 
 
-async def _download_urls(urls, path, file_ext):
-    """download and save urls dictionary of save name : [one or two urls] at path"""
+def _remove(filepath):
+    if os.path.exists(filepath):
+        os.remove(filepath)
 
-    tasks = [_get_url(v, k, path, file_ext) for k, v in urls.items()]
-    return await asyncio.gather(*tasks)
+
+def _total_size(resp):
+    """Size of the complete file from Content-Range or Content-Length headers, None if unknown"""
+
+    if "Content-Range" in resp.headers:
+        total = resp.headers["Content-Range"].rsplit("/", 1)[-1]
+        return int(total) if total.isdigit() else None
+    if resp.status == 200 and resp.content_length is not None:
+        return resp.content_length
+    return None
+
+
+async def _get_url(session, semaphore, urls, name, path, file_ext, chunk_size) -> None:
+    if isinstance(urls, str):
+        urls = [urls]
+    async with semaphore:
+        return await _download(session, urls, name, os.path.join(path, name + file_ext), chunk_size)
+
+
+async def _download_urls(urls, path, file_ext, max_concurrent=MAX_CONCURRENT, chunk_size=CHUNK_SIZE):
+    """
+    download and save urls dictionary of save name : [one or two urls] at path,
+    at most max_concurrent downloads run at the same time
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    async with aiohttp.ClientSession() as session:
+        tasks = [
+            _get_url(session, semaphore, v, k, path, file_ext, chunk_size) for k, v in urls.items()
+        ]
+        return await asyncio.gather(*tasks)
+
+
+def cached_file(url, filepath, offline=False, max_age=CATALOG_MAX_AGE):
+    """
+    Path of a local copy of url, downloaded or revalidated if needed
+
+    a copy younger than max_age seconds is used as is, an older copy is revalidated
+    with ETag and If-Modified-Since headers, if offline or if the server cannot be reached,
+    the last copy is used
+
+    Parameters
+    ----------
+    url : url of the file
+    filepath : path of the local copy, validators are stored in filepath.meta
+    offline : if True, never access the network
+    max_age : maximum age in seconds of a copy used without revalidation
+    """
+
+    meta_path = filepath + ".meta"
+    meta = {}
+    if os.path.exists(filepath) and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+    if offline:
+        if not meta:
+            raise ValueError("{0} is not in cache, cannot load it offline".format(url))
+        return filepath
+
+    if meta and time.time() - meta.get("checked", 0) < max_age:
+        return filepath
+
+    request = urllib.request.Request(url)
+    if meta.get("etag"):
+        request.add_header("If-None-Match", meta["etag"])
+    if meta.get("last_modified"):
+        request.add_header("If-Modified-Since", meta["last_modified"])
+
+    try:
+        with urllib.request.urlopen(request) as resp:
+            content = resp.read()
+            meta = {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not meta:
+            raise
+        content = None
+    except urllib.error.URLError as e:
+        if not meta:
+            raise
+        print("{0} cannot be reached, using cached copy : {1}".format(url, e.reason))
+        return filepath
+
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    if content is not None:
+        with open(filepath + ".tmp", "wb") as f:
+            f.write(content)
+        os.replace(filepath + ".tmp", filepath)
+
+    meta["checked"] = time.time()
+    with open(meta_path + ".tmp", "w") as f:
+        json.dump(meta, f)
+    os.replace(meta_path + ".tmp", meta_path)
+
+    return filepath
 
 
 class Datasource:
@@ -91,16 +276,30 @@ class Datasource:
         self.places = places
         self.file_extension=file_ext
 
-    def download(self, path, data_type=None, place=None, rename=None, compress=False):
+    def download(
+        self,
+        path,
+        data_type=None,
+        place=None,
+        rename=None,
+        compress=False,
+        max_concurrent=MAX_CONCURRENT,
+        chunk_size=CHUNK_SIZE,
+    ):
         """
         donload data from datasource and save to path, returns a list path
 
+        files are streamed to disk, interrupted downloads are resumed,
+        a file is only created when its download is complete
+
         args:
             path : directory to save into
             data_type : data_type to get from datasource
             place : optional string or list of strings, save file with place name except if rename is not False
             rename : if not None, file name or list of file names, must be same size as places
             compress : zip file if set to True
+            max_concurrent : maximum number of simultaneous downloads
+            chunk_size : size in bytes of chunks written to disk
         """
 
         if isinstance(place, list):
@@ -126,7 +325,7 @@ class Datasource:
                 urls = {place: self._get_url(data_type, place)}
 
         # download and save urls, optionaly rename
-        run_async(_download_urls, urls, path, self.file_extension)
+        run_async(_download_urls, urls, path, self.file_extension, max_concurrent, chunk_size)
 
         return [os.path.join(path,k+ self.file_extension) for k in urls.keys()]
 
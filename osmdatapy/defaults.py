@@ -61,6 +61,13 @@ IS_AREA_KEY_ANY_VALUE = [
 RELATION_LINESTRING = ["route"]
 RELATION_AREA = ["multipolygon", "boundary"]
 
+# oneway tag values for routing graphs, roundabouts are oneway by default
+
+ONEWAY_FORWARD = ["yes", "true", "1"]
+ONEWAY_BACKWARD = ["-1", "reverse"]
+ONEWAY_NO = ["no", "false", "0"]
+ONEWAY_JUNCTION = ["roundabout", "circular"]
+
 
 # Default queries
 
@@ -1,17 +1,20 @@
 # Dense Nodes and Info Primitives PBF parsers
 
 import numpy as np
-from array import array
 from . import protobuf
 
 
 def dense(query, block, length):
+    """
+    Parse a dense nodes group, returns ids, tags and rels numpy arrays or None if no node matches query
+
+    ids columns are osm id, osm type and optionaly version, timestamp and changeset
+    """
 
-    empty_res = np.array([], int), np.array([], int), np.array([], int)
     if not query["nodes"]:
-        return empty_res
+        return None
 
-    elemid, version, time, change = None, -1, 0, 0
+    elemid, version, time, change = None, None, None, None
     tagids, tags, vals = None, None, None
     offset = 0
 
@@ -21,41 +24,45 @@ def dense(query, block, length):
         if key == 1:
             elemid, offset = protobuf.large_packed(block, offset, l, "sint64", delta=True)
         elif key == 5:
-            info, offset = dense_info(block, offset, l, query)
+            offset, version, time, change = dense_info(block, offset, l, query)
         elif key == 10:
             tagids, tags, vals, offset = protobuf.keyvals(block, offset, l)
         else:
             offset += l
 
     if elemid is None or len(elemid) == 0:
-        return empty_res
-
-    elemid, tagids, tags, vals = filter_by_query(query, elemid, tagids, tags, vals)
-
-    # add results to arrays
-    l = len(elemid)
-
-    ids = np.column_stack(
-        [
-            elemid,
-            np.repeat(0, l),
-            _array_def(version, l),
-            _array_def(time, l),
-            _array_def(change, l),
-        ]
-    )
-    tags = np.column_stack([tagids, tags, vals])
+        return None
+
+    elemid = _int_array(elemid)
+    id_length = len(elemid)
+    tagids, tags, vals = _int_array(tagids), _int_array(tags), _int_array(vals)
+
+    mask = filter_by_query(query, elemid, tagids, tags, vals, time)
+    if not mask.any():
+        return None
+
+    # keep tags of kept nodes, renumber positions in kept nodes
+    tag_mask = mask[tagids]
+    pos = np.cumsum(mask) - 1
+    tags = np.column_stack([pos[tagids[tag_mask]], tags[tag_mask], vals[tag_mask]])
     tags = _filter_dense_tags(tags, query["tags"])
 
-    return ids, tags, None
+    cols = [elemid[mask], np.zeros(mask.sum(), dtype="int64")]
+    if query["metadata"]:
+        cols.append(_array_def(version, -1, id_length)[mask])
+        cols.append(_array_def(time, 0, id_length)[mask])
+        cols.append(_array_def(change, 0, id_length)[mask])
+
+    return np.column_stack(cols), tags, None
 
 
 def dense_info(block, offset, length, query):
+    """Parse a dense info message, returns new offset and version, timestamp and changeset arrays or None"""
 
-    version, time, change = -1, 0, 0
+    version, time, change = None, None, None
 
     message_offset = offset + length
-    if query is None or not query["metadata"]:
+    if query is None or not query["info"]:
         return message_offset, version, time, change
 
     while offset < message_offset:
@@ -64,117 +71,95 @@ def dense_info(block, offset, length, query):
         if key == 1:
             version, offset = protobuf.large_packed(block, offset, l, "int32")
         elif key == 2:
-            timestamp, offset = protobuf.large_packed(block, offset, l, "sint64", True)
+            time, offset = protobuf.large_packed(block, offset, l, "sint64", True)
         elif key == 3:
-            changeset, offset = protobuf.large_packed(block, offset, l, "sint64", True)
+            change, offset = protobuf.large_packed(block, offset, l, "sint64", True)
         else:
-            offset += length
+            offset += l
 
-    return message_offset, version, time, change
+    return message_offset, _int_array(version), _int_array(time), _int_array(change)
 
 
-def _array_def(value, len_elem):
-    if isinstance(value, int):
-        return np.repeat(value, len_elem)
-    else:
-        return value
+def _int_array(values):
+    """Convert a python array of 64 bits integers to a numpy array without copy"""
+    if values is None or len(values) == 0:
+        return np.array([], dtype="int64")
+    return np.frombuffer(values, dtype="int64")
 
 
-def filter_by_query(query, ids, tagids, tags, vals):
-    """Returns subset of ids, tagids, tags and vals matching query"""
+def _array_def(values, default, len_elem):
+    if len(values) == 0:
+        return np.full(len_elem, default, dtype="int64")
+    return values
 
-    if len(ids) == 0 or query is None:
-        return ids, tagids, tags, vals
 
-    # convert to numpy arrays
-    idarr = np.asarray(ids, "int")
-    tagidarr = np.asarray(tagids, "int")
-    tagarr = np.asarray(tags, "int")
-    valarr = np.asarray(vals, "int")
+def filter_by_query(query, ids, tagids, tags, vals, time=None):
+    """Returns a boolean mask of ids matching query"""
 
-    # set of osm ids to keep
-    maskid = np.full(len(ids), False)
+    id_length = len(ids)
 
-    # filter on tags
-    if not tags:
-        tag_mask = filter_by_tags(query, tagarr, valarr)
-        tagid_mask = np.in1d(
-            idarr, idarr[np.unique(tagidarr[tag_mask])], assume_unique=True
-        )
+    # filter on tags and tag:value pairs
+    if query["no_tagval"]:
+        mask = np.full(id_length, True)
     else:
-        tagid_mask = np.full(len(ids), False)
+        mask = filter_by_tags(query, tagids, tags, vals, id_length)
+
+    if query["must_tags"] is not None:
+        must = np.isin(tags, np.fromiter(query["must_tags"], dtype="int64"))
+        mask &= np.bincount(tagids[must], minlength=id_length) > 0
 
     # filter on osm ids
     if query["node_set"] is not None:
-        nodesetarr = np.fromiter(query["node_set"], "int")
-        nodeset_mask = np.in1d(idarr, nodesetarr, assume_unique=True)
-    else:
-        nodeset_mask = np.full(len(ids), False)
-
-    maskid = maskid | tagid_mask | nodeset_mask
-
-    idarr = idarr[maskid]
-    idpos = np.arange(len(ids))[maskid]
-
-    # reindex tagids
-    tag_mask = np.in1d(tagidarr, idpos)
-    tagidarr = tagidarr[tag_mask]
-    tagarr = tagarr[tag_mask]
-    valarr = valarr[tag_mask]
-
-    # change tagidarr to positions in idarr
-    idsorted = np.argsort(idpos)
-    pos = np.searchsorted(idpos[idsorted], tagidarr)
-    tagidarr = idsorted[pos]
+        nodeset_arr = query.get("node_array")
+        if nodeset_arr is None:
+            nodeset_arr = np.fromiter(query["node_set"], dtype="int64")
+        mask &= np.isin(ids, nodeset_arr)
 
-    return (
-        array.array("q", idarr),
-        array.array("q", tagidarr),
-        array.array("q", tagarr),
-        array.array("q", valarr),
-    )
+    # filter on timestamps
+    if query["time_min"] is not None or query["time_max"] is not None:
+        time = _array_def(time if time is not None else [], 0, id_length)
+        if query["time_min"] is not None:
+            mask &= time >= query["time_min"]
+        if query["time_max"] is not None:
+            mask &= time <= query["time_max"]
 
+    return mask
 
-def filter_by_tags(query, tags, vals):
-    """returns a boolean mask on tags"""
 
-    mask = np.full(tags.shape, True)
+def filter_by_tags(query, tagids, tags, vals, id_length):
+    """returns a boolean mask of objects with tags or tag:value pairs matching query"""
 
-    if query["must_tags"] is not None:
-        mask = np.in1d(tags, np.fromiter(query["must_tags"], dtype="int"))
-
-    if query["no_tags"]:
-        return mask
-
-    # list of keep unique ids
     kps = _filter_pairs(query["keep"], tags, vals)
     kps = kps | _filter_all(query["keep_all"], tags)
     exs = _filter_pairs(query["excl"], tags, vals)
     exs = exs | _filter_all(query["excl_all"], tags)
 
+    kps = np.bincount(tagids[kps], minlength=id_length) > 0
+    exs = np.bincount(tagids[exs], minlength=id_length) > 0
+
     if query["keep_first"]:
-        return mask & (kps & np.logical_not(exs))
+        return kps & np.logical_not(exs)
     else:
-        return mask & (np.logical_not(exs) | kps)
+        return np.logical_not(exs) | kps
 
 
 def _filter_pairs(query, tags, vals):
     if query is None:
         return np.full(tags.shape, False)
-    kp_array = np.fromiter(query, dtype="int")
+    kp_array = np.fromiter(query, dtype="int64")
     kp_packed = np.bitwise_or(np.left_shift(tags, 32), vals)
-    return np.in1d(kp_packed, kp_array)
+    return np.isin(kp_packed, kp_array)
 
 
 def _filter_all(query, tags):
     if query is None:
         return np.full(tags.shape, False)
-    return np.in1d(tags, np.fromiter(query, dtype="int"))
+    return np.isin(tags, np.fromiter(query, dtype="int64"))
 
 
 def _filter_dense_tags(tags, qtags):
 
-    if qtags is None or qtags.shape[0] == 0 or tags.shape[0] == 0:
+    if qtags is None or tags.shape[0] == 0:
         return tags
 
-    return tags[np.in1d(tags[:, 1], qtags, assume_unique=True)]
\ No newline at end of file
+    return tags[np.isin(tags[:, 1], np.fromiter(qtags, dtype="int64"))]
@@ -0,0 +1,219 @@
+import numpy as np
+import pandas as pd
+
+from ._topology import segments, row_offsets, _chain_min
+
+EARTH_RADIUS = 6371008.8
+
+
+class Graph:
+    """
+    A directed routing graph in compressed sparse row format
+
+    Graph nodes are way ends and nodes shared by many ways,
+    nodes used by a single way are contracted in edges, as well as nodes
+    where exactly two ways with the same oneway value meet end to end,
+    two-way ways meet end to end in any of their directions
+
+    Attributes
+    ----------
+    nodes : osm node ids of graph nodes, graph node i is nodes[i]
+    indptr : edges of graph node i are in indptr[i]:indptr[i+1]
+    indices : target graph node of each edge
+    length : edge length in meters
+    wayid : osm way id of each edge, of the first way of edges merged through many ways
+    """
+
+    def __init__(self, nodes, indptr, indices, length, wayid):
+        self.nodes = nodes
+        self.indptr = indptr
+        self.indices = indices
+        self.length = length
+        self.wayid = wayid
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def edges(self):
+        """returns a Dataframe of edges with source and target osm node ids, length and way id"""
+
+        source = np.repeat(self.nodes, np.diff(self.indptr))
+        return pd.DataFrame(
+            {
+                "source": source,
+                "target": self.nodes[self.indices],
+                "length": self.length,
+                "wayid": self.wayid,
+            }
+        )
+
+
+def build_graph(refs, rows, wayids, direction, coords):
+    """
+    Build a Graph from way nodes
+
+    Parameters
+    ----------
+    refs : array of node ids of all ways, way after way
+    rows : way position of each value in refs, sorted
+    wayids : osm id of each way position
+    direction : for each way position, 1 for oneway, -1 for reversed oneway, 0 for both ways
+    coords : function returning lon, lat coordinates of an array of node ids
+    """
+
+    if len(refs) == 0:
+        empty = np.array([], dtype=np.int64)
+        return Graph(empty, np.zeros(1, dtype=np.int64), empty, np.array([], dtype=np.float64), empty)
+
+    offsets = row_offsets(rows)
+    ptids, ix, _, ways, source, target = segments(refs, offsets)
+    length = _segment_length(coords(ptids), ix)
+
+    way_rows = np.asarray(rows)[offsets[:-1]][ways]
+    way_dir = np.asarray(direction)[way_rows]
+    way_ids = np.asarray(wayids)[way_rows]
+
+    source, target, length, way_dir, way_ids = _contract(
+        source, target, length, way_rows, way_dir, way_ids
+    )
+
+    fwd = way_dir >= 0
+    bwd = way_dir <= 0
+
+    src = np.concatenate([source[fwd], target[bwd]])
+    tgt = np.concatenate([target[fwd], source[bwd]])
+    length = np.concatenate([length[fwd], length[bwd]])
+    way_ids = np.concatenate([way_ids[fwd], way_ids[bwd]])
+
+    # renumber osm ids to graph nodes and sort edges by source
+    nodes = np.unique(np.concatenate([src, tgt]))
+    src = np.searchsorted(nodes, src)
+    tgt = np.searchsorted(nodes, tgt)
+
+    order = np.lexsort((tgt, src))
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(src, minlength=len(nodes)))
+
+    return Graph(nodes, indptr, tgt[order], length[order], way_ids[order])
+
+
+def _contract(source, target, length, way_rows, way_dir, way_ids):
+    """
+    Merge chains of segments through nodes where exactly two ways meet end to end,
+    the first ending and the second starting at the node, with the same direction,
+    two-way segments are first reversed to follow each other
+
+    returns source, target, length, direction and way id of merged segments,
+    the way id of a chain is the id of its first way
+    """
+
+    source, target = _orient(source, target, way_dir)
+
+    n = len(source)
+    nodes, inverse = np.unique(np.concatenate([source, target]), return_inverse=True)
+    src, tgt = inverse[:n], inverse[n:]
+
+    # segment ending and segment starting at each node, with node usage counts
+    n_src = np.bincount(src, minlength=len(nodes))
+    n_tgt = np.bincount(tgt, minlength=len(nodes))
+    seg_in = np.zeros(len(nodes), dtype=np.int64)
+    seg_in[tgt] = np.arange(n)
+    seg_out = np.zeros(len(nodes), dtype=np.int64)
+    seg_out[src] = np.arange(n)
+
+    node = np.flatnonzero((n_src == 1) & (n_tgt == 1))
+    i, j = seg_in[node], seg_out[node]
+    mask = (i != j) & (way_rows[i] != way_rows[j]) & (way_dir[i] == way_dir[j])
+    i, j = i[mask], j[mask]
+    if len(i) == 0:
+        return source, target, length, way_dir, way_ids
+
+    nxt = np.full(n, -1, dtype=np.int64)
+    nxt[i] = j
+    prv = np.arange(n)
+    prv[j] = i
+
+    # chains closed in a ring are opened at their smallest segment
+    head, smallest = _chain_heads(prv)
+    ring = prv[head] != head
+    if ring.any():
+        first = np.flatnonzero(ring & (smallest == np.arange(n)))
+        nxt[prv[first]] = -1
+        prv[first] = first
+        head, _ = _chain_heads(prv)
+
+    heads = np.flatnonzero(prv == np.arange(n))
+    edge = np.searchsorted(heads, head)
+    last = np.flatnonzero(nxt == -1)
+    merged_target = np.empty(len(heads), dtype=target.dtype)
+    merged_target[edge[last]] = target[last]
+
+    return (
+        source[heads],
+        merged_target,
+        np.bincount(edge, weights=length, minlength=len(heads)),
+        way_dir[heads],
+        way_ids[heads],
+    )
+
+
+def _orient(source, target, way_dir):
+    """
+    Reverse two-way segments so that chains of two-way segments through nodes
+    used by exactly two segments end to end have a single direction, e.g. two ways
+    digitized toward each other, chains keep the direction of their smallest segment
+    """
+
+    n = len(source)
+
+    # segment ends 2s (source) and 2s + 1 (target), paired on nodes of two two-way ends
+    ends = np.column_stack([source, target]).ravel()
+    two_way = np.repeat(way_dir == 0, 2)
+    _, inverse, counts = np.unique(ends, return_inverse=True, return_counts=True)
+    paired = two_way & (counts[inverse] == 2)
+    paired &= np.bincount(inverse, weights=paired, minlength=len(counts))[inverse] == 2
+    pairs = np.flatnonzero(paired)
+    pairs = pairs[np.argsort(inverse[pairs], kind="stable")]
+    if len(pairs) == 0:
+        return source, target
+
+    link = np.full(2 * n, -1, dtype=np.int64)
+    link[pairs[0::2]] = pairs[1::2]
+    link[pairs[1::2]] = pairs[0::2]
+
+    # state 2s + d is segment s entered by end d, each chain is found in both directions
+    nxt = link[np.arange(2 * n) ^ 1]
+    prv = np.arange(2 * n)
+    prv[nxt[nxt >= 0]] = np.flatnonzero(nxt >= 0)
+    smallest = _chain_min(prv, np.where(nxt >= 0, nxt, np.arange(2 * n)))
+
+    # segments entered by their target in the kept direction are reversed
+    reverse = smallest[1::2] % 2 == 0
+    return np.where(reverse, target, source), np.where(reverse, source, target)
+
+
+def _chain_heads(prv):
+    """
+    First segment of the chain of each segment by pointer jumping on previous segments,
+    and smallest segment position on the way, the whole ring for chains closed in a ring
+    """
+
+    head = prv.copy()
+    smallest = np.arange(len(prv))
+    for _ in range(max(1, int(np.ceil(np.log2(len(prv)))) + 1)):
+        smallest = np.minimum(smallest, smallest[head])
+        head = head[head]
+    return head, smallest
+
+
+def _segment_length(coords, ix):
+    """Sum of haversine distances between consecutive points of each segment"""
+
+    lon = np.radians(coords[:, 0].astype(np.float64))
+    lat = np.radians(coords[:, 1].astype(np.float64))
+    dlon, dlat = lon[1:] - lon[:-1], lat[1:] - lat[:-1]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+    dist = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+    same = ix[1:] == ix[:-1]
+    return np.bincount(ix[1:][same], weights=dist[same], minlength=ix[-1] + 1)
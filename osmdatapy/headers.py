@@ -78,6 +78,16 @@ def parse_blob(data):
     return st_offset, end_offset, compression, res
 
 
+def decompress(data, compression):
+    """Decompress blob data, compression is None for raw data or "zlib", the only format supported"""
+
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if compression is None:
+        return data
+    raise NotImplementedError("Compression {0} not implemented".format(compression))
+
+
 def parse_blockheader(data, compression):
     """Valide block header content based on parsing capabilities"""
 
@@ -131,26 +141,22 @@ def parse_cache_block(data, compression="zlib"):
     compression : None or compression type string, "zlib" is the only format supported
     """
 
-    if compression == "zlib":
-        block_data = zlib.decompress(data)
-        block = memoryview(block_data)
-    elif compression is None:
-        block = memoryview(block_data)
-    else:
-        raise NotImplementedError("Compression {0} not implemented".format(compression))
+    block = memoryview(decompress(data, compression))
 
     offset = 0
     block_length = len(block)
 
     # default block metadata
     granularity = 100
-    date_granularity = 100
+    date_granularity = 1000
     lat_offset = 0
     lon_offset = 0
 
     # store results by osm_type
     nodes, dense, ways, relations = [], [], [], []
+    dense_ranges = []
     ids, lons, lats = array.array("q", []), array.array("q", []), array.array("q", [])
+    times = array.array("q", [])
 
     while offset < block_length:
         key, offset, id_length = pbf_key(block, offset)
@@ -158,17 +164,19 @@ def parse_cache_block(data, compression="zlib"):
         if key == 1:
             strtable, offset = stringtable(block, offset, id_length)
         elif key == 2:
-            offset, osm_id, offset_list, ids, lons, lats = parse_primitive_group(block, offset, id_length)
+            offset, osm_id, offset_list, g_ids, g_lons, g_lats, g_times = parse_primitive_group(block, offset, id_length)
+            times.extend(g_times)
             if osm_id==1:
                 nodes.extend(offset_list)
-                ids.extend(ids)
-                lons.extend(lons)
-                lats.extend(lats)
+                ids.extend(g_ids)
+                lons.extend(g_lons)
+                lats.extend(g_lats)
             elif osm_id==2:
                 dense.append(offset_list)
-                ids.extend(ids)
-                lons.extend(lons)
-                lats.extend(lats)
+                dense_ranges.append(_id_range(np.asarray(g_ids, dtype="int64")))
+                ids.extend(g_ids)
+                lons.extend(g_lons)
+                lats.extend(g_lats)
             elif osm_id==3:
                 ways.extend(offset_list)
             else:
@@ -185,22 +193,46 @@ def parse_cache_block(data, compression="zlib"):
         else:
             offset += id_length
 
+    lons = _map_coord(lons, granularity, lon_offset)
+    lats = _map_coord(lats, granularity, lat_offset)
+    pts = np.array([ids, lons, lats]).T
+
     metadata = {
         "stringtable": strtable,
         "date_granularity": date_granularity,
         "dense_offsets": dense,
+        "dense_ranges": dense_ranges,
         "node_offsets": nodes,
         "way_offsets": ways,
         "rel_offsets": relations,
+        "node_count": len(ids),
+        "node_range": (pts[:, 0].min(), pts[:, 0].max()) if len(ids) > 0 else None,
+        "way_range": _id_range(np.array([w[0] for w in ways], dtype="int64")),
+        "rel_range": _id_range(np.array([r[0] for r in relations], dtype="int64")),
+        "time_range": _time_range(times, date_granularity),
     }
 
-    lons = _map_coord(lons, granularity, lon_offset)
-    lats = _map_coord(lats, granularity, lat_offset)
-    pts = np.array([ids, lons, lats]).T
-
     return pts, metadata
 
 
+def _id_range(ids):
+    """min and max ids, None if no ids"""
+    if len(ids) == 0:
+        return None
+    return (int(ids.min()), int(ids.max()))
+
+
+def _time_range(times, date_granularity):
+    """min and max timestamps in seconds, None if no timestamps"""
+    if len(times) == 0:
+        return None
+    times = np.frombuffer(times, dtype="int64")
+    return (
+        int(times.min()) * date_granularity // 1000,
+        int(times.max()) * date_granularity // 1000,
+    )
+
+
 def _map_coord(coord, gran, offset):
     res = np.asarray(coord)
     return res * gran + offset
@@ -240,7 +272,8 @@ def parse_primitive_group(block, offset, length):
         else : list of (id, offset, length)
     geometry :
         if dense nodes or nodes : array of ids, array of longitudes, array of latitudes
-        else None, None, None
+        else empty arrays
+    timestamps : array of timestamps of objects with metadata
     """
 
     group_offset = offset + length
@@ -248,45 +281,53 @@ def parse_primitive_group(block, offset, length):
     ids = array.array("q", [])
     lons = array.array("q", [])
     lats = array.array("q", [])
+    times = array.array("q", [])
 
     while offset < group_offset:
         key, offset, id_length = pbf_key(block, offset)
         ref_offset = offset
 
         if key == 1:
-            offset, elemid, lon, lat = cached_node(block, offset, id_length)
+            offset, elemid, lon, lat, time = cached_node(block, offset, id_length)
             results.append((elemid, ref_offset, id_length))
             ids.append(elemid)
             lons.append(lon)
             lats.append(lat)
+            if time is not None:
+                times.append(time)
         elif key == 2:
-            offset, elemid, lon, lat = cached_dense(block, offset, id_length)
+            offset, elemid, lon, lat, time = cached_dense(block, offset, id_length)
             results.append((ref_offset, id_length))
             ids.extend(elemid)
             lons.extend(lon)
             lats.extend(lat)
+            times.extend(time)
         elif key == 3 or key == 4:
-            offset, elemid = cached_relation_or_way(block, offset, id_length)
+            offset, elemid, time = cached_relation_or_way(block, offset, id_length)
             results.append((elemid, ref_offset, id_length))
+            if time is not None:
+                times.append(time)
         else:
             offset += id_length
 
     if key==2:
         results = results[0]
     
-    return offset, key, results, ids, lons, lats
+    return offset, key, results, ids, lons, lats, times
 
 
 def cached_dense(block, offset, length):
-    """ parse dense for cache, return new offset, list of osm ids and coordinates"""
+    """ parse dense for cache, return new offset, list of osm ids, coordinates and timestamps"""
 
     message_offset = offset + length
-    elemid, lon, lat = [0],[0],[0]
+    elemid, lon, lat, time = [0], [0], [0], []
 
     while offset < message_offset:
         key, offset, id_length = pbf_key(block, offset)
         if key == 1:
             elemid, offset = large_packed(block, offset, id_length, "sint64", delta=True)
+        elif key == 5:
+            time, offset = cached_dense_info(block, offset, id_length)
         elif key == 8:
             lat, offset = large_packed(block, offset, id_length, "sint64", delta=True)
         elif key == 9:
@@ -294,39 +335,78 @@ def cached_dense(block, offset, length):
         else:
             offset += id_length
 
-    return message_offset, elemid, lon, lat
+    return message_offset, elemid, lon, lat, time
 
 
-def cached_node(block, offset, length, res):
-    """ parse a node for cache, return osm id longitude, latitude"""
+def cached_dense_info(block, offset, length):
+    """ parse dense info for cache, return timestamps and new offset"""
 
     message_offset = offset + length
+    time = []
+
+    while offset < message_offset:
+        key, offset, id_length = pbf_key(block, offset)
+        if key == 2:
+            time, offset = large_packed(block, offset, id_length, "sint64", delta=True)
+        else:
+            offset += id_length
+
+    return time, message_offset
+
+
+def cached_info(block, offset, length):
+    """ parse info for cache, return timestamp or None and new offset"""
+
+    message_offset = offset + length
+    time = None
+
+    while offset < message_offset:
+        key, offset, id_length = pbf_key(block, offset)
+        if key == 2:
+            time, offset = scalar(block, offset, "int64")
+        else:
+            # all info fields are varints
+            _, offset = scalar(block, offset, "int64")
+
+    return time, message_offset
+
+
+def cached_node(block, offset, length):
+    """ parse a node for cache, return osm id, longitude, latitude and timestamp"""
+
+    message_offset = offset + length
+    elemid, lon, lat, time = 0, 0, 0, None
 
     while offset < message_offset:
         key, offset, id_length = pbf_key(block, offset)
         if key == 1:
             elemid, offset = scalar(block, offset, "sint64")
+        elif key == 4:
+            time, offset = cached_info(block, offset, id_length)
         elif key == 8:
             lat, offset = scalar(block, offset, "sint64")
         elif key == 9:
             lon, offset = scalar(block, offset, "sint64")
         else:
             offset += id_length
-            elemid, lon, lat = 0,0,0
 
-    return message_offset, elemid, lon, lat
+    return message_offset, elemid, lon, lat, time
 
 
 def cached_relation_or_way(block, offset, length):
-    """ parse a way or a relation for cache, return new offset and osm id"""
+    """ parse a way or a relation for cache, return new offset, osm id and timestamp"""
 
     message_offset = offset + length
-    elemid=0
+    elemid, time = 0, None
     while offset < message_offset:
         key, offset, id_length = pbf_key(block, offset)
         if key == 1:
             elemid, offset = scalar(block, offset, "int64")
-            return message_offset, elemid
+        elif key == 4:
+            time, offset = cached_info(block, offset, id_length)
+            return message_offset, elemid, time
+        elif key > 4:
+            return message_offset, elemid, time
         else:
             offset += id_length
-    return message_offset, elemid
\ No newline at end of file
+    return message_offset, elemid, time
\ No newline at end of file
@@ -0,0 +1,83 @@
+import numpy as np
+
+from ._topology import concat_ranges
+
+
+class IdIndex:
+    """
+    Index of the blocks of osm ids, to parse only blocks holding queried ids
+
+    ways are indexed by sorted id with their block and position in the block way offsets,
+    nodes by the id range of each block, as an index of all nodes would double the node cache
+
+    Parameters
+    ----------
+    blocks : list of blocks metadata
+    """
+
+    def __init__(self, blocks):
+
+        ranges = [(i, bl["node_range"]) for i, bl in enumerate(blocks) if bl["node_count"] > 0]
+        self.node_blocks = np.array([i for i, _ in ranges], dtype=np.int64)
+        self.node_ranges = np.array([r for _, r in ranges], dtype=np.int64).reshape(-1, 2)
+
+        # blocks of files sorted by id have increasing ranges that do not overlap
+        self.sorted_nodes = bool(np.all(self.node_ranges[1:, 0] > self.node_ranges[:-1, 1]))
+
+        way_ids, way_blocks, way_elements = [], [], []
+        for i, bl in enumerate(blocks):
+            offsets = bl["way_offsets"]
+            if len(offsets) == 0:
+                continue
+            way_ids.append(np.fromiter((w[0] for w in offsets), dtype=np.int64, count=len(offsets)))
+            way_blocks.append(np.full(len(offsets), i, dtype=np.int32))
+            way_elements.append(np.arange(len(offsets), dtype=np.int32))
+
+        if way_ids:
+            self.way_ids = np.concatenate(way_ids)
+            self.way_blocks = np.concatenate(way_blocks)
+            self.way_elements = np.concatenate(way_elements)
+            if not np.all(self.way_ids[1:] >= self.way_ids[:-1]):
+                order = np.argsort(self.way_ids, kind="stable")
+                self.way_ids = self.way_ids[order]
+                self.way_blocks = self.way_blocks[order]
+                self.way_elements = self.way_elements[order]
+        else:
+            self.way_ids = np.empty(0, dtype=np.int64)
+            self.way_blocks = np.empty(0, dtype=np.int32)
+            self.way_elements = np.empty(0, dtype=np.int32)
+
+    def nbytes(self):
+        arrays = [self.node_blocks, self.node_ranges, self.way_ids, self.way_blocks, self.way_elements]
+        return sum(x.nbytes for x in arrays)
+
+    def blocks_of_nodes(self, ids):
+        """Set of positions of blocks with an id range containing at least one id"""
+
+        ids = np.fromiter(ids, dtype=np.int64)
+        if self.sorted_nodes:
+            # binary search of the only block that can hold each id
+            pos = np.searchsorted(self.node_ranges[:, 1], ids, side="left")
+            found = pos < len(self.node_ranges)
+            found[found] = self.node_ranges[pos[found], 0] <= ids[found]
+            return set(self.node_blocks[np.unique(pos[found])].tolist())
+
+        ids = np.sort(ids)
+        first = np.searchsorted(ids, self.node_ranges[:, 0], side="left")
+        last = np.searchsorted(ids, self.node_ranges[:, 1], side="right")
+        return set(self.node_blocks[last > first].tolist())
+
+    def way_offsets(self, ids):
+        """Dictionary of block position to sorted positions of ways with ids in block way offsets"""
+
+        ids = np.unique(np.fromiter(ids, dtype=np.int64))
+        left = np.searchsorted(self.way_ids, ids, side="left")
+        counts = np.searchsorted(self.way_ids, ids, side="right") - left
+        pos = concat_ranges(left, counts)
+
+        blocks, elements = self.way_blocks[pos], self.way_elements[pos]
+        order = np.lexsort((elements, blocks))
+        blocks, elements = blocks[order], elements[order]
+
+        uniq, starts = np.unique(blocks, return_index=True)
+        return dict(zip(uniq.tolist(), np.split(elements, starts[1:])))
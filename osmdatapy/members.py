@@ -0,0 +1,58 @@
+import numpy as np
+
+from ._topology import concat_ranges
+
+OSM_TYPES = {"node": 0, "way": 1, "relation": 2}
+
+
+class Membership:
+    """
+    Reverse index of relation members, sorted by member type and id
+
+    Parameters
+    ----------
+    relids : array of parent relation id of each member
+    types : array of member osm type, 0 node, 1 way, 2 relation
+    memids : array of member ids
+    roles : array of member roles as positions in strings
+    """
+
+    def __init__(self, relids, types, memids, roles):
+        order = np.lexsort((relids, memids, types))
+        self.relids = relids[order]
+        self.types = types[order]
+        self.memids = memids[order]
+        self.roles = roles[order]
+
+        # start and end position of each member type
+        self.type_offsets = np.searchsorted(self.types, np.arange(4))
+
+    def __len__(self):
+        return len(self.memids)
+
+    def nbytes(self):
+        arrays = [self.relids, self.types, self.memids, self.roles, self.type_offsets]
+        return sum(x.nbytes for x in arrays)
+
+    def lookup(self, ids, osmtype):
+        """Positions of members with ids of an osm type, in the order of ids"""
+
+        ids = np.asarray(ids, dtype=np.int64)
+        st, end = self.type_offsets[osmtype], self.type_offsets[osmtype + 1]
+        memids = self.memids[st:end]
+
+        left = np.searchsorted(memids, ids, side="left")
+        counts = np.searchsorted(memids, ids, side="right") - left
+        return concat_ranges(left + st, counts)
+
+
+def osm_type(value):
+    """osm type number from a name (node, way, relation) or a number"""
+
+    if isinstance(value, str):
+        if value not in OSM_TYPES:
+            raise ValueError("type must be one of {0}".format(list(OSM_TYPES)))
+        return OSM_TYPES[value]
+    if value not in (0, 1, 2):
+        raise ValueError("type must be 0, 1 or 2")
+    return int(value)
@@ -0,0 +1,62 @@
+import sys
+from array import array
+
+import numpy as np
+import shapely as sh
+
+# approximate size of a shapely geometry without its coordinates
+GEOMETRY_BYTES = 100
+
+
+def deep_sizeof(obj, seen=None):
+    """
+    Memory in bytes used by an object and its content
+
+    numpy arrays and python arrays count their data buffer, containers count their items,
+    objects referenced many times are counted once
+    """
+
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        # arrays owning their data include it in getsizeof,
+        # views count the object owning their data, once for all views sharing it
+        size = sys.getsizeof(obj)
+        if obj.base is not None:
+            size += deep_sizeof(obj.base, seen)
+        if obj.dtype == object:
+            size += sum(deep_sizeof(x, seen) for x in obj.ravel())
+        return size
+
+    if isinstance(obj, (str, bytes, bytearray, array, int, float)):
+        return sys.getsizeof(obj)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(x, seen) for x in obj)
+    elif hasattr(obj, "__dict__"):
+        size += deep_sizeof(obj.__dict__, seen)
+
+    return size
+
+
+def results_nbytes(ids, tags, rels):
+    """Memory in bytes used by query results arrays"""
+    return sum(x.nbytes for x in (ids, tags, rels) if x is not None)
+
+
+def frame_nbytes(df):
+    """Memory in bytes used by a DataFrame, with coordinates of geometry columns"""
+
+    size = int(df.memory_usage(deep=True).sum())
+    for col in df.columns:
+        if str(df[col].dtype) == "geometry":
+            geoms = df[col].values._data
+            size += int(sh.get_num_coordinates(geoms).sum()) * 16 + GEOMETRY_BYTES * len(geoms)
+    return size
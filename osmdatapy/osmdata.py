@@ -1,4 +1,5 @@
-import os, sys
+import os
+import hashlib
 from struct import unpack
 
 import numpy as np
@@ -6,8 +7,23 @@ import pandas as pd
 
 from ._frame import Frame
 from .osmquery import Query
-from .headers import parse_header, parse_blob, parse_blockheader, parse_cache_block
+from .headers import parse_header, parse_blob, parse_blockheader, parse_cache_block, decompress
 from .block import parse_block
+from .graph import build_graph
+from .changes import Changes, current_rows, drop_rows
+from .cache import ResultCache, file_identity
+from .writer import PBFWriter
+from .stats import Stats, NO_STATS, collect
+from .memory import deep_sizeof, results_nbytes, frame_nbytes
+from .progress import Monitor, Cancelled
+from .stream import StreamReader, RangeReader, open_source
+from .wayrefs import WayRefs
+from .members import Membership, osm_type
+from .idindex import IdIndex
+from .shards import hilbert_index, split_by_size, tile_keys, union_extent
+from .defaults import ONEWAY_FORWARD, ONEWAY_BACKWARD, ONEWAY_NO, ONEWAY_JUNCTION
+
+OFFSETS = ["dense_offsets", "node_offsets", "way_offsets", "rel_offsets"]
 
 
 class OSM(Frame):
@@ -18,42 +34,167 @@ class OSM(Frame):
     Parameters
     ----------
     filepath : path to a pbf file
+    previous : optional OSM object of a previous version of the file (e.g. unpickled),
+               blocks with identical compressed data reuse its cached content instead of being parsed
+    cache : optional ResultCache or directory path, query results are stored on disk
+            and reused while the file and applied changes are unchanged
+    stats : optional Stats object or True, collect wall time and counters of each stage
+            of opening the file, queries, graphs and extracts
+    progress : optional function called after each blob with "open", bytes read, file size,
+               blobs read and None (total number of blobs is unknown)
+    cancel : optional CancelToken, opening stops at the next blob when cancelled
+             and raises a Cancelled exception
 
     Attributes
     ----------
     features : list of features in pbf (see PBF format on osm wiki)
     optional_features : list of optional features
     strings : list of all strings (tags, tag values, relation types)
+    stats : None or Stats object of the last call
     """
 
-    def __init__(self, filepath):
+    def __init__(
+        self, filepath, previous=None, cache=None, stats=None, progress=None, cancel=None
+    ):
+
+        self.stats = Stats() if stats is True else stats
+        stats = self._stats()
+        stats.start("open")
+
+        try:
+            self.filepath = self._validate_file(filepath)
+            monitor = Monitor("open", progress, cancel, os.path.getsize(self.filepath))
+            with open(self.filepath, "rb") as f:
+                self._load(f, previous, cache, monitor)
+
+        finally:
+            stats.finish()
+
+    @classmethod
+    def from_stream(
+        cls, source, filepath, previous=None, cache=None, stats=None, progress=None, cancel=None
+    ):
+        """
+        Save a pbf stream to a file and build the OSM object while bytes arrive
+
+        each blob is parsed as soon as it is complete, so that the OSM object is ready
+        when the download ends, the file is only created when the stream is complete
+
+        Parameters
+        ----------
+        source : url of a pbf file or binary file-like object with a read method
+        filepath : path of the pbf file to write
+        previous, cache, stats, progress, cancel : see OSM, progress total is the
+                                                   content length of urls, None otherwise
+        """
+
+        if not isinstance(filepath, str) or not filepath.endswith(".pbf"):
+            raise ValueError("'filepath' should be a path to a *.osm.pbf file")
+
+        osm = cls.__new__(cls)
+        osm.stats = Stats() if stats is True else stats
+        stats = osm._stats()
+        stats.start("open")
+
+        part = filepath + ".part"
+        stream, size = open_source(source)
+
+        try:
+            osm.filepath = filepath
+            monitor = Monitor("open", progress, cancel, size)
+            with open(part, "wb") as out:
+                osm._load(StreamReader(stream, out), previous, cache, monitor)
+            os.replace(part, filepath)
+
+        except BaseException:
+            if os.path.exists(part):
+                os.remove(part)
+            raise
+
+        finally:
+            if stream is not source:
+                stream.close()
+            stats.finish()
+
+        return osm
+
+    @classmethod
+    def from_shard(cls, shard, cache=None, stats=None, progress=None, cancel=None):
+        """
+        Open the blocks of a shard returned by OSM.shards, without reading the whole file
+
+        node blocks of the shard are only used for coordinates, way blocks for geometries
+        of relations and relation blocks to drop their member ways from results,
+        queries return objects of the shard blocks only
+
+        Parameters
+        ----------
+        shard : shard dictionary of filepath, header, blocks, nodes, ways and relations
+                byte ranges and bbox
+        cache, stats, progress, cancel : see OSM, progress total is the size of the shard blocks
+        """
+
+        osm = cls.__new__(cls)
+        osm.stats = Stats() if stats is True else stats
+        stats = osm._stats()
+        stats.start("open")
 
-        self.filepath = self._validate_file(filepath)
-        blocks, _geo, feat, opt_feat = self._read_pbf()
+        try:
+            osm.filepath = osm._validate_file(shard["filepath"])
+            context = shard["ways"] + shard.get("relations", [])
+            ranges = [shard["header"]] + sorted(shard["blocks"] + shard["nodes"] + context)
+            total = sum(end - st for st, end in ranges)
+            monitor = Monitor("open", progress, cancel, total)
+
+            with open(osm.filepath, "rb") as f:
+                osm._load(RangeReader(f, ranges), None, cache, monitor)
+
+            owned = {st for st, _ in shard["blocks"]}
+            context = {st for st, _ in context}
+            osm._context_blocks = [bl for bl in osm._blocks if bl["blob_offset"] in context]
+            osm._blocks = [bl for bl in osm._blocks if bl["blob_offset"] in owned]
+            osm._set_id_index()
+
+        finally:
+            stats.finish()
+
+        return osm
+
+    def _load(self, f, previous, cache, monitor):
+        """Read blobs of an open pbf file and set caches"""
+
+        stats = self._stats()
+        blocks, _geo, feat, opt_feat = self._read_pbf(f, previous, monitor)
 
         self.features = feat
         self.optional_features = opt_feat
 
         # set caches
-        self._set_geometry_cache(_geo)
-        self._set_string_cache(blocks)
+        with stats.stage("geometry_cache"):
+            self._set_geometry_cache(_geo)
+        with stats.stage("string_cache"):
+            self._set_string_cache(blocks)
+        self._context_blocks = []
+        self._way_refs = None
+        self._members = None
+        self._changes = None
+        self._set_id_index()
+
+        if isinstance(cache, str):
+            cache = ResultCache(cache)
+        self.cache = cache
+
+    def _stats(self):
+        """Stats collector or a collector doing nothing if stats are disabled"""
+        stats = getattr(self, "stats", None)
+        return NO_STATS if stats is None else stats
 
     def info(self):
         "Print cached content and memory usage"
 
         info = []
-        string_MB = 0
         MB = 1024 * 1024
-
-        for bl in self._blocks:
-            string_MB += sys.getsizeof(bl["stringtable"]) / MB
-
-        string_MB += sys.getsizeof(self.strings) / MB
-        geo_MB = (sys.getsizeof(self._geo_index) + sys.getsizeof(self._geo_coords)) / MB
-
-        offset_MB = 0
-        for t in ["node_offsets", "way_offsets", "rel_offsets"]:
-            offset_MB += sum([sys.getsizeof(x[t]) / MB for x in self._blocks])
+        mem = self.memory_usage()["bytes"] / MB
 
         d = sum([len(x["dense_offsets"]) > 0 for x in self._blocks])
         n = sum([len(x["node_offsets"]) > 0 for x in self._blocks])
@@ -65,13 +206,130 @@ class OSM(Frame):
             )
         )
         info.append('---------------------------------------')
-        info.append('Cache memory usage : {0:.1f} MB'.format(geo_MB + offset_MB + string_MB))
-        info.append("{0} points, {1:.1f} MB".format(len(self._geo_index), geo_MB))
-        info.append("offsets : {0:.1f} MB".format(offset_MB))
-        info.append('strings : {0:.1f} MB'.format(string_MB))
+        info.append('Cache memory usage : {0:.1f} MB'.format(mem.sum()))
+        info.append("{0} points, {1:.1f} MB".format(len(self._geo_index), mem["points"]))
+        info.append("offsets : {0:.1f} MB".format(mem[OFFSETS].sum()))
+        info.append('strings : {0:.1f} MB'.format(mem[["strings", "stringtables"]].sum()))
+        info.append('blocks metadata : {0:.1f} MB'.format(mem["blocks"]))
+        if self._changes is not None:
+            info.append('changes : {0:.1f} MB'.format(mem["changes"]))
+        if self.cache is not None:
+            info.append('result cache on disk : {0:.1f} MB'.format(self.cache.size() / MB))
 
         print("\r\n".join(info))
 
+    def memory_usage(self):
+        """
+        Return a DataFrame of memory used by cached data, one row by component,
+        with a bytes column and an items column of number of cached items
+        """
+
+        blocks = self._blocks
+        seen = set()
+        res = {}
+
+        res["points"] = (
+            deep_sizeof(self._geo_index, seen) + deep_sizeof(self._geo_coords, seen),
+            len(self._geo_index),
+        )
+        res["strings"] = (deep_sizeof(self.strings, seen), len(self.strings))
+        res["stringtables"] = (
+            sum(deep_sizeof(bl["stringtable"], seen) for bl in blocks),
+            sum(len(bl["stringtable"]) for bl in blocks),
+        )
+        for k in OFFSETS:
+            res[k] = (
+                sum(deep_sizeof(bl[k], seen) for bl in blocks),
+                sum(len(bl[k]) for bl in blocks),
+            )
+
+        # remaining block metadata, offsets and strings are already counted
+        res["blocks"] = (deep_sizeof(blocks, seen), len(blocks))
+        res["context_blocks"] = (deep_sizeof(self._context_blocks, seen), len(self._context_blocks))
+        res["changes"] = (deep_sizeof(self._changes, seen), len(self._changes or []))
+        res["id_index"] = (self._id_index.nbytes(), len(self._id_index.way_ids))
+        refs, members = self._way_refs, self._members
+        res["way_refs"] = (0, 0) if refs is None else (refs.nbytes(), len(refs))
+        res["members"] = (0, 0) if members is None else (members.nbytes(), len(members))
+
+        return pd.DataFrame.from_dict(res, orient="index", columns=["bytes", "items"])
+
+    def estimate_memory(self, query, sample=1):
+        """
+        Estimate the peak memory in bytes used by a query before it runs
+
+        results and dataframe sizes by osm object are measured on the first sample blocks
+        of each kind (dense nodes, nodes, ways, relations) selected by the query,
+        and extrapolated to all selected blocks
+
+        Returns a dictionary of number of selected blocks and candidate osm objects,
+        bytes of the largest decompressed block, results arrays, dataframe and peak
+        """
+
+        mapper = self._string_to_pos(self.strings)
+        strmap = {k: mapper[k] for k in query.all_strings() if k in mapper}
+
+        kinds = {}
+        elements = 0
+        for bl, qu in zip(self._blocks, self._block_queries(query, strmap)):
+            if qu is None:
+                continue
+            kind = tuple(len(bl[k]) > 0 for k in OFFSETS)
+            candidates = self._candidates(bl, qu)
+            kinds.setdefault(kind, []).append((bl, qu, candidates))
+            elements += candidates
+
+        res_bytes, df_bytes, block_bytes = 0, 0, 0
+
+        with _BlockFiles(self.filepath) as files:
+            for selected in kinds.values():
+
+                # measure sizes by candidate object on sample blocks
+                sampled, res_sample, df_sample = 0, 0, 0
+                for bl, qu, candidates in selected[:sample]:
+                    data = decompress(self._read_block(files[bl], bl), bl["compression"])
+                    block_bytes = max(block_bytes, len(data))
+
+                    ids, tags, rels = OSM._merge_results(
+                        parse_block(data, bl["stringtable"], qu, None)
+                    )
+                    sampled += candidates
+                    if ids is None:
+                        continue
+                    res_sample += results_nbytes(ids, tags, rels)
+                    df = self.to_dataframe(query, ids, tags, rels)
+                    df_sample += frame_nbytes(df)
+
+                total = sum(x[2] for x in selected)
+                if sampled > 0:
+                    res_bytes += res_sample * total // sampled
+                    df_bytes += df_sample * total // sampled
+
+                for bl, _, _ in selected[sample:]:
+                    block_bytes = max(block_bytes, bl.get("raw_size", 0))
+
+        # results are copied when merged, dataframe conversion creates intermediate
+        # frames (tags unstack, merges), measured peaks are up to 3 times final sizes
+        peak = block_bytes + 3 * (res_bytes + df_bytes)
+
+        return {
+            "blocks": sum(len(x) for x in kinds.values()),
+            "elements": elements,
+            "block_bytes": block_bytes,
+            "results_bytes": res_bytes,
+            "dataframe_bytes": df_bytes,
+            "peak_bytes": peak,
+        }
+
+    @staticmethod
+    def _candidates(block, query):
+        """Number of osm objects of a block that may match a block query"""
+
+        candidates = len(query["way_offsets"]) + len(query["rel_offsets"])
+        if query["nodes"]:
+            candidates += block["node_count"]
+        return candidates
+
     def geometry(self):
         """returns a Dataframe of point coordinates, osm ids as index"""
         cols = ["lon", "lat"]
@@ -83,6 +341,22 @@ class OSM(Frame):
         ix = np.searchsorted(self._geo_index, ids)
         return self._geo_coords[ix]
 
+    @collect("apply_changes")
+    def apply_changes(self, filepath):
+        """
+        Apply an OsmChange file (.osc or .osc.gz) over cached data
+
+        changes are kept in an overlay of created, modified and deleted objects,
+        used by coords, geometry and queries, new strings are added to strings
+        """
+
+        if self._changes is None:
+            self._changes = Changes()
+
+        deleted, ids, coords = self._changes.read(filepath, self.strings)
+        self._update_geometry_cache(np.concatenate([deleted, ids]), ids, coords)
+        self._members = None
+
     def map_to_strings(self, integers):
         """map an integer Series to a string Series from cached strings"""
 
@@ -92,46 +366,135 @@ class OSM(Frame):
     # ------------------------------------------------------
     # PBF parsing and caching
 
-    def _read_pbf(self):
+    def _read_pbf(self, f, previous=None, monitor=None):
+        """Parse blob headers and cache content of blocks read from a binary file"""
 
-        with open(self.filepath, "rb") as f:
+        reusable = self._reusable_blocks(previous)
+        stats = self._stats()
+        monitor = Monitor("open") if monitor is None else monitor
 
-            geoms = []
-            blocks = []
-            buf = f.read(4)
+        geoms = []
+        blocks = []
+        buf = f.read(4)
 
-            while len(buf) > 0:
+        while len(buf) > 0:
+            monitor.check(blocks, geoms)
+
+            with stats.stage("read"):
                 msg_len = unpack("!L", buf)[0]
                 datasize, blobtype = parse_header(f.read(msg_len))
                 cursor = f.tell()
+                blob_offset = cursor - msg_len - 4
+
+                blob = f.read(datasize)
+                if len(blob) < datasize:
+                    raise ValueError("Truncated pbf file, blob at {0} is incomplete".format(blob_offset))
+                st_offset, end_offset, compr, data = parse_blob(blob)
+            stats.add("read", blobs=1, bytes=4 + msg_len + datasize)
 
-                st_offset, end_offset, compr, data = parse_blob(f.read(datasize))
+            if blobtype == "OSMHeader":
+                feat, opt_feat = parse_blockheader(data, compr)
+                self._header = [blob_offset, cursor + datasize]
 
-                if blobtype == "OSMHeader":
-                    feat, opt_feat = parse_blockheader(data, compr)
+            elif blobtype == "OSMData":
+                with stats.stage("hash"):
+                    blob_hash = hashlib.blake2b(blob, digest_size=16).digest()
 
-                elif blobtype == "OSMData":
-                    pts, metadata = parse_cache_block(data, compr)
-                    metadata["start_offset"] = cursor + st_offset
-                    metadata["end_offset"] = cursor + end_offset
-                    metadata["compression"] = compr
-                    blocks.append(metadata)
+                res = None
+                if blob_hash in reusable:
+                    with stats.stage("reuse"):
+                        res = self._reuse_block(previous, reusable[blob_hash])
+                    stats.add("reuse", blocks=int(res is not None))
+                if res is None:
+                    with stats.stage("decompress"):
+                        raw = decompress(data, compr)
+                    stats.add("decompress", blocks=1, bytes=len(raw))
+                    with stats.stage("parse_cache"):
+                        res = parse_cache_block(raw, None)
+                    res[1]["raw_size"] = len(raw)
+                    stats.add("parse_cache", blocks=1, elements=_block_size(res[1]))
 
-                    if pts is not None:
-                        geoms.append(pts)
+                pts, metadata = res
+                metadata["start_offset"] = cursor + st_offset
+                metadata["end_offset"] = cursor + end_offset
+                metadata["blob_offset"] = blob_offset
+                metadata["blob_end"] = cursor + datasize
+                metadata["compression"] = compr
+                metadata["hash"] = blob_hash
+                if "bbox" not in metadata and pts is not None:
+                    metadata["bbox"] = _node_extent(pts, metadata)
+                blocks.append(metadata)
 
-                buf = f.read(4)
+                if pts is not None:
+                    geoms.append(pts)
+
+            monitor.step(4 + msg_len + datasize)
+            buf = f.read(4)
 
         return blocks, np.concatenate(geoms), feat, opt_feat
 
+    @staticmethod
+    def _reusable_blocks(previous):
+        """Map blob hashes to blocks of a previous OSM object without changes"""
+
+        if previous is None or previous._changes:
+            return {}
+        return {bl["hash"]: bl for bl in previous._blocks if "hash" in bl}
+
+    @staticmethod
+    def _reuse_block(previous, block):
+        """
+        Return points and metadata of a block cached in a previous OSM object,
+        or None if its nodes cannot be found in the previous geometry cache
+        """
+
+        metadata = dict(block)
+        metadata["stringtable"] = [previous.strings[i] for i in block["stringtable"]]
+
+        if block["node_count"] == 0:
+            return np.empty((0, 3), dtype="int64"), metadata
+
+        # nodes of a block are all nodes in its id range if no other block has ids in this range
+        st, end = np.array(block["node_range"], dtype="uint64")
+        st = np.searchsorted(previous._geo_index, st, side="left")
+        end = np.searchsorted(previous._geo_index, end, side="right")
+        if end - st != block["node_count"]:
+            return None
+
+        ids = previous._geo_index[st:end].astype("int64")
+        coords = previous._geo_coords[st:end].astype("float64") * 1000000000
+        return np.column_stack([ids, np.round(coords).astype("int64")]), metadata
+
     def _set_geometry_cache(self, geom):
         """set geometry index and coords attributes, ensure that geometry index is sorted"""
 
-        # sort by index and make contiguous array to speed searches
-        _geo = geom[geom[:, 0].argsort()]
+        # sort by index and make contiguous array to speed searches,
+        # nodes of files sorted by type then id are verified and kept in place
+        if "Sort.Type_then_ID" in self.optional_features and _is_sorted(geom[:, 0]):
+            _geo = geom
+        else:
+            _geo = geom[geom[:, 0].argsort()]
         self._geo_index = np.ascontiguousarray(_geo[:, 0], dtype="uint64")
         self._geo_coords = np.float32(_geo[:, 1:] / 1000000000)
 
+    def _update_geometry_cache(self, removed, ids, coords):
+        """remove and insert node coordinates, keep geometry index sorted"""
+
+        removed = np.unique(removed).astype("uint64")
+        ix = np.searchsorted(self._geo_index, removed)
+        found = ix < len(self._geo_index)
+        found[found] = self._geo_index[ix[found]] == removed[found]
+
+        index = np.delete(self._geo_index, ix[found])
+        geo_coords = np.delete(self._geo_coords, ix[found], axis=0)
+
+        order = np.argsort(ids)
+        ids = ids[order].astype("uint64")
+        ix = np.searchsorted(index, ids)
+
+        self._geo_index = np.insert(index, ix, ids)
+        self._geo_coords = np.insert(geo_coords, ix, coords[order], axis=0)
+
     def _set_string_cache(self, blocks):
         """Parse each block strings, create local map, return updated blocks"""
 
@@ -180,53 +543,933 @@ class OSM(Frame):
     # -------------------------------------------------------------
     # query and dataframe creation
 
-    def query(self, query):
-        """Query osm data based on Query Object into a DataFrame or GeoDataFrame"""
+    @collect("query")
+    def query(self, query, progress=None, cancel=None):
+        """
+        Query osm data based on Query Object into a DataFrame or GeoDataFrame,
+        or a DataFrame and a RaggedGeometry if query geometry is "ragged", never cached
+
+        Parameters
+        ----------
+        query : a Query object
+        progress : optional function called after each parsed block with "query",
+                   bytes read, total bytes, blocks parsed and total blocks to parse
+        cancel : optional CancelToken, the query stops at the next block when cancelled
+                 and raises a Cancelled exception
+        """
+
+        if self.cache is None or query.geometry == "ragged":
+            return self._query(query, progress, cancel)
+
+        stats = self._stats()
+
+        with stats.stage("cache"):
+            key = self.cache.key(query, self._identity())
+            res = self.cache.get(key)
+        stats.add("cache", hits=int(res is not None), misses=int(res is None))
+
+        if res is None:
+            res = self._query(query, progress, cancel)
+            with stats.stage("cache"):
+                self.cache.put(key, res)
+        return res
+
+    def _identity(self):
+        """Identity of file and applied changes files"""
+        identity = [file_identity(self.filepath)]
+        if self._changes is not None:
+            identity.extend([file_identity(f) for f in self._changes.files])
+        return identity
+
+    def _query(self, query, progress=None, cancel=None):
+        ids, tags, rels, ways = self._results(query, progress, cancel)
+
+        # member ways of relations in context blocks, e.g. of a shard
+        member_ways = None
+        if self._context_blocks:
+            mapper = self._string_to_pos(self.strings)
+            strmap = {k: mapper[k] for k in query.all_strings() if k in mapper}
+            member_ways = self._member_ways(query, strmap, self._context_blocks)
+
+        if query.geometry == "ragged":
+            return self.to_ragged(query, ids, tags, rels, ways, member_ways)
+        df = self.to_dataframe(query, ids, tags, rels, ways)
+        return _drop_ways(df, member_ways)
+
+    def _results(self, query, progress=None, cancel=None, blocks=None, changes=True):
+        """
+        Query results as ids, tags, rels and ways of relations arrays, in blocks or all blocks,
+        objects created or modified by applied changes are added only if changes is True
+        """
 
         mapper = self._string_to_pos(self.strings)
         strmap = {k: mapper[k] for k in query.all_strings() if k in mapper}
-        ids, tags, rels = self._process_queries(query, strmap)
+        ids, tags, rels = self._process_queries(query, strmap, progress, cancel, blocks, changes)
 
         # if query relations and must be expanded for geometry
         # query ways for expansions
         # TODO : repeat until all super-relations are expanded
 
-        if query.relations and query.geometry and len(rels[rels[:, 2] == 1]) > 0:
+        expand = query.relations and query.geometry and rels is not None
+        if expand and len(rels[rels[:, 2] == 1]) > 0:
             rel_ways = rels[rels[:, 2] == 1][:, 1].tolist()
-            query_r = Query(ways=True, way_ids=rel_ways, tags=False, keep_first=False)
-            ids_w, _, ways = self._process_queries(query_r, strmap)
 
-            ids_w = ids_w[:, 0]
-            ways[:, 0] = ids_w[ways[:, 0]]
-            ways = ways[:, 0:2]
+            # node ids of cached ways, not updated by changes
+            if self._way_refs is not None and not self._changes:
+                with self._stats().stage("way_refs"):
+                    ways = self._way_refs.lookup(np.unique(rel_ways))
+                return ids, tags, rels, ways
+
+            query_r = Query(
+                ways=True, way_ids=rel_ways, tags=False, keep_first=False, geometry=True
+            )
+            blocks = self._blocks + self._context_blocks
+            ids_w, _, ways = self._process_queries(query_r, strmap, progress, cancel, blocks)
 
         else:
             ways = None
 
-        return self.to_dataframe(query, ids, tags, rels, ways)
+        # member ways may be missing, e.g. in extracts
+        if ways is not None:
+            ways[:, 0] = ids_w[ways[:, 0], 0]
+            ways = ways[:, 0:2]
+
+        return ids, tags, rels, ways
+
+    def to_dask(self, query, partition_size=32 * 1024 * 1024):
+        """
+        Lazy dask DataFrame or GeoDataFrame of a query, with a partition by group of blocks,
+        requires dask, and dask-geopandas if the query has a geometry
+
+        partitions parse their blocks when computed, osmid divisions are known
+        if the file is sorted by type then id and the query has a single osm type,
+        the first partition is parsed to find column types, objects created or modified
+        by applied changes are in the first partition
+
+        Parameters
+        ----------
+        query : a Query object, with a list of tags or no tags
+        partition_size : maximum compressed size in bytes of the blocks of a partition
+        """
+
+        import dask.dataframe as dd
+
+        if query.geometry:
+            import dask_geopandas  # noqa: F401, register GeoDataFrame collections
+
+        if query.tags is None:
+            raise ValueError("Query tags must be a list to build partitions with the same columns")
+        if query.geometry == "ragged":
+            raise ValueError("Ragged geometry cannot be partitioned, use geometry=True")
+
+        mapper = self._string_to_pos(self.strings)
+        strmap = {k: mapper[k] for k in query.all_strings() if k in mapper}
+
+        groups, size = [], partition_size
+        for i, (bl, qu) in enumerate(zip(self._blocks, self._block_queries(query, strmap))):
+            if qu is None:
+                continue
+            block_size = bl["end_offset"] - bl["start_offset"]
+            if not groups or size + block_size > partition_size:
+                groups.append([])
+                size = 0
+            groups[-1].append(i)
+            size += block_size
+
+        # changes are added in a partition without blocks if no block has results
+        if not groups and self._changes:
+            groups.append([])
+        if not groups:
+            return dd.from_pandas(self.to_dataframe(query, None, None, None), npartitions=1)
+
+        member_ways = self._member_ways(query, strmap)
+        changes = [i == 0 for i in range(len(groups))]
+
+        # column types of the first partition with results
+        for group, chg in zip(groups, changes):
+            sample = self._partition(group, chg, query, None, member_ways)
+            if len(sample) > 0:
+                break
+        meta = sample.iloc[:0]
+        missing = [t for t in query.tags if t not in meta.columns]
+        meta = meta.assign(**{t: pd.Series(dtype=object) for t in missing})
+
+        return dd.from_map(
+            self._partition,
+            groups,
+            changes,
+            args=[query, meta, member_ways],
+            meta=meta,
+            divisions=self._divisions(query, groups),
+            label="osm-query",
+        )
+
+    def _partition(self, positions, changes, query, meta, member_ways=None):
+        """
+        DataFrame of query results in blocks at positions, with columns and types of meta,
+        without ways in member_ways, as member ways of relations in other partitions,
+        with objects created or modified by applied changes if changes is True
+        """
+
+        blocks = [self._blocks[i] for i in positions]
+        res = self._results(query, blocks=blocks, changes=changes)
+        df = _drop_ways(self.to_dataframe(query, *res), member_ways)
+        if meta is None:
+            return df
+        if len(df) == 0:
+            return meta.copy()
+
+        df = df.reindex(columns=meta.columns)
+        for col, dtype in meta.dtypes.items():
+            if col != "geometry" and df[col].dtype != dtype:
+                df[col] = df[col].astype(dtype)
+        return df
+
+    def _member_ways(self, query, strmap, blocks=None):
+        """
+        Ids of member ways of relations matching query in blocks, default to all blocks,
+        as dropped from ways of query results, None if query results keep member ways
+        """
+
+        if not (query.ways and query.relations and query.geometry):
+            return None
+
+        q = query.copy()
+        q.nodes, q.ways = False, False
+        _, _, rels = self._process_queries(q, strmap, blocks=blocks)
+        if rels is None:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(rels[rels[:, 2] == 1, 1])
+
+    def _divisions(self, query, groups):
+        """osmid divisions of partitions of block groups, None if unknown"""
+
+        types = [query.nodes, query.ways, query.relations]
+        if "Sort.Type_then_ID" not in self.optional_features or sum(types) != 1 or self._changes:
+            return None
+
+        osmtype = types.index(True)
+        ranges = [[_id_range(self._blocks[i], osmtype) for i in g] for g in groups]
+        if any(r is None for g in ranges for r in g):
+            return None
+        return tuple([int(g[0][0]) for g in ranges] + [int(ranges[-1][-1][1])])
+
+    @collect("cache_way_refs")
+    def cache_way_refs(self, sidecar=True):
+        """
+        Cache node ids of all ways, geometries of relations then use cached node ids
+        instead of parsing all ways again
+
+        Parameters
+        ----------
+        sidecar : if True, directory filepath + ".wayrefs", or a directory path,
+                  load the cache memory-mapped from the directory if saved for this file,
+                  else build the cache and save it in the directory,
+                  if False, build the cache in memory only
+        """
+
+        if self._changes:
+            raise ValueError("Way refs must be cached before applying changes")
+
+        if sidecar is True:
+            sidecar = self.filepath + ".wayrefs"
+
+        stats = self._stats()
+        identity = self._identity()
+
+        if sidecar:
+            with stats.stage("load"):
+                self._way_refs = WayRefs.load(sidecar, identity)
+            if self._way_refs is not None:
+                stats.add("load", ways=len(self._way_refs))
+                return None
+
+        query = Query(ways=True, tags=False, keep_first=False, geometry=True)
+        way_ids, counts, refs = [], [], []
+
+        with _BlockFiles(self.filepath) as files, stats.stage("build"):
+            for bl in self._blocks + self._context_blocks:
+                if len(bl["way_offsets"]) == 0:
+                    continue
+                ids, _, rels = self._parse_single(files, bl, query)
+                if ids is None or rels is None:
+                    continue
+                way_ids.append(ids[:, 0])
+                counts.append(np.bincount(rels[:, 0], minlength=len(ids)))
+                refs.append(rels[:, 1])
+            self._way_refs = WayRefs.from_parts(way_ids, counts, refs)
+        stats.add("build", ways=len(self._way_refs))
+
+        if sidecar:
+            with stats.stage("save"):
+                self._way_refs.save(sidecar, identity)
+
+    @collect("parent_relations")
+    def parent_relations(self, ids, type="way"):
+        """
+        DataFrame of relations with members in ids, e.g. bus routes using ways,
+        with memid, relid and role columns, a row by membership
+
+        the reverse index of relation members is built on first use
+
+        Parameters
+        ----------
+        ids : id or list of member ids
+        type : osm type of members, node, way or relation
+        """
+
+        osmtype = osm_type(type)
+        members = self._membership()
+        pos = members.lookup(np.atleast_1d(ids), osmtype)
+
+        df = pd.DataFrame(
+            {
+                "memid": members.memids[pos],
+                "relid": members.relids[pos],
+                "role": members.roles[pos],
+            }
+        )
+        df["role"] = self.map_to_strings(df["role"])
+        return df
+
+    def _membership(self):
+        """Reverse index of relation members, built on first use and after changes"""
+
+        if self._members is not None:
+            return self._members
+
+        q = Query(relations=True, tags=False, keep_first=False)
+        ids, _, rels = self._process_queries(q, {})
+
+        if rels is None:
+            rels = np.empty((0, 5), dtype=np.int64)
+            ids = np.empty((0, 2), dtype=np.int64)
+
+        with self._stats().stage("build_membership"):
+            self._members = Membership(ids[rels[:, 0], 0], rels[:, 2], rels[:, 1], rels[:, 3])
+        self._stats().add("build_membership", members=len(self._members))
+
+        return self._members
+
+    @collect("graph")
+    def graph(self, query, progress=None, cancel=None):
+        """
+        Build a routing Graph from the ways of a query, e.g. Query("highways")
+
+        graph nodes are way ends and nodes shared by many ways, edges are
+        topology segments with their length, way id and oneway direction,
+        merged through nodes where only two ways with the same oneway value meet end to end,
+        progress and cancel are used as in query
+        """
+
+        q = query.copy()
+        q.nodes, q.ways, q.relations = False, True, False
+        q.geometry = True
+        if q.tags is not None:
+            q.append_tags(["oneway", "junction"])
+
+        mapper = self._string_to_pos(self.strings)
+        strmap = {k: mapper[k] for k in q.all_strings() if k in mapper}
+        ids, tags, rels = self._process_queries(q, strmap, progress, cancel)
+
+        if rels is None:
+            raise ValueError("Query has no ways to build a graph")
+
+        # areas are not part of the graph
+        rels = rels[rels[:, 4] != 3]
+        direction = self._oneway(tags, len(ids), mapper)
+
+        with self._stats().stage("build_graph"):
+            graph = build_graph(rels[:, 1], rels[:, 0], ids[:, 0], direction, self.coords)
+        self._stats().add("build_graph", nodes=len(graph), edges=len(graph.indices))
+
+        return graph
+
+    @collect("extract")
+    def extract(self, query, filepath, referenced=True, progress=None, cancel=None):
+        """
+        Write osm objects matching a query to a new pbf file
+
+        blocks where all objects match the query are copied without decompression,
+        other blocks are re-encoded with matching objects, with all their tags and metadata,
+        objects created or modified by applied changes are written in a last block,
+        and the file is then not sorted by type and id
+
+        Parameters
+        ----------
+        query : a Query object, tags, geometry and topology parameters are ignored
+        filepath : path of the pbf file to write
+        referenced : if True, also write member nodes and ways of matching relations
+                     and nodes of matching and member ways
+        progress, cancel : progress function and CancelToken as in query,
+                           the file is removed if the extract is cancelled
+        """
+
+        q = query.copy()
+        q.tags = True
+        q.metadata = True
+        q.geometry = True
+        q.topology = False
+
+        mapper = self._string_to_pos(self.strings)
+        strmap = {k: mapper[k] for k in q.all_strings() if k in mapper}
+
+        queries = [q]
+        if referenced:
+            queries.extend(self._referenced_queries(q, strmap))
+
+        features = [f for f in self.features if f != "HistoricalInformation"]
+        optional_features = self.optional_features
+        superseded = None
+        if self._changes:
+            optional_features = [f for f in optional_features if not f.startswith("Sort.")]
+            superseded = [self._changes.superseded(t) for t in range(3)]
+
+        stats = self._stats()
+
+        selected = []
+        all_queries = [self._block_queries(x, strmap) for x in queries]
+        for bl, block_queries in zip(self._blocks, zip(*all_queries)):
+            block_queries = [qu for qu in block_queries if qu is not None]
+            if block_queries:
+                selected.append((bl, block_queries))
+        stats.add(
+            "block_query",
+            blocks_parsed=len(selected),
+            blocks_skipped=len(self._blocks) - len(selected),
+        )
+
+        total = sum(bl["end_offset"] - bl["start_offset"] for bl, _ in selected)
+        monitor = Monitor("extract", progress, cancel, total, len(selected))
+
+        try:
+            with _BlockFiles(self.filepath) as files, PBFWriter(
+                filepath, features, optional_features
+            ) as writer:
+                keep = self._extract_rows(files, selected)
+                for (bl, block_queries), rows in zip(selected, keep):
+                    monitor.check()
+                    self._extract_block(files[bl], bl, block_queries, writer, rows, superseded)
+                    monitor.step(bl["end_offset"] - bl["start_offset"])
+                if self._changes:
+                    self._extract_changes(queries, strmap, writer)
+        except Cancelled:
+            # do not leave a truncated pbf file
+            os.remove(filepath)
+            raise
+
+    def _extract_rows(self, files, selected):
+        """List of boolean masks of written rows of each selected block, None to write all rows"""
+        return [None] * len(selected)
+
+    def _extract_block(self, f, bl, block_queries, writer, keep=None, superseded=None):
+        """
+        Write objects of a block matching block queries, copy the block if all objects match,
+        only rows in the keep boolean mask are written if keep is not None, and objects
+        replaced or deleted by changes are dropped if superseded ids of each type are given
+        """
 
-    def _process_queries(self, query, strmap):
+        stats = self._stats()
+        data, ids, tags, rels = self._parse_extract_block(f, bl, block_queries)
+        if ids is None:
+            return None
+        if superseded is not None:
+            current = current_rows(ids, superseded)
+            keep = current if keep is None else keep & current
+        if keep is not None and not keep.all():
+            ids, tags, rels = drop_rows(ids, tags, rels, keep)
+            if len(ids) == 0:
+                return None
+
+        # copy blocks matching entirely
+        if len(ids) == _block_size(bl):
+            with stats.stage("write"):
+                f.seek(bl["blob_offset"])
+                blob = f.read(bl["blob_end"] - bl["blob_offset"])
+                writer.write_raw(blob)
+            stats.add("write", blocks_copied=1, bytes=len(blob))
+            return None
+
+        with stats.stage("write"):
+            coords = self._block_coords(data, None, ids)
+            writer.write_block(ids, tags, rels, self.strings, coords)
+        stats.add("write", blocks_encoded=1, elements=len(ids))
+
+    def _extract_changes(self, queries, strmap, writer):
+        """Write objects created or modified by applied changes matching queries in a block"""
+
+        stats = self._stats()
+        block = self._changes.block()
+
+        res = []
+        for query in queries:
+            qu = query.block_query(block, strmap)
+            if qu is not None:
+                res.extend(self._changes.results(qu, block))
+
+        ids, tags, rels = self._merge_results(res)
+        if ids is None:
+            return None
+
+        with stats.stage("write"):
+            ids, tags, rels = self._drop_duplicates(ids, tags, rels)
+            writer.write_block(ids, tags, rels, self.strings, self._changes.node_coords(ids))
+        stats.add("write", blocks_encoded=1, elements=len(ids))
+
+    def _parse_extract_block(self, f, bl, block_queries):
+        """Decompressed data and merged results of a block for block queries, without duplicates"""
+
+        stats = self._stats()
+
+        with stats.stage("read"):
+            data = self._read_block(f, bl)
+        stats.add("read", bytes=len(data))
+
+        with stats.stage("decompress"):
+            data = decompress(data, bl["compression"])
+        stats.add("decompress", bytes=len(data))
+
+        with stats.stage("parse_block"):
+            res = []
+            for qu in block_queries:
+                res.extend(parse_block(data, bl["stringtable"], qu, None))
+
+            ids, tags, rels = self._merge_results(res)
+            if ids is not None:
+                ids, tags, rels = self._drop_duplicates(ids, tags, rels)
+
+        return data, ids, tags, rels
+
+    def _referenced_queries(self, query, strmap):
+        """Queries of member ways of relations and nodes of ways matching query"""
 
-        queries = [query.block_query(bl, strmap) for bl in self._blocks]
         res = []
+        node_ids, way_ids = [], []
+
+        if query.relations:
+            q = query.copy()
+            q.nodes, q.ways = False, False
+            _, _, rels = self._process_queries(q, strmap)
+            if rels is not None:
+                node_ids.append(rels[rels[:, 2] == 0, 1])
+                way_ids.append(rels[rels[:, 2] == 1, 1])
 
-        with open(self.filepath, "rb") as f:
+        way_queries = []
+        if query.ways:
+            q = query.copy()
+            q.nodes, q.relations = False, False
+            way_queries.append(q)
+        if way_ids:
+            way_ids = np.unique(np.concatenate(way_ids)).tolist()
+            q = Query(ways=True, way_ids=way_ids, metadata=True, geometry=True, keep_first=False)
+            way_queries.append(q)
+            res.append(q)
 
-            for bl, qu in zip(self._blocks, queries):
+        for q in way_queries:
+            _, _, rels = self._process_queries(q, strmap)
+            if rels is not None:
+                node_ids.append(rels[:, 1])
+
+        if node_ids:
+            node_ids = np.unique(np.concatenate(node_ids)).tolist()
+            res.append(Query(nodes=True, node_ids=node_ids, metadata=True, keep_first=False))
+
+        return res
+
+    # -------------------------------------------------------------
+    # spatial shards
+
+    def shards(self, n=None, tile_size=None):
+        """
+        Split blocks in spatial shards to process a file on many workers
+
+        blocks are ordered on a Hilbert curve by the center of their extent,
+        blocks without known extent are in the first shard, open a shard with OSM.from_shard
+
+        Parameters
+        ----------
+        n : number of shards of similar compressed size
+        tile_size : size in degrees of square tiles, one shard by tile containing blocks
+
+        Returns
+        -------
+        list of shard dictionaries, serializable to json, with keys :
+            filepath : path of the pbf file
+            header : start and end byte positions of the header blob
+            blocks : list of start and end byte positions of the shard blobs
+            nodes : list of start and end byte positions of other node blobs
+                    with nodes of shard ways and relations, used for coordinates
+            ways : list of start and end byte positions of other blobs of member ways
+                   of shard relations, used for relation geometries
+            relations : list of start and end byte positions of other blobs of relations
+                        with member ways in the shard, member ways are dropped from results
+                        as in a query of the whole file
+            bbox : min lon, min lat, max lon, max lat of shard blocks, or None
+        """
+
+        if (n is None) == (tile_size is None):
+            raise ValueError("Set either n or tile_size")
+        # blocks of a collection store the path of their file
+        if any("filepath" in bl for bl in self._blocks):
+            raise ValueError("Shards of blocks of several files are not supported, use shards of each file")
+        if n is not None and n < 1:
+            raise ValueError("n must be a positive number of shards")
+
+        extents = self._block_extents()
+        known = np.array([e is not None for e in extents], dtype=bool)
+        centers = np.array(
+            [[(e[0] + e[2]) / 2, (e[1] + e[3]) / 2] if e is not None else [0, 0] for e in extents],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+
+        if n is not None:
+            keys = np.where(known, hilbert_index(centers[:, 0], centers[:, 1]), -1)
+            order = np.argsort(keys, kind="stable")
+            sizes = np.array([bl["blob_end"] - bl["blob_offset"] for bl in self._blocks])
+            groups = np.empty(len(order), dtype=np.int64)
+            groups[order] = split_by_size(sizes[order], n)
+        else:
+            keys = np.where(known, tile_keys(centers[:, 0], centers[:, 1], tile_size), -1)
+            groups = np.unique(keys, return_inverse=True)[1].ravel()
+
+        node_blocks = self._node_blocks()
+        hashes = {bl["hash"]: i for i, bl in enumerate(self._blocks)}
+        member_blocks = [
+            [hashes[h] for h in bl.get("member_blocks", []) if h in hashes] for bl in self._blocks
+        ]
+
+        shards = []
+        for group in np.unique(groups):
+            members = np.flatnonzero(groups == group).tolist()
+            owned = set(members)
+            bbox = union_extent([extents[i] for i in members])
+            ways = sorted(set(j for i in members for j in member_blocks[i]) - owned)
+            nodes = sorted(set(j for i in members + ways for j in node_blocks[i]) - owned)
+            relations = [
+                i for i, blocks in enumerate(member_blocks) if i not in owned and owned.intersection(blocks)
+            ]
+            shards.append(
+                {
+                    "filepath": self.filepath,
+                    "header": [int(x) for x in self._header],
+                    "blocks": [self._blob_range(i) for i in members],
+                    "nodes": [self._blob_range(i) for i in nodes],
+                    "ways": [self._blob_range(i) for i in ways],
+                    "relations": [self._blob_range(i) for i in relations],
+                    "bbox": bbox,
+                }
+            )
+        return shards
+
+    def _node_blocks(self):
+        """
+        List of positions of node blocks holding nodes of the ways and node members
+        of the relations of each block, found with the id index and stored in blocks
+        as hashes of node blocks
+        """
+
+        hashes = {bl["hash"]: i for i, bl in enumerate(self._blocks)}
+        missing = [bl for bl in self._blocks if "node_blocks" not in bl]
+
+        if missing:
+            way_q = Query(ways=True, tags=False, keep_first=False, geometry=True)
+            rel_q = Query(relations=True, tags=False, keep_first=False, geometry=True)
+
+            with _BlockFiles(self.filepath) as files:
+                for bl in missing:
+                    refs = []
+                    if len(bl["way_offsets"]) > 0:
+                        rels = self._parse_single(files, bl, way_q)[2]
+                        refs.append(rels[:, 1] if rels is not None else [])
+                    if len(bl["rel_offsets"]) > 0:
+                        rels = self._parse_single(files, bl, rel_q)[2]
+                        refs.append(rels[rels[:, 2] == 0, 1] if rels is not None else [])
+                    refs = np.concatenate(refs).astype(np.int64) if refs else []
+                    found = self._id_index.blocks_of_nodes(refs) if len(refs) > 0 else []
+                    bl["node_blocks"] = [self._blocks[i]["hash"] for i in sorted(found)]
+
+        return [[hashes[h] for h in bl["node_blocks"] if h in hashes] for bl in self._blocks]
+
+    def _blob_range(self, i):
+        bl = self._blocks[i]
+        return [int(bl["blob_offset"]), int(bl["blob_end"])]
+
+    def _block_extents(self):
+        """
+        List of extents of blocks (min lon, min lat, max lon, max lat) or None if unknown
+
+        extents of way and relation blocks are computed from the coordinates of their nodes
+        and of nodes of member ways, and stored in blocks with the hashes of blocks
+        of member ways of relations
+        """
+
+        missing = [bl for bl in self._blocks if bl.get("bbox") is None and _block_size(bl) > 0]
+        relations = [bl for bl in missing if len(bl["rel_offsets"]) > 0]
+        if not missing:
+            return [bl.get("bbox") for bl in self._blocks]
+
+        way_q = Query(ways=True, tags=False, keep_first=False, geometry=True)
+        rel_q = Query(relations=True, tags=False, keep_first=False, geometry=True)
+
+        with _BlockFiles(self.filepath) as files:
+
+            members = [self._parse_single(files, bl, rel_q)[2] for bl in relations]
+            member_ways = [rels[rels[:, 2] == 1, 1] for rels in members if rels is not None]
+            member_ways = np.unique(np.concatenate(member_ways)) if member_ways else []
+
+            # extents and block hashes of member ways
+            way_ids, way_extents, way_blocks = [], [], []
+            for bl in self._blocks:
+                if len(bl["way_offsets"]) == 0:
+                    continue
+                if bl.get("bbox") is not None and len(member_ways) == 0:
+                    continue
+                ids, _, rels = self._parse_single(files, bl, way_q)
+                if rels is None:
+                    continue
+                ext = self._row_extents(rels[:, 0], rels[:, 1], len(ids))
+                if bl.get("bbox") is None:
+                    bl["bbox"] = _union_rows(ext)
+                found = np.isin(ids[:, 0], member_ways)
+                way_ids.append(ids[found, 0])
+                way_extents.append(ext[found])
+                way_blocks.extend([bl["hash"]] * int(found.sum()))
+
+        if way_ids:
+            way_ids = np.concatenate(way_ids)
+            order = np.argsort(way_ids)
+            way_ids = way_ids[order]
+            way_extents = np.concatenate(way_extents)[order]
+            way_blocks = np.array(way_blocks, dtype=object)[order]
+
+        for bl, rels in zip(relations, members):
+            if rels is None:
+                continue
+            nodes, ways = rels[rels[:, 2] == 0, 1], rels[rels[:, 2] == 1, 1]
+
+            ext = [_union_rows(self._row_extents(np.zeros(len(nodes), dtype=np.int64), nodes, 1))]
+            bl["member_blocks"] = []
+            if len(way_ids) > 0:
+                ix = np.searchsorted(way_ids, ways)
+                ix = ix[ix < len(way_ids)]
+                ix = ix[np.isin(way_ids[ix], ways)]
+                ext.append(_union_rows(way_extents[ix]))
+                bl["member_blocks"] = list(dict.fromkeys(way_blocks[ix].tolist()))
+            ext.append(bl.get("bbox"))
+            bl["bbox"] = union_extent(ext)
+
+        return [bl.get("bbox") for bl in self._blocks]
+
+    def _parse_single(self, files, bl, query):
+        """Merged results of a single block"""
+        qu = query.block_query(bl, {})
+        if qu is None:
+            return None, None, None
+        data = decompress(self._read_block(files[bl], bl), bl["compression"])
+        return OSM._merge_results(parse_block(data, bl["stringtable"], qu, None) or [])
+
+    def _row_extents(self, rows, node_ids, length):
+        """Array of min lon, min lat, max lon, max lat of nodes of each row, nan if no known node"""
+
+        ext = np.full((length, 4), np.nan)
+        ix = np.searchsorted(self._geo_index, node_ids.astype("uint64"))
+        found = ix < len(self._geo_index)
+        found[found] = self._geo_index[ix[found]] == node_ids[found].astype("uint64")
+        if not found.any():
+            return ext
+
+        rows, coords = rows[found], self._geo_coords[ix[found]].astype(np.float64)
+        ext[:, :2], ext[:, 2:] = np.inf, -np.inf
+        np.minimum.at(ext[:, 0], rows, coords[:, 0])
+        np.minimum.at(ext[:, 1], rows, coords[:, 1])
+        np.maximum.at(ext[:, 2], rows, coords[:, 0])
+        np.maximum.at(ext[:, 3], rows, coords[:, 1])
+        ext[~np.isfinite(ext).all(axis=1)] = np.nan
+        return ext
+
+    @staticmethod
+    def _drop_duplicates(ids, tags, rels):
+        """Keep the first row of each osm object in results"""
+
+        _, first = np.unique(ids[:, :2], axis=0, return_index=True)
+        if len(first) == len(ids):
+            return ids, tags, rels
+
+        keep = np.full(len(ids), False)
+        keep[first] = True
+        return drop_rows(ids, tags, rels, keep)
+
+    @staticmethod
+    def _block_coords(data, compression, ids):
+        """Integer coordinates in nanodegrees of nodes in ids, parsed from block data"""
+
+        nodes = ids[:, 1] == 0
+        if not nodes.any():
+            return None
+
+        pts, _ = parse_cache_block(data, compression)
+        pts = pts[pts[:, 0].argsort()]
+
+        coords = np.zeros((len(ids), 2), dtype=np.int64)
+        coords[nodes] = pts[np.searchsorted(pts[:, 0], ids[nodes, 0]), 1:]
+        return coords
+
+    @staticmethod
+    def _oneway(tags, length, mapper):
+        """Array of way direction from oneway and junction tags, 1 forward, -1 backward, 0 both"""
+
+        direction = np.zeros(length, dtype=np.int8)
+        if tags is None:
+            return direction
+
+        def rows(key, values):
+            if key not in mapper:
+                return []
+            values = [mapper[v] for v in values if v in mapper]
+            mask = (tags[:, 1] == mapper[key]) & np.isin(tags[:, 2], values)
+            return tags[mask, 0]
+
+        direction[rows("junction", ONEWAY_JUNCTION)] = 1
+        direction[rows("oneway", ONEWAY_FORWARD)] = 1
+        direction[rows("oneway", ONEWAY_BACKWARD)] = -1
+        direction[rows("oneway", ONEWAY_NO)] = 0
+
+        return direction
+
+    def _process_queries(self, query, strmap, progress=None, cancel=None, blocks=None, changes=True):
+        """
+        Parse blocks matching query into merged ids, tags and rels arrays, blocks default to all blocks
+
+        objects replaced or deleted by applied changes are dropped, created or modified
+        objects are added if changes is True, progress is called after each parsed block,
+        a cancelled token stops parsing at the next block, releases partial results
+        and raises a Cancelled exception
+        """
+
+        stats = self._stats()
+        blocks = self._blocks if blocks is None else blocks
+
+        with stats.stage("block_query"):
+            queries = self._block_queries(query, strmap, blocks)
+        parsed = sum(qu is not None for qu in queries)
+        stats.add("block_query", blocks_parsed=parsed, blocks_skipped=len(queries) - parsed)
+
+        total = sum(
+            bl["end_offset"] - bl["start_offset"]
+            for bl, qu in zip(blocks, queries)
+            if qu is not None
+        )
+        monitor = Monitor("query", progress, cancel, total, parsed)
+        res = []
+
+        with _BlockFiles(self.filepath) as files:
+
+            for bl, qu in zip(blocks, queries):
 
                 if qu is None:
                     continue
+                monitor.check(res)
 
-                f.seek(bl["start_offset"])
-                data = f.read(bl["end_offset"])
-                comp = bl["compression"]
-                stmap = bl["stringtable"]
+                with stats.stage("read"):
+                    data = self._read_block(files[bl], bl)
+                stats.add("read", bytes=len(data))
+
+                with stats.stage("decompress"):
+                    data = decompress(data, bl["compression"])
+                stats.add("decompress", bytes=len(data))
+
+                with stats.stage("parse_block"):
+                    res_block = parse_block(data, bl["stringtable"], qu, None)
+                if stats is not NO_STATS:
+                    self._parse_stats(stats, bl, qu, res_block)
 
-                res_block = parse_block(data, stmap, qu, comp)
                 if res_block is not None:
                     res.extend(res_block)
+                monitor.step(bl["end_offset"] - bl["start_offset"])
+
+        if self._changes:
+            with stats.stage("overlay"):
+                res = self._apply_overlay(res, query, strmap, changes)
+
+        with stats.stage("merge_results"):
+            res = self._merge_results(res)
+        stats.add("merge_results", rows=0 if res[0] is None else len(res[0]))
+
+        return res
+
+    def _block_queries(self, query, strmap, blocks=None):
+        """
+        List of block queries of blocks, default to all blocks, None if a block has no results,
+        blocks without queried node or way ids are skipped with the id index
+        """
+
+        blocks = self._blocks if blocks is None else blocks
+        index = self._id_index
+        by_nodes = query.nodes and bool(query.node_set) and index is not None
+        by_ways = query.ways and bool(query.way_set) and index is not None
+
+        if not by_nodes and not by_ways:
+            return [query.block_query(bl, strmap) for bl in blocks]
+
+        default, elements = {}, {}
+        if by_nodes:
+            default["nodes"] = False
+            for i in index.blocks_of_nodes(query.node_set):
+                elements.setdefault(i, {})["nodes"] = True
+        if by_ways:
+            default["ways"] = []
+            for i, ways in index.way_offsets(query.way_set).items():
+                elements.setdefault(i, {})["ways"] = ways
 
-        return self._merge_results(res)
+        # positions of blocks in the index
+        position = {id(bl): i for i, bl in enumerate(self._blocks + self._context_blocks)}
+
+        res = []
+        for bl in blocks:
+            e = dict(default, **elements.get(position.get(id(bl)), {}))
+            res.append(query.block_query(bl, strmap, e))
+        return res
+
+    def _set_id_index(self):
+        """Index blocks of node and way ids, in blocks and context blocks"""
+        with self._stats().stage("id_index"):
+            self._id_index = IdIndex(self._blocks + self._context_blocks)
+
+    def _parse_stats(self, stats, block, query, res):
+        """Add kept and filtered elements of a parsed block to stats"""
+
+        candidates = self._candidates(block, query)
+        kept = sum(len(ids) for ids, _, _ in res) if res else 0
+        stats.add("parse_block", elements_kept=kept, elements_filtered=candidates - kept)
+
+    @staticmethod
+    def _read_block(f, block):
+        """Read the compressed data of a block"""
+        f.seek(block["start_offset"])
+        return f.read(block["end_offset"] - block["start_offset"])
+
+    def _apply_overlay(self, res, query, strmap, add=True):
+        """Drop results replaced or deleted by changes, add changed objects matching query if add"""
+
+        superseded = [self._changes.superseded(t) for t in range(3)]
+        new_res = []
+
+        for ids, tags, rels in res:
+            keep = current_rows(ids, superseded)
+            if not keep.all():
+                ids, tags, rels = drop_rows(ids, tags, rels, keep)
+            if len(ids) > 0:
+                new_res.append((ids, tags, rels))
+
+        if not add:
+            return new_res
+
+        block = self._changes.block()
+        qu = query.block_query(block, strmap)
+        if qu is not None:
+            new_res.extend(self._changes.results(qu, block))
+
+        return new_res
 
     @staticmethod
     def _merge_results(res):
@@ -256,4 +1499,65 @@ class OSM(Frame):
             rel_res = np.vstack(rel_res)
         else:
             rel_res = None
-        return np.vstack(id_res), tag_res, rel_res
\ No newline at end of file
+        return np.vstack(id_res), tag_res, rel_res
+
+
+def _node_extent(pts, block):
+    """Extent of nodes of a block without ways and relations, None if unknown"""
+
+    if len(pts) == 0 or len(block["way_offsets"]) > 0 or len(block["rel_offsets"]) > 0:
+        return None
+    lon, lat = pts[:, 1] / 1000000000, pts[:, 2] / 1000000000
+    return [float(lon.min()), float(lat.min()), float(lon.max()), float(lat.max())]
+
+
+def _union_rows(ext):
+    """Extent of an array of extents with nan rows, None if all rows are nan"""
+
+    return union_extent(ext[~np.isnan(ext).any(axis=1)].tolist())
+
+
+def _id_range(block, osmtype):
+    """Minimum and maximum ids of an osm type in a block, None if unknown"""
+
+    if osmtype == 0:
+        return block["node_range"] if block["node_count"] > 0 else None
+    return block.get("way_range" if osmtype == 1 else "rel_range")
+
+
+def _is_sorted(values):
+    """True if values are sorted in increasing order"""
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+def _block_size(block):
+    """Number of osm objects in a block"""
+    return block["node_count"] + len(block["way_offsets"]) + len(block["rel_offsets"])
+
+
+def _drop_ways(df, way_ids):
+    """DataFrame without ways with ids in way_ids, unchanged if way_ids is None"""
+    if way_ids is None or len(df) == 0:
+        return df
+    return df.loc[~((df["osmtype"] == 1) & df.index.isin(way_ids))]
+
+
+class _BlockFiles:
+    """Open pbf files of blocks, blocks of a collection store the path of their file"""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        for f in self.files.values():
+            f.close()
+
+    def __getitem__(self, block):
+        path = block.get("filepath", self.filepath)
+        if path not in self.files:
+            self.files[path] = open(path, "rb")
+        return self.files[path]
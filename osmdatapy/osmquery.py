@@ -23,10 +23,14 @@ class Query:
     node_ids, way_ids : get nodes and ways with ids in lists, if None, get all
     relation_type: optional relation type list of strings, cannot be an empty list
     metadata: extract versions, changeset and timestamp
-    geometry : if True, add a geometry column, may be point, linestring or polygon
+    geometry : if True, add a geometry column, may be point, linestring or polygon,
+               if "ragged", queries return a DataFrame and a RaggedGeometry
+               of coordinates and offsets arrays, without shapely geometries
     topology : if True, merge segments topologically, so that points belonging to many osm objects
                are the first or last point, add a source and target column
                topology = True must be associated with geometry = True and ways = True
+    since, until : optional datetime, string or numpy datetime64, keep objects
+                   with a timestamp in the interval, blocks outside the interval are skipped
     """
 
     def __init__(
@@ -44,8 +48,10 @@ class Query:
         way_ids: Optional[list] = None,
         relation_type: Optional[list] = None,
         metadata: bool = False,
-        geometry: bool = False,
+        geometry: Union[bool, str] = False,
         topology: bool = False,
+        since=None,
+        until=None,
     ):
 
         # simple parameters
@@ -63,6 +69,8 @@ class Query:
         # indirect parameters with validation or conversion
         self.node_set = node_ids
         self.way_set = way_ids
+        self.since = since
+        self.until = until
         self.topology = topology
         self.tags = tags
 
@@ -121,8 +129,11 @@ class Query:
     def node_set(self, value):
         if value is None:
             self._node_set = None
+            self._node_array = None
         else:
             self._node_set = set(value)
+            # sorted once for dense groups of all blocks
+            self._node_array = np.sort(np.fromiter(self._node_set, dtype="int64"))
 
     @property
     def way_set(self):
@@ -135,6 +146,39 @@ class Query:
         else:
             self._way_set = set(value)
 
+    @property
+    def since(self):
+        return self._since
+
+    @since.setter
+    def since(self, value):
+        self._since = self._to_seconds(value)
+
+    @property
+    def until(self):
+        return self._until
+
+    @until.setter
+    def until(self, value):
+        self._until = self._to_seconds(value)
+
+    @staticmethod
+    def _to_seconds(value):
+        """Convert a date to an integer of seconds since epoch or None"""
+        if value is None:
+            return None
+        return int(np.datetime64(value, "s").astype("int64"))
+
+    @property
+    def geometry(self):
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, value):
+        if isinstance(value, str) and value != "ragged":
+            raise ValueError("geometry must be True, False or 'ragged'")
+        self._geometry = value
+
     @property
     def topology(self):
         return self._topology
@@ -143,6 +187,8 @@ class Query:
     def topology(self, value):
         if value and not self.ways and not self.geometry:
             raise ValueError("Ways and geometry must be True when topology is True")
+        if value and self.geometry == "ragged":
+            raise ValueError("topology cannot be used with a ragged geometry")
         self._topology = value
 
     def _keep_excl_validator(self):
@@ -231,16 +277,23 @@ class Query:
         for k, v in IS_AREA.items():
             st.append(k)
             st.extend(v)
-        st.append("multipolygon")
+        st.extend(RELATION_AREA + RELATION_LINESTRING)
+        if self.relation_type is not None:
+            st.extend(self.relation_type)
 
         return set(st)
 
-    def block_query(self, block, strmap):
-        """Return a query dictionary for parsing functions matching a block string map, or None if query cannot have results for block"""
+    def block_query(self, block, strmap, elements=None):
+        """
+        Return a query dictionary for parsing functions matching a block string map, or None if query cannot have results for block
+
+        elements is an optional dictionary from an id index, "nodes" is False if the block
+        has no node in node_ids, "ways" are the positions in block way offsets of ways in way_ids
+        """
 
         # at least one matching osm type
         if not (
-            (self.nodes and block["node_offsets"])
+            (self.nodes and (block["node_offsets"] or block["dense_offsets"]))
             or (self.ways and block["way_offsets"])
             or (self.relations and block["rel_offsets"])
         ):
@@ -253,23 +306,26 @@ class Query:
         q = self.as_dict()
 
         q["get_tags"] = self._get_tags()
-        if q["get_tags"] and not strmap:
-            return None
 
         if not q["nodes"]:
             q["node_offsets"] = []
             q["dense_offsets"] = None
+        elif q["node_set"] and elements is not None and not elements.get("nodes", True):
+            q["node_offsets"] = []
+            q["dense_offsets"] = None
         elif q["node_set"]:
             q["node_offsets"] = [
                 n for n in block["node_offsets"] if n[0] in q["node_set"]
             ]
-            q["dense_offsets"] = block["dense_offsets"].copy()
+            q["dense_offsets"] = self._dense_offsets(block, q["node_array"])
         else:
             q["node_offsets"] = block["node_offsets"].copy()
             q["dense_offsets"] = block["dense_offsets"].copy()
 
         if not q["ways"]:
             q["way_offsets"] = []
+        elif q["way_set"] and elements is not None and "ways" in elements:
+            q["way_offsets"] = [block["way_offsets"][i] for i in elements["ways"]]
         elif q["way_set"]:
             q["way_offsets"] = [w for w in block["way_offsets"] if w[0] in q["way_set"]]
         else:
@@ -280,7 +336,17 @@ class Query:
         else:
             q["rel_offsets"] = block["rel_offsets"].copy()
 
-        q["tags"] = set(list(self._map_list(q["tags"], strmap)))
+        if not (q["node_offsets"] or q["dense_offsets"] or q["way_offsets"] or q["rel_offsets"]):
+            return None
+
+        # timestamps filter in block date granularity units
+        q["date_granularity"] = block["date_granularity"]
+        q["info"] = q["metadata"] or q["since"] is not None or q["until"] is not None
+        q["time_min"], q["time_max"] = self._block_time(block)
+        if not self._time_overlaps(block):
+            return None
+
+        q["tags"] = self._map_list(q["tags"], strmap)
         q["keep"], q["keep_all"] = self._map_filter(q["keep"], strmap)
         q["excl"], q["excl_all"] = self._map_filter(q["exclude"], strmap)
         q["must_tags"] = self._map_list(q["must_tags"], strmap)
@@ -309,19 +375,42 @@ class Query:
         q["rel_line"] = self._map_list(RELATION_LINESTRING, strmap)
 
         # if query cannot have results, return None
-        c1 = (q["must_tags"] is not None) and (
-            len(q["must_tags"]) != len(self.must_tags)
-        )
+        c1 = (q["must_tags"] is not None) and not q["must_tags"]
         c2 = (
             self.keep is not None
             and not q["keep"]
-            and (self.exclude is None or not self.keep_first)
+            and not q["keep_all"]
+            and self.keep_first
         )
         if c1 or c2:
             return None
         else:
             return q
 
+    def _time_overlaps(self, block):
+        """False if block timestamps are outside of since and until"""
+
+        if self.since is None and self.until is None:
+            return True
+        if block["time_range"] is None:
+            return False
+
+        st, end = block["time_range"]
+        return (self.since is None or end >= self.since) and (
+            self.until is None or st <= self.until
+        )
+
+    def _block_time(self, block):
+        """since and until in block date granularity units"""
+
+        gran = block["date_granularity"]
+        time_min, time_max = None, None
+        if self.since is not None:
+            time_min = -(-self.since * 1000 // gran)
+        if self.until is not None:
+            time_max = self.until * 1000 // gran
+        return time_min, time_max
+
     def _get_tags(self):
         return (
             self.tags is None
@@ -332,6 +421,25 @@ class Query:
             or self.geometry
         )
 
+    @staticmethod
+    def _dense_offsets(block, ids):
+        """
+        Offsets of dense groups of a block with an id range containing sorted ids,
+        empty groups have no id range and are skipped
+        """
+
+        ranges = block.get("dense_ranges")
+        if ranges is None:
+            return block["dense_offsets"].copy()
+
+        return [
+            offsets
+            for offsets, id_range in zip(block["dense_offsets"], ranges)
+            if id_range is not None
+            and np.searchsorted(ids, id_range[0], side="left")
+            < np.searchsorted(ids, id_range[1], side="right")
+        ]
+
     def as_dict(self):
         """Convert to a dictionary, add keep_keys and exclude_keys as list of tags for filter"""
         attrs = list(self.__dict__.keys())
@@ -368,9 +476,6 @@ class Query:
 
         res_any = {item for sublist in res_any for item in sublist}
 
-        if not res_any and len(res_all):
-            return None, None
-
         return res_any, res_all
 
     @staticmethod
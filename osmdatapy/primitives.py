@@ -8,9 +8,7 @@ from . import protobuf
 
 def node(block, length, query):
 
-    if query["metadata"]:
-        version, time, change = -1, 0, 0
-
+    version, time, change = -1, 0, 0
     meta, tags, tag_set, vals = None, None, None, None
     offset = 0
 
@@ -18,7 +16,7 @@ def node(block, length, query):
         key, offset, l = protobuf.pbf_key(block, offset)
 
         if key == 1:
-            elemid, offset = protobuf.scalar(block, offset, "int64")
+            elemid, offset = protobuf.scalar(block, offset, "sint64")
 
         elif key == 2 and query["get_tags"]:
             tags, offset = protobuf.packed(block, offset, l, "uint32")
@@ -28,11 +26,15 @@ def node(block, length, query):
 
         elif key == 3 and query["get_tags"]:
             vals, offset = protobuf.packed(block, offset, l, "uint32")
-        elif key == 4 and query["metadata"]:
+        elif key == 4 and query["info"]:
             offset, version, time, change = info(block, offset, l, query)
+        elif key == 8 or key == 9:
+            _, offset = protobuf.scalar(block, offset, "sint64")
         else:
             offset += l
 
+    if not _validate_time(query, time):
+        return None
     if not _validate_tagval(query, tag_set, tags, vals):
         return None
 
@@ -46,9 +48,7 @@ def node(block, length, query):
 
 def way(block, length, query):
 
-    if query["metadata"]:
-        version, time, change = -1, 0, 0
-
+    version, time, change = -1, 0, 0
     meta, tags, tag_set, vals, mems = None, None, None, None, None
     offset = 0
 
@@ -67,7 +67,7 @@ def way(block, length, query):
         elif key == 3 and query["get_tags"]:
             vals, offset = protobuf.packed(block, offset, l, "uint32")
 
-        elif key == 4 and query["metadata"]:
+        elif key == 4 and query["info"]:
             offset, version, time, change = info(block, offset, l, query)
 
         elif key == 8 and query["geometry"]:
@@ -79,22 +79,22 @@ def way(block, length, query):
         else:
             offset += l
 
+    if not _validate_time(query, time):
+        return None
     if not _validate_tagval(query, tag_set, tags, vals):
         return None
 
     if query["metadata"]:
         meta = [version, time, change]
+    area_tags = (tags, vals)
     tags, vals = _filter_tags(tags, vals, query["tags"])
-    geom = _way_geotype(query, tags, tag_set, vals, mems)
 
-    return elemid, meta, tags, vals, np.asarray(mems), geom
+    return elemid, meta, tags, vals, np.asarray(mems), area_tags
 
 
 def relation(block, length, query):
 
-    if query["metadata"]:
-        version, time, change = -1, 0, 0
-
+    version, time, change = -1, 0, 0
     meta, tags, tag_set, vals = None, None, None, None
     roles, mems, types = None, None, None
     offset = 0
@@ -114,7 +114,7 @@ def relation(block, length, query):
         elif key == 3 and query["get_tags"]:
             vals, offset = protobuf.packed(block, offset, l, "uint32")
 
-        elif key == 4 and query["metadata"]:
+        elif key == 4 and query["info"]:
             offset, version, time, change = info(block, offset, l, query)
 
         elif key == 8:
@@ -131,6 +131,8 @@ def relation(block, length, query):
         else:
             offset += l
 
+    if not _validate_time(query, time):
+        return None
     if not _validate_tagval(query, tag_set, tags, vals):
         return None
 
@@ -162,11 +164,12 @@ def info(block, offset, length, query):
         if key == 1:
             version, offset = protobuf.scalar(block, offset, "int32")
         elif key == 2:
-            time, offset = protobuf.scalar(block, offset, "int32")
+            time, offset = protobuf.scalar(block, offset, "int64")
         elif key == 3:
             change, offset = protobuf.scalar(block, offset, "int64")
         else:
-            offset += l
+            # all info fields are varints
+            _, offset = protobuf.scalar(block, offset, "int64")
 
     return message_offset, version, time, change
 
@@ -183,14 +186,26 @@ def _validate_tag(set_values, reference):
     return not set_values.isdisjoint(reference)
 
 
+def _validate_time(query, time):
+    if query["time_min"] is not None and time < query["time_min"]:
+        return False
+    if query["time_max"] is not None and time > query["time_max"]:
+        return False
+    return True
+
+
 def _validate_tagval(query, tagset, tags, values):
 
     # no tags and must have tags
     if tags is None and query["must_tags"] is not None:
         return False
 
-    # no tags or tags:values in query, or no tags
-    if query["no_tagval"] or tags is None or not tags:
+    # no tags or tags:values in query
+    if query["no_tagval"]:
+        return True
+
+    # no tags, only kept if keep is not first
+    if tags is None or not tags:
         return not query["keep_first"]
 
     packed = set()
@@ -216,7 +231,7 @@ def _validate_tagval(query, tagset, tags, values):
 
 
 def _filter_tags(tags, vals, qtags):
-    if tags is None or len(qtags) == 0:
+    if tags is None or (qtags is not None and len(qtags) == 0):
         return None, None
 
     if qtags is None:
@@ -231,58 +246,51 @@ def _filter_tags(tags, vals, qtags):
 # line or area heuristics
 
 
-def _is_area(query, tags, tag_set, vals):
-
-    if not query["is_area_key"]:
-        return False
-
-    pairs = set(
-        [(t << 32) | v for t, v in zip(tags, vals) if t in query["is_area_key"]]
-    )
-
-    if not query["area_no"] and not query["area_no"].isdisjoint(pairs):
-        return False
-
-    if not query["is_area"] and not query["is_area"].isdisjoint(pairs):
-        return True
-
-    if not query["not_area"] and not query["not_area"].isdisjoint(pairs):
-        return False
+def way_geotypes(query, refs, offsets, tagids, tags, vals):
+    """
+    Heuristic for area or linestring identification of a group of ways,
+    returns an array of 0 without geometry, 2 for linestrings and 3 for areas
 
-    q = query["is_area_key_any_value"]
-    return q and not q.isdisjoint(tag_set)
+    Parameters
+    ----------
+    query : a block query dictionary
+    refs, offsets : node ids of all ways and start positions in refs of each way, and end of refs
+    tagids, tags, vals : arrays of way position, tag and value of all tags of ways
+    """
 
+    counts = np.diff(offsets)
+    length = len(counts)
 
-def _is_closed_way(pts):
-    return pts[0] == pts[-1]
+    if not query["geometry"]:
+        return np.zeros(length, dtype="int64")
 
+    # first and last point must be identical, and at least 4 points
+    closed = counts >= 4
+    closed[closed] = refs[offsets[:-1][closed]] == refs[offsets[1:][closed] - 1]
 
-def _way_geotype(query, tags, tag_set, vals, refs):
-    """Heuristic for area or linestring identification of ways, returns 1 for linestrings, 3 for areas"""
+    geoms = np.full(length, 2, dtype="int64")
+    if closed.any() and query["area"] and len(tags) > 0:
+        geoms[closed & _is_area(query, tagids, tags, vals, length)] = 3
+    return geoms
 
-    # default to linestring if no tags
-    if tags is None or not query["geometry"] or not query["area"]:
-        return 0
 
-    len_refs = len(refs)
+def _is_area(query, tagids, tags, vals, length):
+    """Boolean array of ways with area tags or tag:value pairs"""
 
-    # not a geometry if just one point
-    if len_refs == 1:
-        return 0
+    packed = np.bitwise_or(np.left_shift(tags, 32), vals)
 
-    # linestring if 2 or 3 points
-    if len_refs < 4:
-        return 2
+    def any_tag(values, array):
+        if not values:
+            return np.full(length, False)
+        found = np.isin(array, np.fromiter(values, dtype="int64"))
+        return np.bincount(tagids[found], minlength=length) > 0
 
-    # first and last point must be identical
-    if not _is_closed_way(refs):
-        return 2
+    area_no = any_tag(query["area_no"], packed)
+    is_area = any_tag(query["is_area"], packed)
+    not_area = any_tag(query["not_area"], packed)
+    any_value = any_tag(query["is_area_key_any_value"], tags)
 
-    # area based on tags and values
-    if _is_area(query, tags, tag_set, vals):
-        return 3
-    else:
-        return 2
+    return ~area_no & (is_area | (~not_area & any_value))
 
 
 def _rel_geotype(query, vals, types):
@@ -0,0 +1,70 @@
+import threading
+
+
+class Cancelled(Exception):
+    """Raised when an OSM call is stopped by a CancelToken"""
+
+
+class CancelToken:
+    """
+    Cooperative cancellation of OSM calls, may be cancelled from another thread
+
+    calls check the token between blocks, stop at the next block boundary
+    and raise a Cancelled exception
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def reset(self):
+        self._event.clear()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class Monitor:
+    """
+    Report progress and check cancellation at block boundaries
+
+    Parameters
+    ----------
+    call : name of the call, passed to progress
+    progress : None or function called after each block with call, bytes done,
+               total bytes, blocks done and total blocks (None if unknown)
+    cancel : None or CancelToken
+    total_bytes, total_blocks : totals of the call
+    """
+
+    def __init__(self, call, progress=None, cancel=None, total_bytes=None, total_blocks=None):
+        self.call = call
+        self.progress = progress
+        self.cancel = cancel
+        self.total_bytes = total_bytes
+        self.total_blocks = total_blocks
+        self.bytes = 0
+        self.blocks = 0
+
+    def check(self, *caches):
+        """Clear caches and raise Cancelled if the call is cancelled"""
+
+        if self.cancel is None or not self.cancel.cancelled:
+            return None
+
+        for cache in caches:
+            cache.clear()
+        raise Cancelled("{0} cancelled after {1} blocks".format(self.call, self.blocks))
+
+    def step(self, nbytes):
+        """Add a processed block of nbytes bytes and report progress"""
+
+        self.bytes += nbytes
+        self.blocks += 1
+        if self.progress is not None:
+            self.progress(
+                self.call, self.bytes, self.total_bytes, self.blocks, self.total_blocks
+            )
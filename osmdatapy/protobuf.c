@@ -1708,7 +1708,7 @@ typedef struct __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_ctuple
 struct __pyx_ctuple_4libc_6stdint_int64_t__and_int;
 typedef struct __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_ctuple_4libc_6stdint_int64_t__and_int;
 
-/* "osmdatapy/protobuf.pyx":177
+/* "osmdatapy/protobuf.pyx":178
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_int32(const unsigned char[:] block, int offset, int length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -1720,7 +1720,7 @@ struct __pyx_ctuple_int__and_int {
   int f1;
 };
 
-/* "osmdatapy/protobuf.pyx":294
+/* "osmdatapy/protobuf.pyx":295
  * 
  * @cython.boundscheck(False)
  * cdef (int, int, int64_t) _pbf_key(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -1733,7 +1733,7 @@ struct __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t {
   int64_t f2;
 };
 
-/* "osmdatapy/protobuf.pyx":320
+/* "osmdatapy/protobuf.pyx":321
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _varint32(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -20261,9 +20261,10 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_4keyvals(CYTHON_UNUSED PyObject *
   __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_t_4;
   int64_t __pyx_t_5;
   int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_7;
   PyObject *__pyx_t_8 = NULL;
   PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -20473,7 +20474,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_4keyvals(CYTHON_UNUSED PyObject *
  *             cnter+=1
  *             key = False             # <<<<<<<<<<<<<<
  *         else:
- *             vals[cnter] = value
+ *             vals[cnter - 1] = value
  */
       __pyx_v_key = 0;
 
@@ -20490,19 +20491,20 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_4keyvals(CYTHON_UNUSED PyObject *
     /* "osmdatapy/protobuf.pyx":103
  *             key = False
  *         else:
- *             vals[cnter] = value             # <<<<<<<<<<<<<<
+ *             vals[cnter - 1] = value             # <<<<<<<<<<<<<<
  *             key=True
  * 
  */
     /*else*/ {
       __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (unlikely((__Pyx_SetItemInt(((PyObject *)__pyx_v_vals), __pyx_v_cnter, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0))) __PYX_ERR(0, 103, __pyx_L1_error)
+      __pyx_t_7 = (__pyx_v_cnter - 1);
+      if (unlikely((__Pyx_SetItemInt(((PyObject *)__pyx_v_vals), __pyx_t_7, __pyx_t_1, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0))) __PYX_ERR(0, 103, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
       /* "osmdatapy/protobuf.pyx":104
  *         else:
- *             vals[cnter] = value
+ *             vals[cnter - 1] = value
  *             key=True             # <<<<<<<<<<<<<<
  * 
  *     return ids[:cnter], keys[:cnter], vals[:cnter], offset
@@ -20524,26 +20526,26 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_4keyvals(CYTHON_UNUSED PyObject *
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = __Pyx_PyObject_GetSlice(((PyObject *)__pyx_v_keys), 0, __pyx_v_cnter, NULL, NULL, NULL, 0, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyObject_GetSlice(((PyObject *)__pyx_v_vals), 0, __pyx_v_cnter, NULL, NULL, NULL, 0, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_8 = PyInt_FromSsize_t(__pyx_v_offset); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetSlice(((PyObject *)__pyx_v_vals), 0, __pyx_v_cnter, NULL, NULL, NULL, 0, 1, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = PyTuple_New(4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __pyx_t_9 = PyInt_FromSsize_t(__pyx_v_offset); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = PyTuple_New(4); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
   __Pyx_GIVEREF(__pyx_t_1);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_2);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_2)) __PYX_ERR(0, 106, __pyx_L1_error);
-  __Pyx_GIVEREF(__pyx_t_7);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 2, __pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_2)) __PYX_ERR(0, 106, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_8);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 3, __pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_10, 2, __pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_9);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_10, 3, __pyx_t_9)) __PYX_ERR(0, 106, __pyx_L1_error);
   __pyx_t_1 = 0;
   __pyx_t_2 = 0;
-  __pyx_t_7 = 0;
   __pyx_t_8 = 0;
-  __pyx_r = __pyx_t_9;
   __pyx_t_9 = 0;
+  __pyx_r = __pyx_t_10;
+  __pyx_t_10 = 0;
   goto __pyx_L0;
 
   /* "osmdatapy/protobuf.pyx":74
@@ -20558,9 +20560,9 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_4keyvals(CYTHON_UNUSED PyObject *
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_8);
   __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
   __Pyx_AddTraceback("osmdatapy.protobuf.keyvals", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -21194,7 +21196,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 
 static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_block, Py_ssize_t __pyx_v_offset, PyObject *__pyx_v_scalar_type) {
   Py_ssize_t __pyx_v_new_offset;
-  int __pyx_v_val;
+  int64_t __pyx_v_val;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -21210,45 +21212,45 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("scalar", 1);
 
-  /* "osmdatapy/protobuf.pyx":138
- *     cdef int key, val
+  /* "osmdatapy/protobuf.pyx":139
+ *     cdef int64_t val
  * 
  *     if scalar_type == 'bool' or scalar_type == "int32" or scalar_type == "enum":             # <<<<<<<<<<<<<<
  *         val, new_offset = _varint32(block, offset)
  * 
  */
-  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_bool, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_bool, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 139, __pyx_L1_error)
   if (!__pyx_t_2) {
   } else {
     __pyx_t_1 = __pyx_t_2;
     goto __pyx_L4_bool_binop_done;
   }
-  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_int32, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_int32, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 139, __pyx_L1_error)
   if (!__pyx_t_2) {
   } else {
     __pyx_t_1 = __pyx_t_2;
     goto __pyx_L4_bool_binop_done;
   }
-  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_enum, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_enum, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 139, __pyx_L1_error)
   __pyx_t_1 = __pyx_t_2;
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "osmdatapy/protobuf.pyx":139
+    /* "osmdatapy/protobuf.pyx":140
  * 
  *     if scalar_type == 'bool' or scalar_type == "int32" or scalar_type == "enum":
  *         val, new_offset = _varint32(block, offset)             # <<<<<<<<<<<<<<
  * 
  *     elif scalar_type =="uint32":
  */
-    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__varint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 139, __pyx_L1_error)
+    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__varint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L1_error)
     __pyx_t_4 = __pyx_t_3.f0;
     __pyx_t_5 = __pyx_t_3.f1;
     __pyx_v_val = __pyx_t_4;
     __pyx_v_new_offset = __pyx_t_5;
 
-    /* "osmdatapy/protobuf.pyx":138
- *     cdef int key, val
+    /* "osmdatapy/protobuf.pyx":139
+ *     cdef int64_t val
  * 
  *     if scalar_type == 'bool' or scalar_type == "int32" or scalar_type == "enum":             # <<<<<<<<<<<<<<
  *         val, new_offset = _varint32(block, offset)
@@ -21257,30 +21259,30 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
     goto __pyx_L3;
   }
 
-  /* "osmdatapy/protobuf.pyx":141
+  /* "osmdatapy/protobuf.pyx":142
  *         val, new_offset = _varint32(block, offset)
  * 
  *     elif scalar_type =="uint32":             # <<<<<<<<<<<<<<
  *         val, new_offset = _varuint32(block, offset)
  * 
  */
-  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_uint32, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_uint32, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 142, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "osmdatapy/protobuf.pyx":142
+    /* "osmdatapy/protobuf.pyx":143
  * 
  *     elif scalar_type =="uint32":
  *         val, new_offset = _varuint32(block, offset)             # <<<<<<<<<<<<<<
  * 
  *     elif scalar_type== "int64":
  */
-    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__varuint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 142, __pyx_L1_error)
+    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__varuint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L1_error)
     __pyx_t_4 = __pyx_t_3.f0;
     __pyx_t_5 = __pyx_t_3.f1;
     __pyx_v_val = __pyx_t_4;
     __pyx_v_new_offset = __pyx_t_5;
 
-    /* "osmdatapy/protobuf.pyx":141
+    /* "osmdatapy/protobuf.pyx":142
  *         val, new_offset = _varint32(block, offset)
  * 
  *     elif scalar_type =="uint32":             # <<<<<<<<<<<<<<
@@ -21290,30 +21292,30 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
     goto __pyx_L3;
   }
 
-  /* "osmdatapy/protobuf.pyx":144
+  /* "osmdatapy/protobuf.pyx":145
  *         val, new_offset = _varuint32(block, offset)
  * 
  *     elif scalar_type== "int64":             # <<<<<<<<<<<<<<
  *         val, new_offset = _varint64(block, offset)
  * 
  */
-  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_int64, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 144, __pyx_L1_error)
+  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_int64, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 145, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "osmdatapy/protobuf.pyx":145
+    /* "osmdatapy/protobuf.pyx":146
  * 
  *     elif scalar_type== "int64":
  *         val, new_offset = _varint64(block, offset)             # <<<<<<<<<<<<<<
  * 
  *     elif scalar_type == "sint32":
  */
-    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__varint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 145, __pyx_L1_error)
+    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__varint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L1_error)
     __pyx_t_4 = __pyx_t_3.f0;
     __pyx_t_5 = __pyx_t_3.f1;
     __pyx_v_val = __pyx_t_4;
     __pyx_v_new_offset = __pyx_t_5;
 
-    /* "osmdatapy/protobuf.pyx":144
+    /* "osmdatapy/protobuf.pyx":145
  *         val, new_offset = _varuint32(block, offset)
  * 
  *     elif scalar_type== "int64":             # <<<<<<<<<<<<<<
@@ -21323,30 +21325,30 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
     goto __pyx_L3;
   }
 
-  /* "osmdatapy/protobuf.pyx":147
+  /* "osmdatapy/protobuf.pyx":148
  *         val, new_offset = _varint64(block, offset)
  * 
  *     elif scalar_type == "sint32":             # <<<<<<<<<<<<<<
  *         val, new_offset = _signedvarint32(block, offset)
  * 
  */
-  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_sint32, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_sint32, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 148, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "osmdatapy/protobuf.pyx":148
+    /* "osmdatapy/protobuf.pyx":149
  * 
  *     elif scalar_type == "sint32":
  *         val, new_offset = _signedvarint32(block, offset)             # <<<<<<<<<<<<<<
  * 
  *     elif scalar_type == "sint64":
  */
-    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__signedvarint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__signedvarint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 149, __pyx_L1_error)
     __pyx_t_4 = __pyx_t_3.f0;
     __pyx_t_5 = __pyx_t_3.f1;
     __pyx_v_val = __pyx_t_4;
     __pyx_v_new_offset = __pyx_t_5;
 
-    /* "osmdatapy/protobuf.pyx":147
+    /* "osmdatapy/protobuf.pyx":148
  *         val, new_offset = _varint64(block, offset)
  * 
  *     elif scalar_type == "sint32":             # <<<<<<<<<<<<<<
@@ -21356,30 +21358,30 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
     goto __pyx_L3;
   }
 
-  /* "osmdatapy/protobuf.pyx":150
+  /* "osmdatapy/protobuf.pyx":151
  *         val, new_offset = _signedvarint32(block, offset)
  * 
  *     elif scalar_type == "sint64":             # <<<<<<<<<<<<<<
  *         val, new_offset = _signedvarint64(block, offset)
  * 
  */
-  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_sint64, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 150, __pyx_L1_error)
+  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_v_scalar_type, __pyx_n_u_sint64, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 151, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "osmdatapy/protobuf.pyx":151
+    /* "osmdatapy/protobuf.pyx":152
  * 
  *     elif scalar_type == "sint64":
  *         val, new_offset = _signedvarint64(block, offset)             # <<<<<<<<<<<<<<
  * 
  *     else:
  */
-    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__signedvarint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 151, __pyx_L1_error)
+    __pyx_t_3 = __pyx_f_9osmdatapy_8protobuf__signedvarint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 152, __pyx_L1_error)
     __pyx_t_4 = __pyx_t_3.f0;
     __pyx_t_5 = __pyx_t_3.f1;
     __pyx_v_val = __pyx_t_4;
     __pyx_v_new_offset = __pyx_t_5;
 
-    /* "osmdatapy/protobuf.pyx":150
+    /* "osmdatapy/protobuf.pyx":151
  *         val, new_offset = _signedvarint32(block, offset)
  * 
  *     elif scalar_type == "sint64":             # <<<<<<<<<<<<<<
@@ -21389,7 +21391,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
     goto __pyx_L3;
   }
 
-  /* "osmdatapy/protobuf.pyx":154
+  /* "osmdatapy/protobuf.pyx":155
  * 
  *     else:
  *         val = 0             # <<<<<<<<<<<<<<
@@ -21401,7 +21403,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
   }
   __pyx_L3:;
 
-  /* "osmdatapy/protobuf.pyx":156
+  /* "osmdatapy/protobuf.pyx":157
  *         val = 0
  * 
  *     return val, new_offset             # <<<<<<<<<<<<<<
@@ -21409,16 +21411,16 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
  * def pack_tag_val(int64_t[:] tags, int64_t[:] vals):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_val); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_int64_t(__pyx_v_val); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 157, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = PyInt_FromSsize_t(__pyx_v_new_offset); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_t_7 = PyInt_FromSsize_t(__pyx_v_new_offset); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 157, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 157, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_GIVEREF(__pyx_t_6);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6)) __PYX_ERR(0, 156, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6)) __PYX_ERR(0, 157, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_7);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_7)) __PYX_ERR(0, 156, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_7)) __PYX_ERR(0, 157, __pyx_L1_error);
   __pyx_t_6 = 0;
   __pyx_t_7 = 0;
   __pyx_r = __pyx_t_8;
@@ -21446,7 +21448,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_10scalar(CYTHON_UNUSED PyObject *
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":158
+/* "osmdatapy/protobuf.pyx":159
  *     return val, new_offset
  * 
  * def pack_tag_val(int64_t[:] tags, int64_t[:] vals):             # <<<<<<<<<<<<<<
@@ -21510,7 +21512,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -21518,14 +21520,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("pack_tag_val", 1, 2, 2, 1); __PYX_ERR(0, 158, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pack_tag_val", 1, 2, 2, 1); __PYX_ERR(0, 159, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_tag_val") < 0)) __PYX_ERR(0, 158, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_tag_val") < 0)) __PYX_ERR(0, 159, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -21533,12 +21535,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
       values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
     }
-    __pyx_v_tags = __Pyx_PyObject_to_MemoryviewSlice_ds_nn_int64_t(values[0], PyBUF_WRITABLE); if (unlikely(!__pyx_v_tags.memview)) __PYX_ERR(0, 158, __pyx_L3_error)
-    __pyx_v_vals = __Pyx_PyObject_to_MemoryviewSlice_ds_nn_int64_t(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_vals.memview)) __PYX_ERR(0, 158, __pyx_L3_error)
+    __pyx_v_tags = __Pyx_PyObject_to_MemoryviewSlice_ds_nn_int64_t(values[0], PyBUF_WRITABLE); if (unlikely(!__pyx_v_tags.memview)) __PYX_ERR(0, 159, __pyx_L3_error)
+    __pyx_v_vals = __Pyx_PyObject_to_MemoryviewSlice_ds_nn_int64_t(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_vals.memview)) __PYX_ERR(0, 159, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pack_tag_val", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 158, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pack_tag_val", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 159, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -21590,19 +21592,19 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_12pack_tag_val(CYTHON_UNUSED PyOb
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_tag_val", 1);
 
-  /* "osmdatapy/protobuf.pyx":160
+  /* "osmdatapy/protobuf.pyx":161
  * def pack_tag_val(int64_t[:] tags, int64_t[:] vals):
  * 
  *     cdef list res = []             # <<<<<<<<<<<<<<
  *     cdef size_t l = len(tags)
  * 
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 161, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_res = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "osmdatapy/protobuf.pyx":161
+  /* "osmdatapy/protobuf.pyx":162
  * 
  *     cdef list res = []
  *     cdef size_t l = len(tags)             # <<<<<<<<<<<<<<
@@ -21612,7 +21614,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_12pack_tag_val(CYTHON_UNUSED PyOb
   __pyx_t_2 = __Pyx_MemoryView_Len(__pyx_v_tags); 
   __pyx_v_l = __pyx_t_2;
 
-  /* "osmdatapy/protobuf.pyx":163
+  /* "osmdatapy/protobuf.pyx":164
  *     cdef size_t l = len(tags)
  * 
  *     if l != len(vals):             # <<<<<<<<<<<<<<
@@ -21623,20 +21625,20 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_12pack_tag_val(CYTHON_UNUSED PyOb
   __pyx_t_3 = (__pyx_v_l != __pyx_t_2);
   if (unlikely(__pyx_t_3)) {
 
-    /* "osmdatapy/protobuf.pyx":164
+    /* "osmdatapy/protobuf.pyx":165
  * 
  *     if l != len(vals):
  *         raise ValueError("tags and vals must hase same length")             # <<<<<<<<<<<<<<
  * 
  *     for i in range(l):
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 164, __pyx_L1_error)
+    __PYX_ERR(0, 165, __pyx_L1_error)
 
-    /* "osmdatapy/protobuf.pyx":163
+    /* "osmdatapy/protobuf.pyx":164
  *     cdef size_t l = len(tags)
  * 
  *     if l != len(vals):             # <<<<<<<<<<<<<<
@@ -21645,7 +21647,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_12pack_tag_val(CYTHON_UNUSED PyOb
  */
   }
 
-  /* "osmdatapy/protobuf.pyx":166
+  /* "osmdatapy/protobuf.pyx":167
  *         raise ValueError("tags and vals must hase same length")
  * 
  *     for i in range(l):             # <<<<<<<<<<<<<<
@@ -21657,7 +21659,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_12pack_tag_val(CYTHON_UNUSED PyOb
   for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
     __pyx_v_i = __pyx_t_6;
 
-    /* "osmdatapy/protobuf.pyx":167
+    /* "osmdatapy/protobuf.pyx":168
  * 
  *     for i in range(l):
  *         res.append(tags[i] << 32 | vals[i])             # <<<<<<<<<<<<<<
@@ -21669,22 +21671,22 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_12pack_tag_val(CYTHON_UNUSED PyOb
     if (unlikely(__pyx_t_7 >= (size_t)__pyx_v_tags.shape[0])) __pyx_t_8 = 0;
     if (unlikely(__pyx_t_8 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_8);
-      __PYX_ERR(0, 167, __pyx_L1_error)
+      __PYX_ERR(0, 168, __pyx_L1_error)
     }
     __pyx_t_9 = __pyx_v_i;
     __pyx_t_8 = -1;
     if (unlikely(__pyx_t_9 >= (size_t)__pyx_v_vals.shape[0])) __pyx_t_8 = 0;
     if (unlikely(__pyx_t_8 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_8);
-      __PYX_ERR(0, 167, __pyx_L1_error)
+      __PYX_ERR(0, 168, __pyx_L1_error)
     }
-    __pyx_t_1 = __Pyx_PyInt_From_int64_t((((*((int64_t *) ( /* dim=0 */ (__pyx_v_tags.data + __pyx_t_7 * __pyx_v_tags.strides[0]) ))) << 32) | (*((int64_t *) ( /* dim=0 */ (__pyx_v_vals.data + __pyx_t_9 * __pyx_v_vals.strides[0]) ))))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyInt_From_int64_t((((*((int64_t *) ( /* dim=0 */ (__pyx_v_tags.data + __pyx_t_7 * __pyx_v_tags.strides[0]) ))) << 32) | (*((int64_t *) ( /* dim=0 */ (__pyx_v_vals.data + __pyx_t_9 * __pyx_v_vals.strides[0]) ))))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_res, __pyx_t_1); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 167, __pyx_L1_error)
+    __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_res, __pyx_t_1); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 168, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
 
-  /* "osmdatapy/protobuf.pyx":169
+  /* "osmdatapy/protobuf.pyx":170
  *         res.append(tags[i] << 32 | vals[i])
  * 
  *     return res             # <<<<<<<<<<<<<<
@@ -21696,7 +21698,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_12pack_tag_val(CYTHON_UNUSED PyOb
   __pyx_r = __pyx_v_res;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":158
+  /* "osmdatapy/protobuf.pyx":159
  *     return val, new_offset
  * 
  * def pack_tag_val(int64_t[:] tags, int64_t[:] vals):             # <<<<<<<<<<<<<<
@@ -21716,7 +21718,7 @@ static PyObject *__pyx_pf_9osmdatapy_8protobuf_12pack_tag_val(CYTHON_UNUSED PyOb
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":177
+/* "osmdatapy/protobuf.pyx":178
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_int32(const unsigned char[:] block, int offset, int length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -21740,7 +21742,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "osmdatapy/protobuf.pyx":183
+  /* "osmdatapy/protobuf.pyx":184
  *     """
  * 
  *     cdef int rep_offset = offset + length             # <<<<<<<<<<<<<<
@@ -21749,7 +21751,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
  */
   __pyx_v_rep_offset = (__pyx_v_offset + __pyx_v_length);
 
-  /* "osmdatapy/protobuf.pyx":184
+  /* "osmdatapy/protobuf.pyx":185
  * 
  *     cdef int rep_offset = offset + length
  *     cdef int size = 0             # <<<<<<<<<<<<<<
@@ -21758,7 +21760,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
  */
   __pyx_v_size = 0;
 
-  /* "osmdatapy/protobuf.pyx":186
+  /* "osmdatapy/protobuf.pyx":187
  *     cdef int size = 0
  *     cdef int64_t delta_val, value
  *     delta_val= 0             # <<<<<<<<<<<<<<
@@ -21767,7 +21769,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
  */
   __pyx_v_delta_val = 0;
 
-  /* "osmdatapy/protobuf.pyx":188
+  /* "osmdatapy/protobuf.pyx":189
  *     delta_val= 0
  * 
  *     while offset < rep_offset:             # <<<<<<<<<<<<<<
@@ -21778,20 +21780,20 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
     __pyx_t_1 = (__pyx_v_offset < __pyx_v_rep_offset);
     if (!__pyx_t_1) break;
 
-    /* "osmdatapy/protobuf.pyx":189
+    /* "osmdatapy/protobuf.pyx":190
  * 
  *     while offset < rep_offset:
  *         value, offset = _varint32(block, offset)             # <<<<<<<<<<<<<<
  *         if delta:
  *             value = delta_val + value
  */
-    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__varint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 189, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__varint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 190, __pyx_L1_error)
     __pyx_t_3 = __pyx_t_2.f0;
     __pyx_t_4 = __pyx_t_2.f1;
     __pyx_v_value = __pyx_t_3;
     __pyx_v_offset = __pyx_t_4;
 
-    /* "osmdatapy/protobuf.pyx":190
+    /* "osmdatapy/protobuf.pyx":191
  *     while offset < rep_offset:
  *         value, offset = _varint32(block, offset)
  *         if delta:             # <<<<<<<<<<<<<<
@@ -21800,7 +21802,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
  */
     if (__pyx_v_delta) {
 
-      /* "osmdatapy/protobuf.pyx":191
+      /* "osmdatapy/protobuf.pyx":192
  *         value, offset = _varint32(block, offset)
  *         if delta:
  *             value = delta_val + value             # <<<<<<<<<<<<<<
@@ -21809,7 +21811,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
  */
       __pyx_v_value = (__pyx_v_delta_val + __pyx_v_value);
 
-      /* "osmdatapy/protobuf.pyx":192
+      /* "osmdatapy/protobuf.pyx":193
  *         if delta:
  *             value = delta_val + value
  *             delta_val = value             # <<<<<<<<<<<<<<
@@ -21818,7 +21820,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
  */
       __pyx_v_delta_val = __pyx_v_value;
 
-      /* "osmdatapy/protobuf.pyx":190
+      /* "osmdatapy/protobuf.pyx":191
  *     while offset < rep_offset:
  *         value, offset = _varint32(block, offset)
  *         if delta:             # <<<<<<<<<<<<<<
@@ -21827,7 +21829,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
  */
     }
 
-    /* "osmdatapy/protobuf.pyx":193
+    /* "osmdatapy/protobuf.pyx":194
  *             value = delta_val + value
  *             delta_val = value
  *         arr[size] = value             # <<<<<<<<<<<<<<
@@ -21837,7 +21839,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
     __pyx_t_5 = __pyx_v_size;
     *((int64_t *) ( /* dim=0 */ (__pyx_v_arr.data + __pyx_t_5 * __pyx_v_arr.strides[0]) )) = __pyx_v_value;
 
-    /* "osmdatapy/protobuf.pyx":194
+    /* "osmdatapy/protobuf.pyx":195
  *             delta_val = value
  *         arr[size] = value
  *         size+=1             # <<<<<<<<<<<<<<
@@ -21847,7 +21849,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
     __pyx_v_size = (__pyx_v_size + 1);
   }
 
-  /* "osmdatapy/protobuf.pyx":196
+  /* "osmdatapy/protobuf.pyx":197
  *         size+=1
  * 
  *     return offset, size             # <<<<<<<<<<<<<<
@@ -21859,7 +21861,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
   __pyx_r = __pyx_t_6;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":177
+  /* "osmdatapy/protobuf.pyx":178
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_int32(const unsigned char[:] block, int offset, int length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -21875,7 +21877,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int32(__Pyx
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":200
+/* "osmdatapy/protobuf.pyx":201
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_uint32(const unsigned char[:] block, int offset, int length, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -21898,7 +21900,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_uint32(__Py
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "osmdatapy/protobuf.pyx":206
+  /* "osmdatapy/protobuf.pyx":207
  *     """
  * 
  *     cdef int rep_offset = offset + length             # <<<<<<<<<<<<<<
@@ -21907,7 +21909,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_uint32(__Py
  */
   __pyx_v_rep_offset = (__pyx_v_offset + __pyx_v_length);
 
-  /* "osmdatapy/protobuf.pyx":207
+  /* "osmdatapy/protobuf.pyx":208
  * 
  *     cdef int rep_offset = offset + length
  *     cdef int size = 0             # <<<<<<<<<<<<<<
@@ -21916,7 +21918,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_uint32(__Py
  */
   __pyx_v_size = 0;
 
-  /* "osmdatapy/protobuf.pyx":210
+  /* "osmdatapy/protobuf.pyx":211
  *     cdef int64_t value
  * 
  *     while offset < rep_offset:             # <<<<<<<<<<<<<<
@@ -21927,20 +21929,20 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_uint32(__Py
     __pyx_t_1 = (__pyx_v_offset < __pyx_v_rep_offset);
     if (!__pyx_t_1) break;
 
-    /* "osmdatapy/protobuf.pyx":211
+    /* "osmdatapy/protobuf.pyx":212
  * 
  *     while offset < rep_offset:
  *         value, offset = _varuint32(block, offset)             # <<<<<<<<<<<<<<
  *         arr[size] = value
  *         size+=1
  */
-    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__varuint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 211, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__varuint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 212, __pyx_L1_error)
     __pyx_t_3 = __pyx_t_2.f0;
     __pyx_t_4 = __pyx_t_2.f1;
     __pyx_v_value = __pyx_t_3;
     __pyx_v_offset = __pyx_t_4;
 
-    /* "osmdatapy/protobuf.pyx":212
+    /* "osmdatapy/protobuf.pyx":213
  *     while offset < rep_offset:
  *         value, offset = _varuint32(block, offset)
  *         arr[size] = value             # <<<<<<<<<<<<<<
@@ -21950,7 +21952,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_uint32(__Py
     __pyx_t_5 = __pyx_v_size;
     *((int64_t *) ( /* dim=0 */ (__pyx_v_arr.data + __pyx_t_5 * __pyx_v_arr.strides[0]) )) = __pyx_v_value;
 
-    /* "osmdatapy/protobuf.pyx":213
+    /* "osmdatapy/protobuf.pyx":214
  *         value, offset = _varuint32(block, offset)
  *         arr[size] = value
  *         size+=1             # <<<<<<<<<<<<<<
@@ -21960,7 +21962,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_uint32(__Py
     __pyx_v_size = (__pyx_v_size + 1);
   }
 
-  /* "osmdatapy/protobuf.pyx":215
+  /* "osmdatapy/protobuf.pyx":216
  *         size+=1
  * 
  *     return offset, size             # <<<<<<<<<<<<<<
@@ -21972,7 +21974,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_uint32(__Py
   __pyx_r = __pyx_t_6;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":200
+  /* "osmdatapy/protobuf.pyx":201
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_uint32(const unsigned char[:] block, int offset, int length, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -21988,7 +21990,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_uint32(__Py
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":219
+/* "osmdatapy/protobuf.pyx":220
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_int64(const unsigned char[:] block, int offset, int length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -22012,7 +22014,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "osmdatapy/protobuf.pyx":225
+  /* "osmdatapy/protobuf.pyx":226
  *     """
  * 
  *     cdef int rep_offset = offset + length             # <<<<<<<<<<<<<<
@@ -22021,7 +22023,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
  */
   __pyx_v_rep_offset = (__pyx_v_offset + __pyx_v_length);
 
-  /* "osmdatapy/protobuf.pyx":226
+  /* "osmdatapy/protobuf.pyx":227
  * 
  *     cdef int rep_offset = offset + length
  *     cdef int size = 0             # <<<<<<<<<<<<<<
@@ -22030,7 +22032,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
  */
   __pyx_v_size = 0;
 
-  /* "osmdatapy/protobuf.pyx":229
+  /* "osmdatapy/protobuf.pyx":230
  *     cdef int64_t delta_val, value
  * 
  *     delta_val = 0             # <<<<<<<<<<<<<<
@@ -22039,7 +22041,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
  */
   __pyx_v_delta_val = 0;
 
-  /* "osmdatapy/protobuf.pyx":231
+  /* "osmdatapy/protobuf.pyx":232
  *     delta_val = 0
  * 
  *     while offset < rep_offset:             # <<<<<<<<<<<<<<
@@ -22050,20 +22052,20 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
     __pyx_t_1 = (__pyx_v_offset < __pyx_v_rep_offset);
     if (!__pyx_t_1) break;
 
-    /* "osmdatapy/protobuf.pyx":232
+    /* "osmdatapy/protobuf.pyx":233
  * 
  *     while offset < rep_offset:
  *         value, offset = _varint64(block, offset)             # <<<<<<<<<<<<<<
  *         if delta:
  *             value = delta_val + value
  */
-    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__varint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 232, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__varint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 233, __pyx_L1_error)
     __pyx_t_3 = __pyx_t_2.f0;
     __pyx_t_4 = __pyx_t_2.f1;
     __pyx_v_value = __pyx_t_3;
     __pyx_v_offset = __pyx_t_4;
 
-    /* "osmdatapy/protobuf.pyx":233
+    /* "osmdatapy/protobuf.pyx":234
  *     while offset < rep_offset:
  *         value, offset = _varint64(block, offset)
  *         if delta:             # <<<<<<<<<<<<<<
@@ -22072,7 +22074,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
  */
     if (__pyx_v_delta) {
 
-      /* "osmdatapy/protobuf.pyx":234
+      /* "osmdatapy/protobuf.pyx":235
  *         value, offset = _varint64(block, offset)
  *         if delta:
  *             value = delta_val + value             # <<<<<<<<<<<<<<
@@ -22081,7 +22083,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
  */
       __pyx_v_value = (__pyx_v_delta_val + __pyx_v_value);
 
-      /* "osmdatapy/protobuf.pyx":235
+      /* "osmdatapy/protobuf.pyx":236
  *         if delta:
  *             value = delta_val + value
  *             delta_val = value             # <<<<<<<<<<<<<<
@@ -22090,7 +22092,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
  */
       __pyx_v_delta_val = __pyx_v_value;
 
-      /* "osmdatapy/protobuf.pyx":233
+      /* "osmdatapy/protobuf.pyx":234
  *     while offset < rep_offset:
  *         value, offset = _varint64(block, offset)
  *         if delta:             # <<<<<<<<<<<<<<
@@ -22099,7 +22101,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
  */
     }
 
-    /* "osmdatapy/protobuf.pyx":236
+    /* "osmdatapy/protobuf.pyx":237
  *             value = delta_val + value
  *             delta_val = value
  *         arr[size] = value             # <<<<<<<<<<<<<<
@@ -22109,7 +22111,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
     __pyx_t_5 = __pyx_v_size;
     *((int64_t *) ( /* dim=0 */ (__pyx_v_arr.data + __pyx_t_5 * __pyx_v_arr.strides[0]) )) = __pyx_v_value;
 
-    /* "osmdatapy/protobuf.pyx":237
+    /* "osmdatapy/protobuf.pyx":238
  *             delta_val = value
  *         arr[size] = value
  *         size+=1             # <<<<<<<<<<<<<<
@@ -22119,7 +22121,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
     __pyx_v_size = (__pyx_v_size + 1);
   }
 
-  /* "osmdatapy/protobuf.pyx":239
+  /* "osmdatapy/protobuf.pyx":240
  *         size+=1
  * 
  *     return offset, size             # <<<<<<<<<<<<<<
@@ -22131,7 +22133,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
   __pyx_r = __pyx_t_6;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":219
+  /* "osmdatapy/protobuf.pyx":220
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_int64(const unsigned char[:] block, int offset, int length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -22147,7 +22149,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_int64(__Pyx
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":243
+/* "osmdatapy/protobuf.pyx":244
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_signedint32(const unsigned char[:] block, int offset, int length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -22171,7 +22173,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "osmdatapy/protobuf.pyx":249
+  /* "osmdatapy/protobuf.pyx":250
  *     """
  * 
  *     cdef int rep_offset = offset + length             # <<<<<<<<<<<<<<
@@ -22180,7 +22182,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
  */
   __pyx_v_rep_offset = (__pyx_v_offset + __pyx_v_length);
 
-  /* "osmdatapy/protobuf.pyx":250
+  /* "osmdatapy/protobuf.pyx":251
  * 
  *     cdef int rep_offset = offset + length
  *     cdef int size = 0             # <<<<<<<<<<<<<<
@@ -22189,7 +22191,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
  */
   __pyx_v_size = 0;
 
-  /* "osmdatapy/protobuf.pyx":253
+  /* "osmdatapy/protobuf.pyx":254
  *     cdef int64_t delta_val, value
  * 
  *     delta_val = 0             # <<<<<<<<<<<<<<
@@ -22198,7 +22200,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
  */
   __pyx_v_delta_val = 0;
 
-  /* "osmdatapy/protobuf.pyx":255
+  /* "osmdatapy/protobuf.pyx":256
  *     delta_val = 0
  * 
  *     while offset < rep_offset:             # <<<<<<<<<<<<<<
@@ -22209,20 +22211,20 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
     __pyx_t_1 = (__pyx_v_offset < __pyx_v_rep_offset);
     if (!__pyx_t_1) break;
 
-    /* "osmdatapy/protobuf.pyx":256
+    /* "osmdatapy/protobuf.pyx":257
  * 
  *     while offset < rep_offset:
  *         value, offset = _signedvarint32(block, offset)             # <<<<<<<<<<<<<<
  *         if delta:
  *             value = delta_val + value
  */
-    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__signedvarint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 256, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__signedvarint32(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 257, __pyx_L1_error)
     __pyx_t_3 = __pyx_t_2.f0;
     __pyx_t_4 = __pyx_t_2.f1;
     __pyx_v_value = __pyx_t_3;
     __pyx_v_offset = __pyx_t_4;
 
-    /* "osmdatapy/protobuf.pyx":257
+    /* "osmdatapy/protobuf.pyx":258
  *     while offset < rep_offset:
  *         value, offset = _signedvarint32(block, offset)
  *         if delta:             # <<<<<<<<<<<<<<
@@ -22231,7 +22233,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
  */
     if (__pyx_v_delta) {
 
-      /* "osmdatapy/protobuf.pyx":258
+      /* "osmdatapy/protobuf.pyx":259
  *         value, offset = _signedvarint32(block, offset)
  *         if delta:
  *             value = delta_val + value             # <<<<<<<<<<<<<<
@@ -22240,7 +22242,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
  */
       __pyx_v_value = (__pyx_v_delta_val + __pyx_v_value);
 
-      /* "osmdatapy/protobuf.pyx":259
+      /* "osmdatapy/protobuf.pyx":260
  *         if delta:
  *             value = delta_val + value
  *             delta_val = value             # <<<<<<<<<<<<<<
@@ -22249,7 +22251,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
  */
       __pyx_v_delta_val = __pyx_v_value;
 
-      /* "osmdatapy/protobuf.pyx":257
+      /* "osmdatapy/protobuf.pyx":258
  *     while offset < rep_offset:
  *         value, offset = _signedvarint32(block, offset)
  *         if delta:             # <<<<<<<<<<<<<<
@@ -22258,7 +22260,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
  */
     }
 
-    /* "osmdatapy/protobuf.pyx":260
+    /* "osmdatapy/protobuf.pyx":261
  *             value = delta_val + value
  *             delta_val = value
  *         arr[size] = value             # <<<<<<<<<<<<<<
@@ -22268,7 +22270,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
     __pyx_t_5 = __pyx_v_size;
     *((int64_t *) ( /* dim=0 */ (__pyx_v_arr.data + __pyx_t_5 * __pyx_v_arr.strides[0]) )) = __pyx_v_value;
 
-    /* "osmdatapy/protobuf.pyx":261
+    /* "osmdatapy/protobuf.pyx":262
  *             delta_val = value
  *         arr[size] = value
  *         size+=1             # <<<<<<<<<<<<<<
@@ -22278,7 +22280,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
     __pyx_v_size = (__pyx_v_size + 1);
   }
 
-  /* "osmdatapy/protobuf.pyx":263
+  /* "osmdatapy/protobuf.pyx":264
  *         size+=1
  * 
  *     return offset, size             # <<<<<<<<<<<<<<
@@ -22290,7 +22292,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
   __pyx_r = __pyx_t_6;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":243
+  /* "osmdatapy/protobuf.pyx":244
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_signedint32(const unsigned char[:] block, int offset, int length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -22306,7 +22308,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint32
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":267
+/* "osmdatapy/protobuf.pyx":268
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_signedint64(const unsigned char[:] block, Py_ssize_t offset, Py_ssize_t length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -22330,7 +22332,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "osmdatapy/protobuf.pyx":273
+  /* "osmdatapy/protobuf.pyx":274
  *     """
  * 
  *     cdef Py_ssize_t rep_offset = offset + length             # <<<<<<<<<<<<<<
@@ -22339,7 +22341,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
  */
   __pyx_v_rep_offset = (__pyx_v_offset + __pyx_v_length);
 
-  /* "osmdatapy/protobuf.pyx":274
+  /* "osmdatapy/protobuf.pyx":275
  * 
  *     cdef Py_ssize_t rep_offset = offset + length
  *     cdef Py_ssize_t size = 0             # <<<<<<<<<<<<<<
@@ -22348,7 +22350,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
  */
   __pyx_v_size = 0;
 
-  /* "osmdatapy/protobuf.pyx":277
+  /* "osmdatapy/protobuf.pyx":278
  *     cdef int64_t delta_val, value
  * 
  *     delta_val = 0             # <<<<<<<<<<<<<<
@@ -22357,7 +22359,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
  */
   __pyx_v_delta_val = 0;
 
-  /* "osmdatapy/protobuf.pyx":279
+  /* "osmdatapy/protobuf.pyx":280
  *     delta_val = 0
  * 
  *     while offset < rep_offset:             # <<<<<<<<<<<<<<
@@ -22368,20 +22370,20 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
     __pyx_t_1 = (__pyx_v_offset < __pyx_v_rep_offset);
     if (!__pyx_t_1) break;
 
-    /* "osmdatapy/protobuf.pyx":280
+    /* "osmdatapy/protobuf.pyx":281
  * 
  *     while offset < rep_offset:
  *         value, offset = _signedvarint64(block, offset)             # <<<<<<<<<<<<<<
  *         if delta:
  *             value = delta_val + value
  */
-    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__signedvarint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_9osmdatapy_8protobuf__signedvarint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 281, __pyx_L1_error)
     __pyx_t_3 = __pyx_t_2.f0;
     __pyx_t_4 = __pyx_t_2.f1;
     __pyx_v_value = __pyx_t_3;
     __pyx_v_offset = __pyx_t_4;
 
-    /* "osmdatapy/protobuf.pyx":281
+    /* "osmdatapy/protobuf.pyx":282
  *     while offset < rep_offset:
  *         value, offset = _signedvarint64(block, offset)
  *         if delta:             # <<<<<<<<<<<<<<
@@ -22390,7 +22392,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
  */
     if (__pyx_v_delta) {
 
-      /* "osmdatapy/protobuf.pyx":282
+      /* "osmdatapy/protobuf.pyx":283
  *         value, offset = _signedvarint64(block, offset)
  *         if delta:
  *             value = delta_val + value             # <<<<<<<<<<<<<<
@@ -22399,7 +22401,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
  */
       __pyx_v_value = (__pyx_v_delta_val + __pyx_v_value);
 
-      /* "osmdatapy/protobuf.pyx":283
+      /* "osmdatapy/protobuf.pyx":284
  *         if delta:
  *             value = delta_val + value
  *             delta_val = value             # <<<<<<<<<<<<<<
@@ -22408,7 +22410,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
  */
       __pyx_v_delta_val = __pyx_v_value;
 
-      /* "osmdatapy/protobuf.pyx":281
+      /* "osmdatapy/protobuf.pyx":282
  *     while offset < rep_offset:
  *         value, offset = _signedvarint64(block, offset)
  *         if delta:             # <<<<<<<<<<<<<<
@@ -22417,7 +22419,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
  */
     }
 
-    /* "osmdatapy/protobuf.pyx":284
+    /* "osmdatapy/protobuf.pyx":285
  *             value = delta_val + value
  *             delta_val = value
  *         arr[size] = value             # <<<<<<<<<<<<<<
@@ -22427,7 +22429,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
     __pyx_t_5 = __pyx_v_size;
     *((int64_t *) ( /* dim=0 */ (__pyx_v_arr.data + __pyx_t_5 * __pyx_v_arr.strides[0]) )) = __pyx_v_value;
 
-    /* "osmdatapy/protobuf.pyx":285
+    /* "osmdatapy/protobuf.pyx":286
  *             delta_val = value
  *         arr[size] = value
  *         size+=1             # <<<<<<<<<<<<<<
@@ -22437,7 +22439,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
     __pyx_v_size = (__pyx_v_size + 1);
   }
 
-  /* "osmdatapy/protobuf.pyx":287
+  /* "osmdatapy/protobuf.pyx":288
  *         size+=1
  * 
  *     return offset, size             # <<<<<<<<<<<<<<
@@ -22449,7 +22451,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
   __pyx_r = __pyx_t_6;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":267
+  /* "osmdatapy/protobuf.pyx":268
  * @cython.boundscheck(False)
  * @cython.wraparound(False)
  * cdef (int, int) packed_signedint64(const unsigned char[:] block, Py_ssize_t offset, Py_ssize_t length, bint delta, int64_t[:] arr):             # <<<<<<<<<<<<<<
@@ -22465,7 +22467,7 @@ static __pyx_ctuple_int__and_int __pyx_f_9osmdatapy_8protobuf_packed_signedint64
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":294
+/* "osmdatapy/protobuf.pyx":295
  * 
  * @cython.boundscheck(False)
  * cdef (int, int, int64_t) _pbf_key(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -22488,20 +22490,20 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "osmdatapy/protobuf.pyx":299
+  /* "osmdatapy/protobuf.pyx":300
  *     cdef Py_ssize_t new_offset, key, wiretype
  * 
  *     v, new_offset = _varint64(block, offset)             # <<<<<<<<<<<<<<
  * 
  *     # split key and wiretype in last 3 bits
  */
-  __pyx_t_1 = __pyx_f_9osmdatapy_8protobuf__varint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 299, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_9osmdatapy_8protobuf__varint64(__pyx_v_block, __pyx_v_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 300, __pyx_L1_error)
   __pyx_t_2 = __pyx_t_1.f0;
   __pyx_t_3 = __pyx_t_1.f1;
   __pyx_v_v = __pyx_t_2;
   __pyx_v_new_offset = __pyx_t_3;
 
-  /* "osmdatapy/protobuf.pyx":302
+  /* "osmdatapy/protobuf.pyx":303
  * 
  *     # split key and wiretype in last 3 bits
  *     key = v >> 3             # <<<<<<<<<<<<<<
@@ -22510,7 +22512,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
  */
   __pyx_v_key = (__pyx_v_v >> 3);
 
-  /* "osmdatapy/protobuf.pyx":303
+  /* "osmdatapy/protobuf.pyx":304
  *     # split key and wiretype in last 3 bits
  *     key = v >> 3
  *     wiretype = v & 0x7             # <<<<<<<<<<<<<<
@@ -22519,7 +22521,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
  */
   __pyx_v_wiretype = (__pyx_v_v & 0x7);
 
-  /* "osmdatapy/protobuf.pyx":305
+  /* "osmdatapy/protobuf.pyx":306
  *     wiretype = v & 0x7
  * 
  *     if wiretype == 1:             # <<<<<<<<<<<<<<
@@ -22529,7 +22531,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
   switch (__pyx_v_wiretype) {
     case 1:
 
-    /* "osmdatapy/protobuf.pyx":306
+    /* "osmdatapy/protobuf.pyx":307
  * 
  *     if wiretype == 1:
  *         length = 8             # <<<<<<<<<<<<<<
@@ -22538,7 +22540,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
  */
     __pyx_v_length = 8;
 
-    /* "osmdatapy/protobuf.pyx":305
+    /* "osmdatapy/protobuf.pyx":306
  *     wiretype = v & 0x7
  * 
  *     if wiretype == 1:             # <<<<<<<<<<<<<<
@@ -22548,7 +22550,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
     break;
     case 5:
 
-    /* "osmdatapy/protobuf.pyx":308
+    /* "osmdatapy/protobuf.pyx":309
  *         length = 8
  *     elif wiretype == 5:
  *         length = 4             # <<<<<<<<<<<<<<
@@ -22557,7 +22559,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
  */
     __pyx_v_length = 4;
 
-    /* "osmdatapy/protobuf.pyx":307
+    /* "osmdatapy/protobuf.pyx":308
  *     if wiretype == 1:
  *         length = 8
  *     elif wiretype == 5:             # <<<<<<<<<<<<<<
@@ -22567,20 +22569,20 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
     break;
     case 2:
 
-    /* "osmdatapy/protobuf.pyx":312
+    /* "osmdatapy/protobuf.pyx":313
  *     # if length delimited, read value length and shift offset
  *     elif wiretype == 2:
  *         length, new_offset = _varint64(block, new_offset)             # <<<<<<<<<<<<<<
  *         return key, new_offset, length
  *     else:
  */
-    __pyx_t_1 = __pyx_f_9osmdatapy_8protobuf__varint64(__pyx_v_block, __pyx_v_new_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 312, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_9osmdatapy_8protobuf__varint64(__pyx_v_block, __pyx_v_new_offset); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 313, __pyx_L1_error)
     __pyx_t_2 = __pyx_t_1.f0;
     __pyx_t_3 = __pyx_t_1.f1;
     __pyx_v_length = __pyx_t_2;
     __pyx_v_new_offset = __pyx_t_3;
 
-    /* "osmdatapy/protobuf.pyx":313
+    /* "osmdatapy/protobuf.pyx":314
  *     elif wiretype == 2:
  *         length, new_offset = _varint64(block, new_offset)
  *         return key, new_offset, length             # <<<<<<<<<<<<<<
@@ -22593,7 +22595,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
     __pyx_r = __pyx_t_4;
     goto __pyx_L0;
 
-    /* "osmdatapy/protobuf.pyx":311
+    /* "osmdatapy/protobuf.pyx":312
  * 
  *     # if length delimited, read value length and shift offset
  *     elif wiretype == 2:             # <<<<<<<<<<<<<<
@@ -22603,7 +22605,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
     break;
     default:
 
-    /* "osmdatapy/protobuf.pyx":315
+    /* "osmdatapy/protobuf.pyx":316
  *         return key, new_offset, length
  *     else:
  *         length = 0             # <<<<<<<<<<<<<<
@@ -22614,7 +22616,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
     break;
   }
 
-  /* "osmdatapy/protobuf.pyx":317
+  /* "osmdatapy/protobuf.pyx":318
  *         length = 0
  * 
  *     return key, new_offset, length             # <<<<<<<<<<<<<<
@@ -22627,7 +22629,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
   __pyx_r = __pyx_t_4;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":294
+  /* "osmdatapy/protobuf.pyx":295
  * 
  * @cython.boundscheck(False)
  * cdef (int, int, int64_t) _pbf_key(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -22643,7 +22645,7 @@ static __pyx_ctuple_int__and_int__and_4libc_6stdint_int64_t __pyx_f_9osmdatapy_8
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":320
+/* "osmdatapy/protobuf.pyx":321
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _varint32(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -22661,7 +22663,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   int __pyx_t_2;
   __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_t_3;
 
-  /* "osmdatapy/protobuf.pyx":326
+  /* "osmdatapy/protobuf.pyx":327
  *     """
  * 
  *     cdef int32_t base = 1             # <<<<<<<<<<<<<<
@@ -22670,7 +22672,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_base = 1;
 
-  /* "osmdatapy/protobuf.pyx":327
+  /* "osmdatapy/protobuf.pyx":328
  * 
  *     cdef int32_t base = 1
  *     cdef Py_ssize_t index = 0             # <<<<<<<<<<<<<<
@@ -22679,7 +22681,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_index = 0;
 
-  /* "osmdatapy/protobuf.pyx":328
+  /* "osmdatapy/protobuf.pyx":329
  *     cdef int32_t base = 1
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]             # <<<<<<<<<<<<<<
@@ -22690,7 +22692,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
   __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-  /* "osmdatapy/protobuf.pyx":329
+  /* "osmdatapy/protobuf.pyx":330
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]
  *     cdef int32_t value = (val_byte & 0x7F)             # <<<<<<<<<<<<<<
@@ -22699,7 +22701,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_value = (__pyx_v_val_byte & 0x7F);
 
-  /* "osmdatapy/protobuf.pyx":331
+  /* "osmdatapy/protobuf.pyx":332
  *     cdef int32_t value = (val_byte & 0x7F)
  * 
  *     while (val_byte & 0x80):             # <<<<<<<<<<<<<<
@@ -22710,7 +22712,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_t_2 = ((__pyx_v_val_byte & 0x80) != 0);
     if (!__pyx_t_2) break;
 
-    /* "osmdatapy/protobuf.pyx":332
+    /* "osmdatapy/protobuf.pyx":333
  * 
  *     while (val_byte & 0x80):
  *         base *= 128             # <<<<<<<<<<<<<<
@@ -22719,7 +22721,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_base = (__pyx_v_base * 0x80);
 
-    /* "osmdatapy/protobuf.pyx":333
+    /* "osmdatapy/protobuf.pyx":334
  *     while (val_byte & 0x80):
  *         base *= 128
  *         index += 1             # <<<<<<<<<<<<<<
@@ -22728,7 +22730,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_index = (__pyx_v_index + 1);
 
-    /* "osmdatapy/protobuf.pyx":334
+    /* "osmdatapy/protobuf.pyx":335
  *         base *= 128
  *         index += 1
  *         val_byte = block[offset + index]             # <<<<<<<<<<<<<<
@@ -22739,7 +22741,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
     __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-    /* "osmdatapy/protobuf.pyx":335
+    /* "osmdatapy/protobuf.pyx":336
  *         index += 1
  *         val_byte = block[offset + index]
  *         value += (val_byte & 0x7F) * base             # <<<<<<<<<<<<<<
@@ -22749,7 +22751,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_v_value = (__pyx_v_value + ((__pyx_v_val_byte & 0x7F) * __pyx_v_base));
   }
 
-  /* "osmdatapy/protobuf.pyx":337
+  /* "osmdatapy/protobuf.pyx":338
  *         value += (val_byte & 0x7F) * base
  * 
  *     offset += (index + 1)             # <<<<<<<<<<<<<<
@@ -22758,7 +22760,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_offset = (__pyx_v_offset + (__pyx_v_index + 1));
 
-  /* "osmdatapy/protobuf.pyx":338
+  /* "osmdatapy/protobuf.pyx":339
  * 
  *     offset += (index + 1)
  *     return <int64_t>value, offset             # <<<<<<<<<<<<<<
@@ -22770,7 +22772,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   __pyx_r = __pyx_t_3;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":320
+  /* "osmdatapy/protobuf.pyx":321
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _varint32(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -22783,7 +22785,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":341
+/* "osmdatapy/protobuf.pyx":342
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _varuint32(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -22801,7 +22803,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   int __pyx_t_2;
   __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_t_3;
 
-  /* "osmdatapy/protobuf.pyx":347
+  /* "osmdatapy/protobuf.pyx":348
  *     """
  * 
  *     cdef uint32_t base = 1             # <<<<<<<<<<<<<<
@@ -22810,7 +22812,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_base = 1;
 
-  /* "osmdatapy/protobuf.pyx":348
+  /* "osmdatapy/protobuf.pyx":349
  * 
  *     cdef uint32_t base = 1
  *     cdef Py_ssize_t index = 0             # <<<<<<<<<<<<<<
@@ -22819,7 +22821,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_index = 0;
 
-  /* "osmdatapy/protobuf.pyx":349
+  /* "osmdatapy/protobuf.pyx":350
  *     cdef uint32_t base = 1
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]             # <<<<<<<<<<<<<<
@@ -22830,7 +22832,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
   __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-  /* "osmdatapy/protobuf.pyx":350
+  /* "osmdatapy/protobuf.pyx":351
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]
  *     cdef uint32_t value = (val_byte & 0x7F)             # <<<<<<<<<<<<<<
@@ -22839,7 +22841,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_value = (__pyx_v_val_byte & 0x7F);
 
-  /* "osmdatapy/protobuf.pyx":352
+  /* "osmdatapy/protobuf.pyx":353
  *     cdef uint32_t value = (val_byte & 0x7F)
  * 
  *     while (val_byte & 0x80):             # <<<<<<<<<<<<<<
@@ -22850,7 +22852,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_t_2 = ((__pyx_v_val_byte & 0x80) != 0);
     if (!__pyx_t_2) break;
 
-    /* "osmdatapy/protobuf.pyx":353
+    /* "osmdatapy/protobuf.pyx":354
  * 
  *     while (val_byte & 0x80):
  *         base *= 128             # <<<<<<<<<<<<<<
@@ -22859,7 +22861,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_base = (__pyx_v_base * 0x80);
 
-    /* "osmdatapy/protobuf.pyx":354
+    /* "osmdatapy/protobuf.pyx":355
  *     while (val_byte & 0x80):
  *         base *= 128
  *         index += 1             # <<<<<<<<<<<<<<
@@ -22868,7 +22870,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_index = (__pyx_v_index + 1);
 
-    /* "osmdatapy/protobuf.pyx":355
+    /* "osmdatapy/protobuf.pyx":356
  *         base *= 128
  *         index += 1
  *         val_byte = block[offset + index]             # <<<<<<<<<<<<<<
@@ -22879,7 +22881,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
     __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-    /* "osmdatapy/protobuf.pyx":356
+    /* "osmdatapy/protobuf.pyx":357
  *         index += 1
  *         val_byte = block[offset + index]
  *         value += (val_byte & 0x7F) * base             # <<<<<<<<<<<<<<
@@ -22889,7 +22891,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_v_value = (__pyx_v_value + ((__pyx_v_val_byte & 0x7F) * __pyx_v_base));
   }
 
-  /* "osmdatapy/protobuf.pyx":358
+  /* "osmdatapy/protobuf.pyx":359
  *         value += (val_byte & 0x7F) * base
  * 
  *     offset += (index + 1)             # <<<<<<<<<<<<<<
@@ -22898,7 +22900,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_offset = (__pyx_v_offset + (__pyx_v_index + 1));
 
-  /* "osmdatapy/protobuf.pyx":359
+  /* "osmdatapy/protobuf.pyx":360
  * 
  *     offset += (index + 1)
  *     return <int64_t>value, offset             # <<<<<<<<<<<<<<
@@ -22910,7 +22912,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   __pyx_r = __pyx_t_3;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":341
+  /* "osmdatapy/protobuf.pyx":342
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _varuint32(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -22923,7 +22925,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":362
+/* "osmdatapy/protobuf.pyx":363
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _varint64(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -22941,7 +22943,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   int __pyx_t_2;
   __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_t_3;
 
-  /* "osmdatapy/protobuf.pyx":367
+  /* "osmdatapy/protobuf.pyx":368
  *     update offset based on number of bytes consumed.
  *     """
  *     cdef int64_t base = 1             # <<<<<<<<<<<<<<
@@ -22950,7 +22952,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_base = 1;
 
-  /* "osmdatapy/protobuf.pyx":368
+  /* "osmdatapy/protobuf.pyx":369
  *     """
  *     cdef int64_t base = 1
  *     cdef Py_ssize_t index = 0             # <<<<<<<<<<<<<<
@@ -22959,7 +22961,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_index = 0;
 
-  /* "osmdatapy/protobuf.pyx":369
+  /* "osmdatapy/protobuf.pyx":370
  *     cdef int64_t base = 1
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]             # <<<<<<<<<<<<<<
@@ -22970,7 +22972,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
   __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-  /* "osmdatapy/protobuf.pyx":370
+  /* "osmdatapy/protobuf.pyx":371
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]
  *     cdef int64_t value = (val_byte & 0x7F)             # <<<<<<<<<<<<<<
@@ -22979,7 +22981,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_value = (__pyx_v_val_byte & 0x7F);
 
-  /* "osmdatapy/protobuf.pyx":372
+  /* "osmdatapy/protobuf.pyx":373
  *     cdef int64_t value = (val_byte & 0x7F)
  * 
  *     while (val_byte & 0x80):             # <<<<<<<<<<<<<<
@@ -22990,7 +22992,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_t_2 = ((__pyx_v_val_byte & 0x80) != 0);
     if (!__pyx_t_2) break;
 
-    /* "osmdatapy/protobuf.pyx":373
+    /* "osmdatapy/protobuf.pyx":374
  * 
  *     while (val_byte & 0x80):
  *         base *= 128             # <<<<<<<<<<<<<<
@@ -22999,7 +23001,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_base = (__pyx_v_base * 0x80);
 
-    /* "osmdatapy/protobuf.pyx":374
+    /* "osmdatapy/protobuf.pyx":375
  *     while (val_byte & 0x80):
  *         base *= 128
  *         index += 1             # <<<<<<<<<<<<<<
@@ -23008,7 +23010,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_index = (__pyx_v_index + 1);
 
-    /* "osmdatapy/protobuf.pyx":375
+    /* "osmdatapy/protobuf.pyx":376
  *         base *= 128
  *         index += 1
  *         val_byte = block[offset + index]             # <<<<<<<<<<<<<<
@@ -23019,7 +23021,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
     __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-    /* "osmdatapy/protobuf.pyx":376
+    /* "osmdatapy/protobuf.pyx":377
  *         index += 1
  *         val_byte = block[offset + index]
  *         value += (val_byte & 0x7F) * base             # <<<<<<<<<<<<<<
@@ -23029,7 +23031,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_v_value = (__pyx_v_value + ((__pyx_v_val_byte & 0x7F) * __pyx_v_base));
   }
 
-  /* "osmdatapy/protobuf.pyx":378
+  /* "osmdatapy/protobuf.pyx":379
  *         value += (val_byte & 0x7F) * base
  * 
  *     offset += (index + 1)             # <<<<<<<<<<<<<<
@@ -23038,7 +23040,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_offset = (__pyx_v_offset + (__pyx_v_index + 1));
 
-  /* "osmdatapy/protobuf.pyx":379
+  /* "osmdatapy/protobuf.pyx":380
  * 
  *     offset += (index + 1)
  *     return <int64_t>value, offset             # <<<<<<<<<<<<<<
@@ -23050,7 +23052,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   __pyx_r = __pyx_t_3;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":362
+  /* "osmdatapy/protobuf.pyx":363
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _varint64(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -23063,7 +23065,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":382
+/* "osmdatapy/protobuf.pyx":383
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _signedvarint32(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -23081,7 +23083,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   int __pyx_t_2;
   __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_t_3;
 
-  /* "osmdatapy/protobuf.pyx":387
+  /* "osmdatapy/protobuf.pyx":388
  *     update offset based on number of bytes consumed.
  *     """
  *     cdef int32_t base = 1             # <<<<<<<<<<<<<<
@@ -23090,7 +23092,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_base = 1;
 
-  /* "osmdatapy/protobuf.pyx":388
+  /* "osmdatapy/protobuf.pyx":389
  *     """
  *     cdef int32_t base = 1
  *     cdef Py_ssize_t index = 0             # <<<<<<<<<<<<<<
@@ -23099,7 +23101,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_index = 0;
 
-  /* "osmdatapy/protobuf.pyx":389
+  /* "osmdatapy/protobuf.pyx":390
  *     cdef int32_t base = 1
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]             # <<<<<<<<<<<<<<
@@ -23110,7 +23112,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
   __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-  /* "osmdatapy/protobuf.pyx":390
+  /* "osmdatapy/protobuf.pyx":391
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]
  *     cdef uint32_t value = (val_byte & 0x7F)             # <<<<<<<<<<<<<<
@@ -23119,7 +23121,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_value = (__pyx_v_val_byte & 0x7F);
 
-  /* "osmdatapy/protobuf.pyx":392
+  /* "osmdatapy/protobuf.pyx":393
  *     cdef uint32_t value = (val_byte & 0x7F)
  * 
  *     while (val_byte & 0x80):             # <<<<<<<<<<<<<<
@@ -23130,7 +23132,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_t_2 = ((__pyx_v_val_byte & 0x80) != 0);
     if (!__pyx_t_2) break;
 
-    /* "osmdatapy/protobuf.pyx":393
+    /* "osmdatapy/protobuf.pyx":394
  * 
  *     while (val_byte & 0x80):
  *         base *= 128             # <<<<<<<<<<<<<<
@@ -23139,7 +23141,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_base = (__pyx_v_base * 0x80);
 
-    /* "osmdatapy/protobuf.pyx":394
+    /* "osmdatapy/protobuf.pyx":395
  *     while (val_byte & 0x80):
  *         base *= 128
  *         index += 1             # <<<<<<<<<<<<<<
@@ -23148,7 +23150,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_index = (__pyx_v_index + 1);
 
-    /* "osmdatapy/protobuf.pyx":395
+    /* "osmdatapy/protobuf.pyx":396
  *         base *= 128
  *         index += 1
  *         val_byte = block[offset + index]             # <<<<<<<<<<<<<<
@@ -23159,7 +23161,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
     __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-    /* "osmdatapy/protobuf.pyx":396
+    /* "osmdatapy/protobuf.pyx":397
  *         index += 1
  *         val_byte = block[offset + index]
  *         value += (val_byte & 0x7F) * base             # <<<<<<<<<<<<<<
@@ -23169,7 +23171,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_v_value = (__pyx_v_value + ((__pyx_v_val_byte & 0x7F) * __pyx_v_base));
   }
 
-  /* "osmdatapy/protobuf.pyx":398
+  /* "osmdatapy/protobuf.pyx":399
  *         value += (val_byte & 0x7F) * base
  * 
  *     offset += (index + 1)             # <<<<<<<<<<<<<<
@@ -23178,7 +23180,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_offset = (__pyx_v_offset + (__pyx_v_index + 1));
 
-  /* "osmdatapy/protobuf.pyx":401
+  /* "osmdatapy/protobuf.pyx":402
  * 
  *     #zigzag decode
  *     return <int64_t>((value >> 1) ^ (-(value & 1))), offset             # <<<<<<<<<<<<<<
@@ -23190,7 +23192,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   __pyx_r = __pyx_t_3;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":382
+  /* "osmdatapy/protobuf.pyx":383
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _signedvarint32(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -23203,7 +23205,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   return __pyx_r;
 }
 
-/* "osmdatapy/protobuf.pyx":404
+/* "osmdatapy/protobuf.pyx":405
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _signedvarint64(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -23221,7 +23223,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   int __pyx_t_2;
   __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_t_3;
 
-  /* "osmdatapy/protobuf.pyx":409
+  /* "osmdatapy/protobuf.pyx":410
  *     update offset based on number of bytes consumed.
  *     """
  *     cdef int64_t base = 1             # <<<<<<<<<<<<<<
@@ -23230,7 +23232,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_base = 1;
 
-  /* "osmdatapy/protobuf.pyx":410
+  /* "osmdatapy/protobuf.pyx":411
  *     """
  *     cdef int64_t base = 1
  *     cdef Py_ssize_t index = 0             # <<<<<<<<<<<<<<
@@ -23239,7 +23241,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_index = 0;
 
-  /* "osmdatapy/protobuf.pyx":411
+  /* "osmdatapy/protobuf.pyx":412
  *     cdef int64_t base = 1
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]             # <<<<<<<<<<<<<<
@@ -23250,7 +23252,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
   __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-  /* "osmdatapy/protobuf.pyx":412
+  /* "osmdatapy/protobuf.pyx":413
  *     cdef Py_ssize_t index = 0
  *     cdef char val_byte = block[offset]
  *     cdef uint64_t value = (val_byte & 0x7F)             # <<<<<<<<<<<<<<
@@ -23259,7 +23261,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_value = (__pyx_v_val_byte & 0x7F);
 
-  /* "osmdatapy/protobuf.pyx":414
+  /* "osmdatapy/protobuf.pyx":415
  *     cdef uint64_t value = (val_byte & 0x7F)
  * 
  *     while (val_byte & 0x80):             # <<<<<<<<<<<<<<
@@ -23270,7 +23272,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_t_2 = ((__pyx_v_val_byte & 0x80) != 0);
     if (!__pyx_t_2) break;
 
-    /* "osmdatapy/protobuf.pyx":415
+    /* "osmdatapy/protobuf.pyx":416
  * 
  *     while (val_byte & 0x80):
  *         base *= 128             # <<<<<<<<<<<<<<
@@ -23279,7 +23281,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_base = (__pyx_v_base * 0x80);
 
-    /* "osmdatapy/protobuf.pyx":416
+    /* "osmdatapy/protobuf.pyx":417
  *     while (val_byte & 0x80):
  *         base *= 128
  *         index += 1             # <<<<<<<<<<<<<<
@@ -23288,7 +23290,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
     __pyx_v_index = (__pyx_v_index + 1);
 
-    /* "osmdatapy/protobuf.pyx":417
+    /* "osmdatapy/protobuf.pyx":418
  *         base *= 128
  *         index += 1
  *         val_byte = block[offset + index]             # <<<<<<<<<<<<<<
@@ -23299,7 +23301,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     if (__pyx_t_1 < 0) __pyx_t_1 += __pyx_v_block.shape[0];
     __pyx_v_val_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_block.data + __pyx_t_1 * __pyx_v_block.strides[0]) )));
 
-    /* "osmdatapy/protobuf.pyx":418
+    /* "osmdatapy/protobuf.pyx":419
  *         index += 1
  *         val_byte = block[offset + index]
  *         value += (val_byte & 0x7F) * base             # <<<<<<<<<<<<<<
@@ -23309,7 +23311,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
     __pyx_v_value = (__pyx_v_value + ((__pyx_v_val_byte & 0x7F) * __pyx_v_base));
   }
 
-  /* "osmdatapy/protobuf.pyx":420
+  /* "osmdatapy/protobuf.pyx":421
  *         value += (val_byte & 0x7F) * base
  * 
  *     offset += (index + 1)             # <<<<<<<<<<<<<<
@@ -23318,7 +23320,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
  */
   __pyx_v_offset = (__pyx_v_offset + (__pyx_v_index + 1));
 
-  /* "osmdatapy/protobuf.pyx":423
+  /* "osmdatapy/protobuf.pyx":424
  * 
  *     #zigzag decode
  *     return <int64_t>((value >> 1) ^ (-(value & 1))), offset             # <<<<<<<<<<<<<<
@@ -23328,7 +23330,7 @@ static __pyx_ctuple_4libc_6stdint_int64_t__and_int __pyx_f_9osmdatapy_8protobuf_
   __pyx_r = __pyx_t_3;
   goto __pyx_L0;
 
-  /* "osmdatapy/protobuf.pyx":404
+  /* "osmdatapy/protobuf.pyx":405
  * 
  * @cython.boundscheck(False)
  * cdef (int64_t, int) _signedvarint64(const unsigned char[:] block, Py_ssize_t offset):             # <<<<<<<<<<<<<<
@@ -24481,8 +24483,8 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
 }
 /* #### Code section: cached_builtins ### */
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 164, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 167, __pyx_L1_error)
   __pyx_builtin___import__ = __Pyx_GetBuiltinName(__pyx_n_s_import); if (!__pyx_builtin___import__) __PYX_ERR(1, 100, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 156, __pyx_L1_error)
   __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(1, 159, __pyx_L1_error)
@@ -24537,14 +24539,14 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
 
-  /* "osmdatapy/protobuf.pyx":164
+  /* "osmdatapy/protobuf.pyx":165
  * 
  *     if l != len(vals):
  *         raise ValueError("tags and vals must hase same length")             # <<<<<<<<<<<<<<
  * 
  *     for i in range(l):
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_tags_and_vals_must_hase_same_len); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 164, __pyx_L1_error)
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_tags_and_vals_must_hase_same_len); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
 
@@ -24721,17 +24723,17 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GIVEREF(__pyx_tuple__31);
   __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_osmdatapy_protobuf_pyx, __pyx_n_s_scalar, 132, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 132, __pyx_L1_error)
 
-  /* "osmdatapy/protobuf.pyx":158
+  /* "osmdatapy/protobuf.pyx":159
  *     return val, new_offset
  * 
  * def pack_tag_val(int64_t[:] tags, int64_t[:] vals):             # <<<<<<<<<<<<<<
  * 
  *     cdef list res = []
  */
-  __pyx_tuple__33 = PyTuple_Pack(5, __pyx_n_s_tags, __pyx_n_s_vals, __pyx_n_s_res, __pyx_n_s_l, __pyx_n_s_i); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_tuple__33 = PyTuple_Pack(5, __pyx_n_s_tags, __pyx_n_s_vals, __pyx_n_s_res, __pyx_n_s_l, __pyx_n_s_i); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__33);
   __Pyx_GIVEREF(__pyx_tuple__33);
-  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_osmdatapy_protobuf_pyx, __pyx_n_s_pack_tag_val, 158, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_osmdatapy_protobuf_pyx, __pyx_n_s_pack_tag_val, 159, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -25924,16 +25926,16 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_scalar, __pyx_t_7) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-  /* "osmdatapy/protobuf.pyx":158
+  /* "osmdatapy/protobuf.pyx":159
  *     return val, new_offset
  * 
  * def pack_tag_val(int64_t[:] tags, int64_t[:] vals):             # <<<<<<<<<<<<<<
  * 
  *     cdef list res = []
  */
-  __pyx_t_7 = __Pyx_CyFunction_New(&__pyx_mdef_9osmdatapy_8protobuf_13pack_tag_val, 0, __pyx_n_s_pack_tag_val, NULL, __pyx_n_s_osmdatapy_protobuf, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_CyFunction_New(&__pyx_mdef_9osmdatapy_8protobuf_13pack_tag_val, 0, __pyx_n_s_pack_tag_val, NULL, __pyx_n_s_osmdatapy_protobuf, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pack_tag_val, __pyx_t_7) < 0) __PYX_ERR(0, 158, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pack_tag_val, __pyx_t_7) < 0) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
   /* "osmdatapy/protobuf.pyx":1
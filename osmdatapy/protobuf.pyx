@@ -100,7 +100,7 @@ def keyvals(const unsigned char[:] block not None, Py_ssize_t offset, Py_ssize_t
             cnter+=1
             key = False
         else:
-            vals[cnter] = value
+            vals[cnter - 1] = value
             key=True
 
     return ids[:cnter], keys[:cnter], vals[:cnter], offset
@@ -133,7 +133,8 @@ def scalar(const unsigned char[:] block not None, Py_ssize_t offset, str scalar_
     """ Returns a scalar and new offset """
     
     cdef Py_ssize_t bytesize, new_offset
-    cdef int key, val
+    cdef int key
+    cdef int64_t val
     
     if scalar_type == 'bool' or scalar_type == "int32" or scalar_type == "enum":
         val, new_offset = _varint32(block, offset)
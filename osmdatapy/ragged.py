@@ -0,0 +1,83 @@
+import numpy as np
+import shapely as sh
+
+from ._geometry import from_offsets
+from ._topology import concat_ranges
+
+
+class RaggedGeometry:
+    """
+    Geometries of query results as coordinates and offsets arrays, one geometry by row,
+    in the layout of GeoArrow multipolygons : rows have parts, parts have rings,
+    rings have coordinates
+
+    points and linestrings have a single part of a single ring, multilinestrings have
+    a ring by part, rows without geometry have no part
+
+    Parameters
+    ----------
+    geom_types : array of geometry type of each row, 0 no geometry, 1 point,
+                 2 (multi)linestring, 3 (multi)polygon
+    coords : array of longitude and latitude of all geometries
+    ring_offsets : start positions of rings in coords, and end of coords
+    part_offsets : start positions of the rings of each part, and number of rings
+    geom_offsets : start positions of the parts of each row, and number of parts
+    """
+
+    def __init__(self, geom_types, coords, ring_offsets, part_offsets, geom_offsets):
+        self.geom_types = geom_types
+        self.coords = coords
+        self.ring_offsets = ring_offsets
+        self.part_offsets = part_offsets
+        self.geom_offsets = geom_offsets
+
+    def __len__(self):
+        return len(self.geom_types)
+
+    def take(self, rows):
+        """RaggedGeometry of rows in the order of rows"""
+
+        rows = np.asarray(rows, dtype=np.int64)
+        part_counts = np.diff(self.geom_offsets)[rows]
+        parts = concat_ranges(self.geom_offsets[rows], part_counts)
+        ring_counts = np.diff(self.part_offsets)[parts]
+        rings = concat_ranges(self.part_offsets[parts], ring_counts)
+        lengths = np.diff(self.ring_offsets)[rings]
+        pos = concat_ranges(self.ring_offsets[rings], lengths)
+
+        return RaggedGeometry(
+            self.geom_types[rows],
+            self.coords[pos],
+            _offsets(lengths),
+            _offsets(ring_counts),
+            _offsets(part_counts),
+        )
+
+    def to_shapely(self):
+        """Array of shapely geometries, None for rows without geometry"""
+
+        res = np.full(len(self), None, dtype=object)
+        starts = self.ring_offsets[self.part_offsets[self.geom_offsets[:-1]]]
+
+        points = self.geom_types == 1
+        res[points] = sh.points(self.coords[starts[points]])
+
+        for geom_type in (2, 3):
+            rows = np.flatnonzero(self.geom_types == geom_type)
+            if len(rows) == 0:
+                continue
+
+            geoms = self.take(rows)
+            offsets = [geoms.ring_offsets, geoms.geom_offsets]
+            if geom_type == 3:
+                offsets.insert(1, geoms.part_offsets)
+            res[rows] = from_offsets(geoms.coords, offsets, polygon=geom_type == 3)
+
+        return res
+
+
+def _offsets(counts):
+    """start positions of counts, and total"""
+    res = np.zeros(len(counts) + 1, dtype=np.int64)
+    res[1:] = np.cumsum(counts)
+    return res
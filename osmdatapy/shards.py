@@ -0,0 +1,61 @@
+# Spatial grouping of pbf blocks along a Hilbert curve
+
+import numpy as np
+
+# number of bits by coordinate of Hilbert curve cells
+HILBERT_ORDER = 16
+
+
+def hilbert_index(lon, lat, order=HILBERT_ORDER):
+    """Position on a Hilbert curve of order covering the world of lon, lat arrays in degrees"""
+
+    n = 1 << order
+    x = np.clip((np.asarray(lon) + 180) / 360 * n, 0, n - 1).astype(np.int64)
+    y = np.clip((np.asarray(lat) + 90) / 180 * n, 0, n - 1).astype(np.int64)
+    d = np.zeros(len(x), dtype=np.int64)
+
+    s = n // 2
+    while s > 0:
+        rx = ((x & s) > 0).astype(np.int64)
+        ry = ((y & s) > 0).astype(np.int64)
+        d += s * s * ((3 * rx) ^ ry)
+
+        # rotate quadrant
+        flip = (ry == 0) & (rx == 1)
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry == 0, y, x), np.where(ry == 0, x, y)
+        s //= 2
+
+    return d
+
+
+def split_by_size(sizes, n):
+    """Split ordered items in at most n contiguous groups of similar total size, returns group numbers"""
+
+    cumsum = np.cumsum(sizes) - np.asarray(sizes) / 2
+    total = max(cumsum[-1] + sizes[-1] / 2, 1) if len(sizes) > 0 else 1
+    return np.minimum((cumsum / total * n).astype(np.int64), n - 1)
+
+
+def tile_keys(lon, lat, tile_size):
+    """Hilbert position of tiles of tile_size degrees containing lon, lat"""
+
+    col = np.floor((np.asarray(lon) + 180) / tile_size)
+    row = np.floor((np.asarray(lat) + 90) / tile_size)
+    return hilbert_index(col * tile_size - 180 + tile_size / 2, row * tile_size - 90 + tile_size / 2)
+
+
+def union_extent(extents):
+    """Extent containing a list of min lon, min lat, max lon, max lat extents, None if empty"""
+
+    extents = [e for e in extents if e is not None]
+    if not extents:
+        return None
+    arr = np.array(extents, dtype=np.float64)
+    return [float(arr[:, 0].min()), float(arr[:, 1].min()), float(arr[:, 2].max()), float(arr[:, 3].max())]
+
+
+def intersects(a, b):
+    """True if two extents intersect"""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
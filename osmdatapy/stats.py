@@ -0,0 +1,119 @@
+import time
+import functools
+from contextlib import contextmanager, nullcontext
+
+import pandas as pd
+
+
+class Stats:
+    """
+    Collector of wall times and counters of the processing stages of OSM calls
+
+    stages and counters are reset at the start of each call to OSM (open, query, graph, extract)
+
+    Parameters
+    ----------
+    callback : optional function called with the Stats object at the end of each call
+
+    Attributes
+    ----------
+    call : name of the last call
+    time : wall time of the last call in seconds
+    stages : dictionary of stage name to dictionary of counters, time is the wall time in seconds
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.call = None
+        self.time = 0.0
+        self.stages = {}
+        self._depth = 0
+        self._start = None
+
+    def __repr__(self):
+        if self.call is None:
+            return "Stats()"
+        header = "{0} : {1:.3f} s".format(self.call, self.time)
+        return "\n".join([header, self.to_frame().to_string()])
+
+    def start(self, call):
+        """Reset stages at the start of a call, nested calls are part of the first call"""
+
+        self._depth += 1
+        if self._depth > 1:
+            return None
+
+        self.call = call
+        self.stages = {}
+        self._start = time.perf_counter()
+
+    def finish(self):
+        self._depth -= 1
+        if self._depth > 0:
+            return None
+
+        self.time = time.perf_counter() - self._start
+        if self.callback is not None:
+            self.callback(self)
+
+    @contextmanager
+    def stage(self, name):
+        """Context manager adding its wall time to a stage"""
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add(name, time=time.perf_counter() - start)
+
+    def add(self, name, **counters):
+        """Add counter values to a stage"""
+        stage = self.stages.setdefault(name, {})
+        for k, v in counters.items():
+            stage[k] = stage.get(k, 0) + v
+
+    def to_frame(self):
+        """Dataframe of stages with a column by counter"""
+        df = pd.DataFrame.from_dict(self.stages, orient="index").fillna(0)
+        counters = [c for c in df.columns if c != "time"]
+        df[counters] = df[counters].astype("int64")
+        if "time" in df.columns:
+            df = df[["time"] + counters]
+        return df
+
+
+class _NoStats:
+    """Disabled statistics, all methods do nothing"""
+
+    def start(self, call):
+        pass
+
+    def finish(self):
+        pass
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def add(self, name, **counters):
+        pass
+
+
+NO_STATS = _NoStats()
+_NULL_STAGE = nullcontext()
+
+
+def collect(call):
+    """Decorator of OSM methods starting and finishing a call in the stats collector"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            stats = self._stats()
+            stats.start(call)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                stats.finish()
+
+        return wrapper
+
+    return decorator
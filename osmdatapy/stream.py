@@ -0,0 +1,76 @@
+import urllib.request
+
+
+class StreamReader:
+    """
+    Read a binary stream and copy all bytes read to an output file
+
+    reads block until the requested size is available or the stream ends,
+    so that pbf blobs can be parsed while they arrive
+
+    Parameters
+    ----------
+    stream : binary file-like object with a read method, e.g. a http response
+    out : binary file receiving a copy of the stream
+    """
+
+    def __init__(self, stream, out):
+        self.stream = stream
+        self.out = out
+        self.position = 0
+
+    def read(self, size):
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = self.stream.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        data = b"".join(chunks)
+        self.out.write(data)
+        self.position += len(data)
+        return data
+
+    def tell(self):
+        return self.position
+
+
+def open_source(source):
+    """Open a url or return a binary file-like object, with its size in bytes or None"""
+
+    if isinstance(source, str):
+        resp = urllib.request.urlopen(source)
+        return resp, resp.length
+    return source, None
+
+
+class RangeReader:
+    """
+    Read byte ranges of a file as a single stream, tell returns positions in the file
+
+    Parameters
+    ----------
+    f : binary file
+    ranges : sorted list of start, end positions, reads must not overlap two ranges
+    """
+
+    def __init__(self, f, ranges):
+        self.f = f
+        self.ranges = list(ranges)
+        self.current = -1
+
+    def read(self, size):
+        while self.current < 0 or self.f.tell() >= self.ranges[self.current][1]:
+            self.current += 1
+            if self.current >= len(self.ranges):
+                return b""
+            self.f.seek(self.ranges[self.current][0])
+
+        end = self.ranges[self.current][1]
+        return self.f.read(min(size, end - self.f.tell()))
+
+    def tell(self):
+        return self.f.tell()
@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+# synthetic pbf generator shared with benchmarks
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "benchmarks"))
+
+from synthetic import generate  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def pbf_path(tmp_path_factory):
+    """Path of a small synthetic pbf file with several blocks of each osm type"""
+
+    path = tmp_path_factory.mktemp("osm") / "synthetic.osm.pbf"
+    generate(str(path), scale=0.2, seed=1, block_size=250)
+    return str(path)
+
+
+@pytest.fixture
+def osm(pbf_path):
+    import osmdatapy
+
+    return osmdatapy.OSM(pbf_path)
+
+
+def sorted_frame(df):
+    """Frame sorted by osm type and id, to compare results built in another order"""
+    return df.reset_index().sort_values(["osmtype", "osmid"]).reset_index(drop=True)
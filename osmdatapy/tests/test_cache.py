@@ -0,0 +1,65 @@
+import os
+
+import pandas as pd
+import pytest
+
+from osmdatapy import OSM, Query, ResultCache
+import osmdatapy.cache
+
+from .conftest import sorted_frame
+
+pytest.importorskip("pyarrow")
+
+QUERY = Query("highways", geometry=True)
+
+
+def test_cached_query(osm, pbf_path, tmp_path):
+    expected = sorted_frame(osm.query(QUERY))
+
+    cached = OSM(pbf_path, cache=str(tmp_path))
+    cached.query(QUERY)
+    assert cached.cache.size() > 0
+    pd.testing.assert_frame_equal(sorted_frame(cached.query(QUERY)), expected)
+
+
+def test_key_version(pbf_path, tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    identity = osmdatapy.cache.file_identity(pbf_path)
+    key = cache.key(QUERY, identity)
+
+    assert cache.key(QUERY, identity) == key
+    monkeypatch.setattr(osmdatapy.cache, "VERSION", "0.0.0")
+    assert cache.key(QUERY, identity) != key
+
+
+def test_source_version():
+    # a source tree has no installed version, its sources are hashed
+    version = osmdatapy.cache._source_hash()
+    assert version.startswith("source-")
+    assert osmdatapy.cache._source_hash() == version
+
+
+def test_put_failure(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+
+    def fail(self, path):
+        with open(path, "wb") as f:
+            f.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", fail)
+    with pytest.raises(OSError):
+        cache.put("key", pd.DataFrame({"a": [1]}))
+    assert os.listdir(tmp_path) == []
+
+
+def test_evict_removed_files(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    cache.put("key", pd.DataFrame({"a": [1]}))
+
+    # a listed file is removed by another process before eviction
+    files = cache._files() + [str(tmp_path / "removed.parquet")]
+    monkeypatch.setattr(cache, "_files", lambda: files)
+    cache.max_size = 0
+    cache._evict()
+    assert cache.get("key") is None
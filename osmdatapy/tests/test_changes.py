@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from osmdatapy import OSM, Query
+
+from .conftest import sorted_frame
+
+CHANGES = """<?xml version="1.0" encoding="UTF-8"?>
+<osmChange version="0.6" generator="test">
+  <create>
+    <node id="100000" version="1" timestamp="2024-01-01T00:00:00Z" changeset="9" lat="48.05" lon="2.05"/>
+    <node id="100001" version="1" timestamp="2024-01-01T00:00:00Z" changeset="9" lat="48.06" lon="2.06">
+      <tag k="amenity" v="bench"/>
+    </node>
+    <way id="100000" version="1" timestamp="2024-01-01T00:00:00Z" changeset="9">
+      <nd ref="100000"/><nd ref="100001"/><nd ref="1"/>
+      <tag k="highway" v="cycleway"/><tag k="surface" v="gravel"/>
+    </way>
+  </create>
+  <modify>
+    <node id="1" version="2" timestamp="2024-01-01T00:00:00Z" changeset="9" lat="47.999" lon="1.999"/>
+    <way id="1" version="3" timestamp="2024-01-01T00:00:00Z" changeset="9">
+      <nd ref="1"/><nd ref="2"/><nd ref="3"/>
+      <tag k="highway" v="primary"/>
+    </way>
+  </modify>
+  <delete>
+    <way id="2" version="4" timestamp="2024-01-01T00:00:00Z" changeset="9"/>
+  </delete>
+</osmChange>
+"""
+
+
+def test_apply_changes(osm, tmp_path):
+    path = tmp_path / "changes.osc"
+    path.write_text(CHANGES)
+    before = osm.query(Query(ways=True, tags=["highway"]))
+
+    osm.apply_changes(str(path))
+
+    np.testing.assert_allclose(osm.coords(np.array([1, 100001])), [[1.999, 47.999], [2.06, 48.06]])
+
+    ways = osm.query(Query(ways=True, tags=["highway"], metadata=True, geometry=True))
+    assert 2 not in ways.index
+    assert ways.loc[100000, "highway"] == "cycleway"
+    assert ways.loc[1, "highway"] == "primary"
+    assert ways.loc[1, "version"] == 3
+    assert len(ways.loc[1, "geometry"].coords) == 3
+    assert len(ways) == len(before)
+
+    nodes = osm.query(Query(nodes=True, node_ids=[100000, 100001], tags=["amenity"]))
+    assert nodes.index.tolist() == [100000, 100001]
+    assert nodes.loc[100001, "amenity"] == "bench"
+
+
+def test_extract_changes(osm, tmp_path):
+    path = tmp_path / "changes.osc"
+    path.write_text(CHANGES)
+    osm.apply_changes(str(path))
+
+    extract = str(tmp_path / "extract.osm.pbf")
+    osm.extract(Query(nodes=True, ways=True, keep={"highway": [], "amenity": []}), extract)
+    res = OSM(extract)
+
+    assert "Sort.Type_then_ID" not in res.optional_features
+    np.testing.assert_allclose(res.coords(np.array([1, 100001])), [[1.999, 47.999], [2.06, 48.06]])
+
+    query = Query(ways=True, keep={"highway": []}, tags=["highway"], metadata=True, geometry=True)
+    pd.testing.assert_frame_equal(sorted_frame(res.query(query)), sorted_frame(osm.query(query)))
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from osmdatapy import OSM, OSMCollection, Query
+from osmdatapy.writer import PBFWriter
+
+from .conftest import sorted_frame
+
+
+def test_collection_drops_shared_objects(osm, pbf_path, tmp_path):
+    # two overlapping extracts, streets are in both files
+    part_a, part_b = str(tmp_path / "a.osm.pbf"), str(tmp_path / "b.osm.pbf")
+    osm.extract(Query("highways"), part_a)
+    osm.extract(Query(ways=True, keep={"building": []}), part_b)
+
+    collection = OSMCollection([part_a, part_b])
+    query = Query(nodes=True, ways=True, geometry=True)
+    res = sorted_frame(collection.query(query))
+
+    expected = pd.concat([OSM(part_a).query(query), OSM(part_b).query(query)])
+    expected = sorted_frame(expected.loc[~expected.reset_index().duplicated(["osmid", "osmtype"]).to_numpy()])
+
+    assert not res.duplicated(["osmid", "osmtype"]).any()
+    assert len(res) == len(expected)
+    assert set(res.columns) == set(expected.columns)
+
+
+def test_collection_same_file(osm, pbf_path):
+    query = Query(ways=True, relations=True, geometry=True, metadata=True)
+    res = sorted_frame(OSMCollection([pbf_path, pbf_path]).query(query))
+    expected = sorted_frame(osm.query(query))
+    pd.testing.assert_frame_equal(res, expected, check_like=True)
+
+
+def _write_version(path, version, lon, highway):
+    # node 1 and 2 and way 5, the same objects with another version in each file
+    strings = ["highway", highway]
+    ids = np.array([[1, 0, version, 0, 0], [2, 0, 1, 0, 0], [5, 1, version, 0, 0]], dtype=np.int64)
+    tags = np.array([[2, 0, 1]], dtype=np.int64)
+    rels = np.array([[2, 1, 0, -1, 0], [2, 2, 0, -1, 0]], dtype=np.int64)
+    coords = np.array([[lon, 48_000_000_000], [2_000_000_000, 48_000_000_000], [0, 0]], dtype=np.int64)
+    with PBFWriter(path) as writer:
+        writer.write_block(ids, tags, rels, strings, coords)
+    return path
+
+
+@pytest.mark.parametrize("metadata", [False, True])
+@pytest.mark.parametrize("newest_first", [False, True])
+def test_collection_highest_version(tmp_path, metadata, newest_first):
+    old = _write_version(str(tmp_path / "old.osm.pbf"), 1, 1_000_000_000, "track")
+    new = _write_version(str(tmp_path / "new.osm.pbf"), 2, 1_500_000_000, "primary")
+    collection = OSMCollection([new, old] if newest_first else [old, new])
+
+    np.testing.assert_allclose(collection.coords(np.array([1])), [[1.5, 48.0]])
+    ways = collection.query(Query(ways=True, tags=["highway"], metadata=metadata))
+    assert ways["highway"].tolist() == ["primary"]
+
+
+def test_collection_extract(tmp_path):
+    old = _write_version(str(tmp_path / "old.osm.pbf"), 1, 1_000_000_000, "track")
+    new = _write_version(str(tmp_path / "new.osm.pbf"), 2, 1_500_000_000, "primary")
+    path = str(tmp_path / "merged.osm.pbf")
+    OSMCollection([old, new]).extract(Query(nodes=True, ways=True), path)
+
+    merged = OSM(path)
+    nodes = merged.query(Query(nodes=True, metadata=True))
+    assert sorted(nodes.index) == [1, 2]
+    assert nodes.loc[1, "version"] == 2
+    np.testing.assert_allclose(merged.coords(np.array([1])), [[1.5, 48.0]])
+    assert merged.query(Query(ways=True, tags=["highway"]))["highway"].tolist() == ["primary"]
+
+
+def test_collection_shards(pbf_path):
+    with pytest.raises(ValueError):
+        OSMCollection([pbf_path, pbf_path]).shards(n=2)
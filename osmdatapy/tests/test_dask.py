@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from osmdatapy import Query
+
+from .conftest import sorted_frame
+from .test_changes import CHANGES
+
+pytest.importorskip("dask_geopandas")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        Query(ways=True, relations=True, tags=["building"], geometry=True),
+        Query(nodes=True, tags=["amenity"], geometry=True),
+        Query(ways=True, tags=["highway", "name"]),
+    ],
+)
+def test_to_dask(osm, query):
+    # a block by partition, relations and their member ways are in different partitions
+    ddf = osm.to_dask(query, partition_size=1)
+    assert ddf.npartitions > 1
+
+    res = sorted_frame(ddf.compute())
+    expected = sorted_frame(osm.query(query))
+    pd.testing.assert_frame_equal(res, expected, check_like=True, check_dtype=False)
+
+
+def test_to_dask_changes(osm, tmp_path):
+    path = tmp_path / "changes.osc"
+    path.write_text(CHANGES)
+    osm.apply_changes(str(path))
+
+    query = Query(ways=True, tags=["highway"], geometry=True)
+    res = osm.to_dask(query, partition_size=1).compute()
+    assert res.index.is_unique
+    assert 100000 in res.index and 2 not in res.index
+
+    expected = sorted_frame(osm.query(query))
+    pd.testing.assert_frame_equal(sorted_frame(res), expected, check_like=True, check_dtype=False)
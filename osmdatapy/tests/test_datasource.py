@@ -0,0 +1,287 @@
+import asyncio
+import contextlib
+import json
+import os
+import threading
+import urllib.error
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from osmdatapy import OSM  # noqa: E402
+from osmdatapy.datasource.datasource import _download_urls, cached_file  # noqa: E402
+
+CONTENT = bytes(range(256)) * 400
+
+
+class Server:
+    """Local http server of files with Range, If-Range, ETag and If-None-Match support"""
+
+    def __init__(self, files, delay=0.0, interrupt=False, last_modified=None):
+        self.files = files
+        self.last_modified = last_modified
+        self.delay = delay
+        self.interrupt = interrupt
+        self.requests = []
+        self.running = 0
+        self.max_running = 0
+
+    async def handle(self, request):
+        name = request.match_info["name"]
+        self.requests.append((name, dict(request.headers)))
+        if name not in self.files:
+            return web.Response(status=404)
+        content, etag = self.files[name]
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+
+            start = 0
+            headers = {"ETag": etag}
+            if self.last_modified is not None:
+                headers["Last-Modified"] = self.last_modified
+            status = 200
+            if "Range" in request.headers and request.headers.get("If-Range", etag) == etag:
+                start = int(request.headers["Range"][6:-1])
+                if start >= len(content):
+                    headers["Content-Range"] = "bytes */{0}".format(len(content))
+                    return web.Response(status=416, headers=headers)
+                headers["Content-Range"] = "bytes {0}-{1}/{2}".format(
+                    start, len(content) - 1, len(content)
+                )
+                status = 206
+
+            resp = web.StreamResponse(status=status, headers=headers)
+            resp.content_length = len(content) - start
+            await resp.prepare(request)
+
+            # first request stops in the middle of the file
+            if self.interrupt:
+                self.interrupt = False
+                await resp.write(content[start : start + 1000])
+                request.transport.close()
+                return resp
+
+            await resp.write(content[start:])
+            await resp.write_eof()
+            return resp
+        finally:
+            self.running -= 1
+
+
+def download(server, names, path, max_concurrent=4, missing=()):
+    async def run():
+        app = web.Application()
+        app.router.add_get("/{name}", server.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        urls = {
+            n: "http://127.0.0.1:{0}/{1}".format(port, n) for n in names
+        }
+        urls.update({n: [None] for n in missing})
+        try:
+            return await _download_urls(urls, str(path), ".pbf", max_concurrent, 4096)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+@contextlib.contextmanager
+def serve(server):
+    """Run the server in a thread for blocking clients, yields its base url"""
+
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_get("/{name}", server.handle)
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run_until_complete(site.start())
+    port = site._server.sockets[0].getsockname()[1]
+
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield "http://127.0.0.1:{0}".format(port)
+    finally:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def write_part(path, name, content, validator=None):
+    part = os.path.join(str(path), name + ".pbf.part")
+    with open(part, "wb") as f:
+        f.write(content)
+    if validator is not None:
+        with open(part + ".meta", "w") as f:
+            f.write('{"validator": "%s"}' % validator)
+    return part
+
+
+def read(path, name):
+    with open(os.path.join(str(path), name + ".pbf"), "rb") as f:
+        return f.read()
+
+
+def test_download(tmp_path):
+    server = Server({"a": (CONTENT, '"v1"')})
+    assert download(server, ["a"], tmp_path) == [str(tmp_path / "a.pbf")]
+    assert read(tmp_path, "a") == CONTENT
+    assert sorted(os.listdir(tmp_path)) == ["a.pbf"]
+
+
+def test_resume_interrupted(tmp_path):
+    server = Server({"a": (CONTENT, '"v1"')}, interrupt=True)
+    download(server, ["a"], tmp_path)
+
+    assert read(tmp_path, "a") == CONTENT
+    assert server.requests[1][1]["Range"] == "bytes=1000-"
+
+
+def test_resume_part_file(tmp_path):
+    write_part(tmp_path, "a", CONTENT[:5000], '\\"v1\\"')
+    server = Server({"a": (CONTENT, '"v1"')})
+    download(server, ["a"], tmp_path)
+
+    assert read(tmp_path, "a") == CONTENT
+    assert len(server.requests) == 1
+    assert server.requests[0][1]["Range"] == "bytes=5000-"
+    assert server.requests[0][1]["If-Range"] == '"v1"'
+
+
+def test_changed_remote_file(tmp_path):
+    old = bytes(5000)
+    write_part(tmp_path, "a", old, '\\"v1\\"')
+    server = Server({"a": (CONTENT, '"v2"')})
+    download(server, ["a"], tmp_path)
+
+    assert read(tmp_path, "a") == CONTENT
+
+
+def test_part_file_without_validator(tmp_path):
+    write_part(tmp_path, "a", bytes(5000))
+    server = Server({"a": (CONTENT, '"v1"')})
+    download(server, ["a"], tmp_path)
+
+    assert read(tmp_path, "a") == CONTENT
+    assert "Range" not in server.requests[0][1]
+
+
+def test_stale_part_file_larger(tmp_path):
+    write_part(tmp_path, "a", bytes(len(CONTENT) + 10), '\\"v1\\"')
+    server = Server({"a": (CONTENT, '"v1"')})
+    download(server, ["a"], tmp_path)
+
+    assert read(tmp_path, "a") == CONTENT
+
+
+def test_missing_files(tmp_path, capsys):
+    server = Server({})
+    download(server, ["a"], tmp_path, missing=["b"])
+
+    assert os.listdir(tmp_path) == []
+    assert "a is missing, error 404" in capsys.readouterr().out
+
+
+def test_concurrency_cap(tmp_path):
+    names = ["f{0}".format(i) for i in range(8)]
+    server = Server({n: (CONTENT, '"v1"') for n in names}, delay=0.05)
+    download(server, names, tmp_path, max_concurrent=2)
+
+    assert server.max_running == 2
+    assert all(read(tmp_path, n) == CONTENT for n in names)
+
+
+def test_from_stream_url(pbf_path, tmp_path):
+    with open(pbf_path, "rb") as f:
+        content = f.read()
+    server = Server({"a.osm.pbf": (content, '"v1"')})
+    path = str(tmp_path / "a.osm.pbf")
+
+    calls = []
+    with serve(server) as url:
+        osm = OSM.from_stream(url + "/a.osm.pbf", path, progress=lambda *x: calls.append(x))
+
+    with open(path, "rb") as f:
+        assert f.read() == content
+    assert len(osm._blocks) == len(OSM(pbf_path)._blocks)
+
+    # progress total is the content length of the response
+    assert calls[-1][1] == calls[-1][2] == len(content)
+
+
+LAST_MODIFIED = "Wed, 01 Jun 2022 00:00:00 GMT"
+
+
+def read_meta(filepath):
+    with open(filepath + ".meta") as f:
+        return json.load(f)
+
+
+def test_cached_file_revalidation(tmp_path):
+    server = Server({"catalog.json": (b"v1", '"v1"')}, last_modified=LAST_MODIFIED)
+    filepath = str(tmp_path / "cache" / "catalog.json")
+
+    with serve(server) as url:
+        assert cached_file(url + "/catalog.json", filepath) == filepath
+        meta = read_meta(filepath)
+        assert meta["etag"] == '"v1"' and meta["last_modified"] == LAST_MODIFIED
+
+        # a fresh copy is used without any request
+        cached_file(url + "/catalog.json", filepath)
+        assert len(server.requests) == 1
+
+        # an older copy is revalidated, the server answers 304 not modified
+        cached_file(url + "/catalog.json", filepath, max_age=0)
+        headers = server.requests[1][1]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == LAST_MODIFIED
+        assert read_meta(filepath)["checked"] > meta["checked"]
+        assert read_meta(filepath)["etag"] == '"v1"'
+
+        # a changed remote file replaces the copy
+        server.files["catalog.json"] = (b"v2", '"v2"')
+        cached_file(url + "/catalog.json", filepath, max_age=0)
+
+    assert len(server.requests) == 3
+    with open(filepath, "rb") as f:
+        assert f.read() == b"v2"
+    assert read_meta(filepath)["etag"] == '"v2"'
+    assert sorted(os.listdir(tmp_path / "cache")) == ["catalog.json", "catalog.json.meta"]
+
+
+def test_cached_file_offline(tmp_path, capsys):
+    server = Server({"catalog.json": (b"v1", '"v1"')})
+    filepath = str(tmp_path / "catalog.json")
+
+    with serve(server) as url:
+        with pytest.raises(ValueError):
+            cached_file(url + "/catalog.json", filepath, offline=True)
+        assert server.requests == []
+
+        cached_file(url + "/catalog.json", filepath)
+        assert cached_file(url + "/catalog.json", filepath, offline=True, max_age=0) == filepath
+        assert len(server.requests) == 1
+
+    # the server is gone, the last copy is used
+    assert cached_file(url + "/catalog.json", filepath, max_age=0) == filepath
+    assert "cannot be reached, using cached copy" in capsys.readouterr().out
+    with open(filepath, "rb") as f:
+        assert f.read() == b"v1"
+
+    # without a copy the error is raised
+    with pytest.raises(urllib.error.URLError):
+        cached_file(url + "/catalog.json", str(tmp_path / "other.json"))
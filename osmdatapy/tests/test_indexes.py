@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from osmdatapy import OSM, Query, Stats
+
+from .conftest import sorted_frame
+
+RELATIONS = Query(relations=True, geometry=True)
+
+
+def test_way_refs(osm, pbf_path, tmp_path):
+    expected = sorted_frame(osm.query(RELATIONS))
+    sidecar = str(tmp_path / "wayrefs")
+
+    osm.cache_way_refs(sidecar)
+    pd.testing.assert_frame_equal(sorted_frame(osm.query(RELATIONS)), expected)
+
+    # second open loads the saved cache
+    stats = Stats()
+    other = OSM(pbf_path, stats=stats)
+    other.cache_way_refs(sidecar)
+    assert stats.stages["load"]["ways"] == len(osm._way_refs)
+    pd.testing.assert_frame_equal(sorted_frame(other.query(RELATIONS)), expected)
+
+
+def test_parent_relations(osm):
+    members = osm.query(Query(relations=True, tags=False))
+    ways = members.loc[members["type"] == 1]
+    ids = ways["memid"].unique()[:20]
+
+    res = osm.parent_relations(ids, type="way")
+    expected = ways.loc[ways["memid"].isin(ids)].reset_index()
+
+    res = res.sort_values(["relid", "memid"]).reset_index(drop=True)
+    expected = expected.sort_values(["osmid", "memid"]).reset_index(drop=True)
+    assert res["memid"].tolist() == expected["memid"].tolist()
+    assert res["relid"].tolist() == expected["osmid"].tolist()
+    assert res["role"].tolist() == expected["role"].tolist()
+
+    assert len(osm.parent_relations(10**12)) == 0
+
+
+def test_way_ids_index(pbf_path):
+    stats = Stats()
+    osm = OSM(pbf_path, stats=stats)
+    ways = osm.query(Query(ways=True, tags=["name"]))
+    ids = ways.index[[0, 5, 10]].tolist() + [10**12]
+
+    res = osm.query(Query(ways=True, way_ids=ids, tags=["name"]))
+    pd.testing.assert_frame_equal(res, ways.loc[ids[:3]].sort_index())
+
+    # only the block of these ways is parsed
+    assert stats.stages["block_query"]["blocks_parsed"] == 1
+
+
+def test_node_ids_index(pbf_path):
+    stats = Stats()
+    osm = OSM(pbf_path, stats=stats)
+    ids = [1, 2, 1500, 10**12]
+
+    res = osm.query(Query(nodes=True, node_ids=ids, geometry=True))
+    assert res.index.tolist() == ids[:3]
+    np.testing.assert_allclose(np.array([[p.x, p.y] for p in res.geometry]), osm.coords(ids[:3]), atol=1e-6)
+    assert stats.stages["block_query"]["blocks_parsed"] == 2
+
+
+def test_dense_offsets_skip_empty_groups():
+    block = {"dense_offsets": [(0, 10), (10, 10), (10, 30)], "dense_ranges": [(1, 5), None, (6, 9)]}
+
+    assert Query._dense_offsets(block, np.array([2, 7])) == [(0, 10), (10, 30)]
+    assert Query._dense_offsets(block, np.array([7])) == [(10, 30)]
+
+
+def test_node_array_sorted_once():
+    query = Query(nodes=True, node_ids=[5, 1, 3])
+
+    assert query.as_dict()["node_array"].tolist() == [1, 3, 5]
+    query.node_set = None
+    assert query.as_dict()["node_array"] is None
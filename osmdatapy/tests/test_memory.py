@@ -0,0 +1,44 @@
+import numpy as np
+
+from osmdatapy import OSM
+from osmdatapy.memory import deep_sizeof
+
+
+def test_deep_sizeof_views():
+    data = np.zeros(100000, dtype="int64")
+    size = deep_sizeof(data)
+    assert size >= data.nbytes
+
+    # views of the same array count its data once
+    views = [data[:50000], data[50000:], data[::2]]
+    assert data.nbytes <= deep_sizeof(views) < 2 * data.nbytes
+    assert deep_sizeof([data, views]) < 2 * data.nbytes
+
+
+def test_memory_usage_way_refs(osm):
+    mem = osm.memory_usage()
+    assert mem.loc["way_refs", "bytes"] == 0
+
+    osm.cache_way_refs(sidecar=False)
+    mem = osm.memory_usage()
+
+    refs = osm._way_refs
+    assert mem.loc["way_refs", "bytes"] == refs.ids.nbytes + refs.offsets.nbytes + refs.refs.nbytes
+    assert mem.loc["way_refs", "items"] == len(refs)
+
+
+def test_memory_usage_context_blocks(osm):
+    mem = [OSM.from_shard(s).memory_usage().loc["context_blocks"] for s in osm.shards(n=5)]
+    with_context = [m for m in mem if m["items"] > 0]
+
+    assert with_context
+    assert all(m["bytes"] > 1000 for m in with_context)
+
+
+def test_memory_usage_members(osm):
+    assert osm.memory_usage().loc["members", "bytes"] == 0
+
+    osm.parent_relations([1])
+    mem = osm.memory_usage()
+    assert mem.loc["members", "bytes"] >= 4 * osm._members.memids.nbytes
+    assert mem.loc["members", "items"] == len(osm._members) > 0
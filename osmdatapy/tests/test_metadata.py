@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from osmdatapy import OSM, Query
+from osmdatapy.writer import PBFWriter
+
+SINCE = np.datetime64("2022-01-01T00:00:00", "s")
+UNTIL = np.datetime64("2023-01-01T00:00:00", "s")
+DAY = np.timedelta64(1, "D")
+
+
+def _seconds(date):
+    return int(date.astype("int64"))
+
+
+@pytest.fixture
+def dated_path(tmp_path):
+    # nodes 1-4 and ways 5-8 edited before, on, and after the bounds
+    times = [SINCE - DAY, SINCE, UNTIL, UNTIL + DAY]
+    strings = ["highway", "track"]
+    ids = [[i + 1, 0, i + 1, _seconds(t), 100 + i] for i, t in enumerate(times)]
+    ids += [[i + 5, 1, i + 1, _seconds(t), 200 + i] for i, t in enumerate(times)]
+    ids = np.array(ids, dtype=np.int64)
+    tags = np.array([[i, 0, 1] for i in range(4, 8)], dtype=np.int64)
+    rels = np.array([[i, 1, 0, -1, 0] for i in range(4, 8)] + [[i, 2, 0, -1, 0] for i in range(4, 8)], dtype=np.int64)
+    coords = np.zeros((8, 2), dtype=np.int64)
+    coords[:4, 0] = np.arange(1, 5) * 1_000_000_000
+    coords[:4, 1] = 48_000_000_000
+    path = str(tmp_path / "dated.osm.pbf")
+    with PBFWriter(path) as writer:
+        writer.write_block(ids, tags, rels, strings, coords)
+    return path
+
+
+@pytest.mark.parametrize(
+    "since, until, expected",
+    [
+        (SINCE, None, [2, 3, 4]),
+        (None, UNTIL, [1, 2, 3]),
+        (SINCE, UNTIL, [2, 3]),
+        ("2022-01-02", "2022-12-31", []),
+    ],
+)
+def test_time_filter(dated_path, since, until, expected):
+    osm = OSM(dated_path)
+    nodes = osm.query(Query(nodes=True, since=since, until=until))
+    assert sorted(nodes.index) == expected
+    ways = osm.query(Query(ways=True, tags=["highway"], since=since, until=until))
+    assert sorted(ways.index) == [i + 4 for i in expected]
+
+
+def test_metadata_dtypes(dated_path):
+    nodes = OSM(dated_path).query(Query(nodes=True, metadata=True))
+    assert nodes["version"].dtype == np.int32
+    assert nodes["changeset"].dtype == np.int64
+    assert nodes["timestamp"].dtype == np.dtype("datetime64[s]")
+    assert nodes.loc[2, "timestamp"] == SINCE
+    assert nodes.loc[3, "version"] == 3
+    assert nodes.loc[4, "changeset"] == 103
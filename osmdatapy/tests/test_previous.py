@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from osmdatapy import OSM, Query, Stats
+from osmdatapy.changes import drop_rows
+from osmdatapy.writer import PBFWriter
+
+from .conftest import sorted_frame
+
+QUERY = Query(nodes=True, ways=True, relations=True, metadata=True, geometry=True)
+
+
+def _modified_copy(osm, path, position):
+    """Copy of the file of osm, the block at position is re-encoded without its last object"""
+
+    mapper = osm._string_to_pos(osm.strings)
+    strmap = {k: mapper[k] for k in QUERY.all_strings() if k in mapper}
+
+    with open(osm.filepath, "rb") as f, PBFWriter(
+        path, osm.features, osm.optional_features
+    ) as writer:
+        for i, bl in enumerate(osm._blocks):
+            if i != position:
+                f.seek(bl["blob_offset"])
+                writer.write_raw(f.read(bl["blob_end"] - bl["blob_offset"]))
+                continue
+
+            _, ids, tags, rels = osm._parse_extract_block(f, bl, [QUERY.block_query(bl, strmap)])
+            keep = np.arange(len(ids)) < len(ids) - 1
+            writer.write_block(*drop_rows(ids, tags, rels, keep), osm.strings)
+    return path
+
+
+def test_previous_blocks(osm, tmp_path):
+    # a way block is modified, other blocks are reused
+    position = next(i for i, bl in enumerate(osm._blocks) if len(bl["way_offsets"]) > 0)
+    path = _modified_copy(osm, str(tmp_path / "modified.osm.pbf"), position)
+
+    stats = Stats()
+    reopened = OSM(path, previous=osm, stats=stats)
+    assert stats.stages["reuse"]["blocks"] == len(osm._blocks) - 1
+
+    expected = sorted_frame(OSM(path).query(QUERY))
+    pd.testing.assert_frame_equal(sorted_frame(reopened.query(QUERY)), expected)
+    assert len(expected) == len(osm.query(QUERY)) - 1
@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pytest
+
+from osmdatapy import OSM, Query, CancelToken, Cancelled
+
+
+def test_open_progress(pbf_path):
+    calls = []
+    osm = OSM(pbf_path, progress=lambda *x: calls.append(x))
+
+    # header and data blocks, bytes up to the file size
+    size = os.path.getsize(pbf_path)
+    assert [c[3] for c in calls] == list(range(1, len(osm._blocks) + 2))
+    assert all(c[0] == "open" and c[2] == size for c in calls)
+    assert calls[-1][1] == size
+
+
+def test_query_progress(osm):
+    calls = []
+    osm.query(Query(ways=True), progress=lambda *x: calls.append(x))
+
+    # one call by block with ways, with bytes and blocks done and totals
+    sizes = [bl["end_offset"] - bl["start_offset"] for bl in osm._blocks if len(bl["way_offsets"])]
+    done = np.cumsum(sizes).tolist()
+    n = len(sizes)
+    assert calls == [("query", done[i], done[-1], i + 1, n) for i in range(n)]
+
+
+def test_query_cancel(osm):
+    token = CancelToken()
+    calls = []
+
+    def progress(*x):
+        calls.append(x)
+        if len(calls) == 2:
+            token.cancel()
+
+    # the query stops at the next block
+    with pytest.raises(Cancelled):
+        osm.query(Query(nodes=True), progress=progress, cancel=token)
+    assert len(calls) == 2
+
+    token.reset()
+    assert len(osm.query(Query(nodes=True), cancel=token)) > 0
+
+
+def test_extract_cancel(osm, tmp_path):
+    token = CancelToken()
+    token.cancel()
+    path = str(tmp_path / "extract.osm.pbf")
+
+    with pytest.raises(Cancelled):
+        osm.extract(Query(nodes=True, ways=True), path, cancel=token)
+    assert not os.path.exists(path)
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import shapely as sh
+
+from osmdatapy import OSM, Query
+
+
+def _assert_same_geometries(geoms, expected):
+    assert len(geoms) == len(expected)
+    missing = pd.isna(expected)
+    assert all(g is None for g in geoms[missing])
+    assert sh.equals(geoms[~missing], expected[~missing]).all()
+
+
+def test_ragged_geometries(osm):
+    query = dict(nodes=True, ways=True, relations=True)
+    df, ragged = osm.query(Query(**query, geometry="ragged"))
+    expected = osm.query(Query(**query, geometry=True))
+
+    assert len(ragged) == len(df)
+    pd.testing.assert_index_equal(df.index, expected.index)
+    assert set(ragged.geom_types.tolist()) == {1, 2, 3}
+    _assert_same_geometries(ragged.to_shapely(), expected.geometry.to_numpy())
+
+
+def test_ragged_take(osm):
+    _, ragged = osm.query(Query(relations=True, geometry="ragged"))
+    rows = np.array([3, 0, 3])
+    _assert_same_geometries(ragged.take(rows).to_shapely(), ragged.to_shapely()[rows])
+
+
+def test_ragged_shards(osm):
+    query = Query(ways=True, relations=True, geometry="ragged")
+    res = [OSM.from_shard(s).query(query) for s in osm.shards(n=3)]
+
+    df = pd.concat([df for df, _ in res])
+    geoms = np.concatenate([ragged.to_shapely() for _, ragged in res])
+    order = np.lexsort((df.index, df["osmtype"]))
+
+    expected = osm.query(Query(ways=True, relations=True, geometry=True))
+    expected = expected.iloc[np.lexsort((expected.index, expected["osmtype"]))]
+    assert df.index[order].tolist() == expected.index.tolist()
+    _assert_same_geometries(geoms[order], expected.geometry.to_numpy())
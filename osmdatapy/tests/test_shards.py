@@ -0,0 +1,36 @@
+import json
+
+import pandas as pd
+import pytest
+
+from osmdatapy import OSM, Query
+
+from .conftest import sorted_frame
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8])
+def test_shards_results(osm, n):
+    shards = osm.shards(n=n)
+    assert len(shards) <= n
+
+    # shards are sent to workers as json
+    shards = [json.loads(json.dumps(s)) for s in shards]
+
+    query = Query(ways=True, relations=True, geometry=True)
+    res = [OSM.from_shard(s).query(query) for s in shards]
+    res = pd.concat([df for df in res if len(df) > 0])
+    pd.testing.assert_frame_equal(sorted_frame(res), sorted_frame(osm.query(query)), check_like=True)
+
+
+def test_shards_node_blocks(osm):
+    # node blocks are context of shards with ways or relations using their nodes only
+    for s in osm.shards(n=5):
+        shard = OSM.from_shard(s)
+        if not any(len(bl["way_offsets"]) or len(bl["rel_offsets"]) for bl in shard._blocks):
+            assert s["nodes"] == []
+
+
+def test_shards_tiles(osm):
+    shards = osm.shards(tile_size=0.02)
+    blocks = sorted(b for s in shards for b in s["blocks"])
+    assert len(blocks) == len(set(map(tuple, blocks)))
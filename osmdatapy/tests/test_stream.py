@@ -0,0 +1,61 @@
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from osmdatapy import OSM, Query
+from osmdatapy.stream import RangeReader
+
+from .conftest import sorted_frame
+
+QUERY = Query(nodes=True, ways=True, relations=True, metadata=True, geometry=True)
+
+
+class Chunks(io.BytesIO):
+    """Binary stream returning at most 1000 bytes by read, as a network response"""
+
+    def read(self, size=-1):
+        return super().read(1000 if size < 0 else min(size, 1000))
+
+
+def test_from_stream(osm, pbf_path, tmp_path):
+    with open(pbf_path, "rb") as f:
+        content = f.read()
+    path = str(tmp_path / "stream.osm.pbf")
+    res = OSM.from_stream(Chunks(content), path)
+
+    with open(path, "rb") as f:
+        assert f.read() == content
+    assert not os.path.exists(path + ".part")
+    pd.testing.assert_frame_equal(sorted_frame(res.query(QUERY)), sorted_frame(osm.query(QUERY)))
+
+
+def test_from_stream_truncated(pbf_path, tmp_path):
+    with open(pbf_path, "rb") as f:
+        content = f.read()
+    path = str(tmp_path / "stream.osm.pbf")
+
+    with pytest.raises(ValueError):
+        OSM.from_stream(Chunks(content[: len(content) // 2]), path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_range_reader(tmp_path):
+    path = tmp_path / "data"
+    path.write_bytes(bytes(range(100)))
+
+    with open(path, "rb") as f:
+        reader = RangeReader(f, [(0, 10), (50, 56), (90, 100)])
+        chunks, positions = [], []
+        while True:
+            positions.append(reader.tell())
+            chunk = reader.read(4)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    # reads stop at the end of each range, positions are file positions
+    assert [len(c) for c in chunks] == [4, 4, 2, 4, 2, 4, 4, 2]
+    assert b"".join(chunks) == bytes(list(range(10)) + list(range(50, 56)) + list(range(90, 100)))
+    assert positions == [0, 4, 8, 10, 54, 56, 94, 98, 100]
@@ -0,0 +1,192 @@
+import numpy as np
+import shapely as sh
+
+from osmdatapy import OSM, Query
+from osmdatapy._topology import segments, node_counts, row_offsets, concat_ranges, assemble_rings
+from osmdatapy.defaults import ONEWAY_FORWARD, ONEWAY_BACKWARD
+from osmdatapy.graph import build_graph, _segment_length
+from osmdatapy.writer import PBFWriter
+
+
+def test_segments_split_shared_nodes():
+    # node 2 is inside both ways
+    refs = np.array([1, 2, 3, 4, 2, 5])
+    ptids, ix, seg_offsets, ways, source, target = segments(refs, np.array([0, 3, 6]))
+
+    assert ptids.tolist() == [1, 2, 2, 3, 4, 2, 2, 5]
+    assert ix.tolist() == [0, 0, 1, 1, 2, 2, 3, 3]
+    assert seg_offsets.tolist() == [0, 2, 4, 6, 8]
+    assert ways.tolist() == [0, 0, 1, 1]
+    assert source.tolist() == [1, 2, 4, 2]
+    assert target.tolist() == [2, 3, 2, 5]
+
+
+def test_segments_keep_end_nodes():
+    # ways meet at their ends only
+    refs = np.array([1, 2, 3, 3, 4])
+    ptids, ix, _, ways, source, target = segments(refs, np.array([0, 3, 5]))
+
+    assert ptids.tolist() == refs.tolist()
+    assert ways.tolist() == [0, 1]
+    assert source.tolist() == [1, 3]
+    assert target.tolist() == [3, 4]
+
+
+def test_segments_empty_ways():
+    # ways 0, 2 and 4 have no node
+    refs = np.array([1, 2, 3, 3, 4])
+    ptids, _, seg_offsets, ways, source, target = segments(refs, np.array([0, 0, 3, 3, 5, 5]))
+
+    assert ptids.tolist() == refs.tolist()
+    assert seg_offsets.tolist() == [0, 3, 5]
+    assert ways.tolist() == [1, 3]
+    assert source.tolist() == [1, 3]
+    assert target.tolist() == [3, 4]
+
+
+def test_node_counts():
+    assert node_counts(np.array([3, 1, 3, 2, 3])).tolist() == [3, 1, 3, 1, 3]
+
+
+def test_row_offsets():
+    assert row_offsets(np.array([0, 0, 1, 4, 4, 4])).tolist() == [0, 2, 3, 6]
+    assert row_offsets(np.array([], dtype=np.int64)).tolist() == [0]
+
+
+def test_concat_ranges():
+    assert concat_ranges(np.array([5, 0, 2]), np.array([2, 0, 3])).tolist() == [5, 6, 2, 3, 4]
+
+
+def test_assemble_rings():
+    # group 0: ways 1-2, 4-3-2 reversed and 4-1 make a ring, group 1: a closed way,
+    # a way of 2 nodes and an open way closed on its first node
+    refs = np.array([1, 2, 4, 3, 2, 4, 1, 5, 6, 7, 5, 8, 9, 10, 11, 12])
+    groups = np.array([0, 0, 0, 1, 1, 1])
+    starts = np.array([0, 2, 5, 7, 11, 13])
+    counts = np.array([2, 3, 2, 4, 2, 3])
+    ptids, ring_offsets, ring_groups = assemble_rings(groups, starts, counts, refs)
+
+    assert ptids.tolist() == [1, 2, 3, 4, 1, 5, 6, 7, 5, 10, 11, 12, 10]
+    assert ring_offsets.tolist() == [0, 5, 9, 13]
+    assert ring_groups.tolist() == [0, 1, 1]
+
+
+def test_relation_geometry(tmp_path):
+    # multipolygon of a square made of 3 ways, one reversed, and a square with a hole,
+    # route of 2 disjoint ways
+    strings = ["type", "multipolygon", "route", "outer", "inner"]
+    square = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    hole = [(2.25, 0.25), (2.75, 0.25), (2.5, 0.75)]
+    points = square + [(x + 2, y) for x, y in square] + hole + [(0, 2), (1, 2), (2, 2)]
+    ways = [[1, 2], [3, 4, 1], [3, 2], [5, 6, 7, 8, 5], [9, 10, 11, 9], [12, 13], [14, 13]]
+    members = [(1, "outer"), (2, "outer"), (3, "outer"), (4, "outer"), (5, "inner")]
+
+    ids = [[i, 0] for i in range(1, 15)] + [[i + 1, 1] for i in range(7)] + [[1, 2], [2, 2]]
+    rels = [[14 + w, node, 0, -1, 0] for w, refs in enumerate(ways) for node in refs]
+    rels += [[21, way, 1, strings.index(role), 0] for way, role in members]
+    rels += [[22, way, 1, 2, 0] for way in (6, 7)]
+    tags = [[21, 0, 1], [22, 0, 2]]
+    coords = [(2_000_000_000 + x * 10**7, 48_000_000_000 + y * 10**7) for x, y in points]
+    coords += [(0, 0)] * 9
+
+    path = str(tmp_path / "relations.osm.pbf")
+    with PBFWriter(path) as writer:
+        writer.write_block(
+            np.array(ids), np.array(tags), np.array(rels), strings, np.array(coords, dtype=np.int64)
+        )
+
+    df = OSM(path).query(Query(relations=True, geometry=True))
+    multipolygon, route = df.loc[1, "geometry"], df.loc[2, "geometry"]
+
+    assert multipolygon.geom_type == "MultiPolygon" and multipolygon.is_valid
+    np.testing.assert_allclose(multipolygon.area, 2 * 0.01**2 - 0.5 * 0.005**2, rtol=1e-3)
+    assert route.geom_type == "MultiLineString"
+    assert sh.get_num_geometries(route) == 2
+
+    _, ragged = OSM(path).query(Query(relations=True, geometry="ragged"))
+    assert sh.equals(ragged.to_shapely(), df.geometry.to_numpy()).all()
+
+
+def _coords(ids):
+    # nodes on a line, 1 degree of longitude apart
+    return np.column_stack([np.asarray(ids, dtype=np.float64), np.zeros(len(ids))])
+
+
+def _edges(refs, rows, direction):
+    wayids = np.arange(len(direction)) + 10
+    graph = build_graph(np.array(refs), np.array(rows), wayids, np.array(direction), _coords)
+    return graph, sorted(zip(*[graph.edges()[c].tolist() for c in ("source", "target", "wayid")]))
+
+
+def test_graph_contract_chains():
+    # ways 10, 11 and 12 follow each other, way 13 branches on node 5
+    refs = [1, 2, 3, 3, 4, 5, 5, 6, 5, 7]
+    rows = [0, 0, 0, 1, 1, 1, 2, 2, 3, 3]
+    graph, edges = _edges(refs, rows, [1, 1, 1, 1])
+
+    assert edges == [(1, 5, 10), (5, 6, 12), (5, 7, 13)]
+    assert graph.nodes.tolist() == [1, 5, 6, 7]
+    length = graph.edges().set_index("source")["length"]
+    np.testing.assert_allclose(length[1], 4 * length[5].min(), rtol=1e-9)
+
+
+def test_graph_keep_oneway_changes():
+    # the oneway value changes on node 3, ways in opposite directions are not merged
+    graph, edges = _edges([1, 2, 3, 3, 4, 6, 5, 4], [0, 0, 0, 1, 1, 2, 2, 2], [0, 1, 0])
+
+    assert edges == [(1, 3, 10), (3, 1, 10), (3, 4, 11), (4, 6, 12), (6, 4, 12)]
+
+
+def test_graph_contract_ring():
+    # two ways closed in a ring keep a single node
+    graph, edges = _edges([1, 2, 3, 3, 4, 1], [0, 0, 0, 1, 1, 1], [1, 1])
+
+    assert len(graph) == 1
+    assert len(edges) == 1
+
+
+def test_graph_contract_two_way():
+    # two-way ways 10 and 11 digitized toward each other, then away from each other,
+    # the second merged edge starts on way 11
+    _, edges = _edges([1, 2, 3, 5, 4, 3], [0, 0, 0, 1, 1, 1], [0, 0])
+    assert edges == [(1, 5, 10), (5, 1, 10)]
+
+    _, edges = _edges([3, 2, 1, 3, 4, 5], [0, 0, 0, 1, 1, 1], [0, 0])
+    assert edges == [(1, 5, 11), (5, 1, 11)]
+
+
+def test_graph_empty():
+    empty = np.array([], dtype=np.int64)
+    graph = build_graph(empty, empty, empty, empty, _coords)
+
+    assert len(graph) == 0
+    assert graph.indptr.tolist() == [0]
+    assert len(graph.edges()) == 0
+
+
+def test_query_topology(osm):
+    df = osm.query(Query("highways", geometry=True, topology=True))
+
+    assert {"source", "target"} <= set(df.columns)
+    assert df.index.is_monotonic_increasing
+
+    # segments start and end on their source and target nodes
+    coords = osm.coords(df["source"].to_numpy())
+    first = np.array([g.coords[0] for g in df.geometry])
+    np.testing.assert_allclose(first, coords, atol=1e-6)
+
+
+def test_osm_graph(osm):
+    graph = osm.graph(Query("highways"))
+    edges = graph.edges()
+    ways = osm.query(Query("highways", geometry=True))
+
+    assert set(edges["wayid"]) <= set(ways.index)
+    assert (graph.indptr[1:] >= graph.indptr[:-1]).all()
+    assert graph.indptr[-1] == len(edges)
+
+    # edges cover each way once, twice for two-way ways
+    coords, ix = sh.get_coordinates(ways.geometry.to_numpy(), return_index=True)
+    length = _segment_length(coords, ix)
+    oneway = ways["oneway"].isin(ONEWAY_FORWARD + ONEWAY_BACKWARD).to_numpy()
+    np.testing.assert_allclose(edges["length"].sum(), (length * np.where(oneway, 1, 2)).sum())
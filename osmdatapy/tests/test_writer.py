@@ -0,0 +1,40 @@
+import pandas as pd
+
+from osmdatapy import OSM, Query
+
+from .conftest import sorted_frame
+
+# buildings and multipolygons with their untagged member ways, blocks are re-encoded
+BUILDINGS = {"keep": {"building": []}, "ways": True, "relations": True}
+
+
+def test_extract_ways(osm, tmp_path):
+    path = str(tmp_path / "extract.osm.pbf")
+    osm.extract(Query(**BUILDINGS), path)
+
+    extract = OSM(path)
+    ways = extract.query(Query(ways=True))
+    assert ways["building"].isna().any()
+
+    query = Query(**BUILDINGS, geometry=True)
+    res = sorted_frame(extract.query(query))
+    expected = sorted_frame(osm.query(query))
+    pd.testing.assert_frame_equal(res, expected, check_like=True)
+
+
+def test_extract_ragged(osm, tmp_path):
+    path = str(tmp_path / "extract.osm.pbf")
+    osm.extract(Query(**BUILDINGS), path)
+
+    df, geoms = OSM(path).query(Query(ways=True, geometry="ragged"))
+    assert len(df) == len(geoms) > 0
+
+
+def test_extract_copy(osm, pbf_path, tmp_path):
+    path = str(tmp_path / "extract.osm.pbf")
+    osm.extract(Query(nodes=True, ways=True, relations=True), path)
+
+    query = Query(nodes=True, ways=True, relations=True, metadata=True)
+    res = sorted_frame(OSM(path).query(query))
+    expected = sorted_frame(osm.query(query))
+    pd.testing.assert_frame_equal(res, expected, check_like=True)
@@ -0,0 +1,90 @@
+import os
+import json
+
+import numpy as np
+
+from ._topology import concat_ranges
+
+ARRAYS = ["ids", "offsets", "refs"]
+
+
+class WayRefs:
+    """
+    Node ids of ways stored in compressed sparse rows, ways are sorted by id
+
+    Parameters
+    ----------
+    ids : array of sorted way ids
+    offsets : array of start positions in refs of the node ids of each way, and end of refs
+    refs : array of node ids of all ways
+    """
+
+    def __init__(self, ids, offsets, refs):
+        self.ids = ids
+        self.offsets = offsets
+        self.refs = refs
+
+    def __len__(self):
+        return len(self.ids)
+
+    def nbytes(self):
+        return sum(getattr(self, k).nbytes for k in ARRAYS)
+
+    @classmethod
+    def from_parts(cls, ids, counts, refs):
+        """Build from lists of way ids, number of nodes and node ids arrays, in any order"""
+
+        if not ids:
+            return cls(*(np.empty(n, dtype=np.int64) for n in (0, 1, 0)))
+
+        ids, counts, refs = np.concatenate(ids), np.concatenate(counts), np.concatenate(refs)
+        starts = np.cumsum(counts) - counts
+
+        order = np.argsort(ids, kind="stable")
+        counts = counts[order]
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+
+        return cls(ids[order], offsets, refs[concat_ranges(starts[order], counts)])
+
+    def lookup(self, way_ids):
+        """Array of way id and node id of each node of ways in way_ids, missing ways are ignored"""
+
+        way_ids = np.asarray(way_ids, dtype=np.int64)
+        ix = np.searchsorted(self.ids, way_ids)
+        found = ix < len(self.ids)
+        found[found] = self.ids[ix[found]] == way_ids[found]
+        way_ids, ix = way_ids[found], ix[found]
+
+        starts = self.offsets[ix]
+        counts = self.offsets[ix + 1] - starts
+        return np.column_stack([np.repeat(way_ids, counts), self.refs[concat_ranges(starts, counts)]])
+
+    def save(self, path, identity):
+        """Save arrays as .npy files in path directory, with the identity of the source files"""
+
+        identity_path = os.path.join(path, "identity.json")
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(identity_path):
+            os.remove(identity_path)
+
+        for name in ARRAYS:
+            np.save(os.path.join(path, name + ".npy"), getattr(self, name))
+
+        # identity is written last, a partial save is never loaded
+        with open(identity_path, "w") as f:
+            json.dump(identity, f)
+
+    @classmethod
+    def load(cls, path, identity, mmap=True):
+        """Load arrays saved in path, memory-mapped if mmap, None if missing or saved for other files"""
+
+        identity_path = os.path.join(path, "identity.json")
+        if not os.path.exists(identity_path):
+            return None
+        with open(identity_path) as f:
+            if json.load(f) != json.loads(json.dumps(identity)):
+                return None
+
+        mode = "r" if mmap else None
+        return cls(*(np.load(os.path.join(path, name + ".npy"), mmap_mode=mode) for name in ARRAYS))
@@ -0,0 +1,314 @@
+# PBF writer of query results and raw blobs
+
+import zlib
+from struct import pack
+
+import numpy as np
+
+GRANULARITY = 100
+WRITING_PROGRAM = "osmdatapy"
+MASK64 = (1 << 64) - 1
+VECTORIZE_SIZE = 64
+
+
+class PBFWriter:
+    """
+    Write an OSM pbf file from raw blobs copied from another file or from query results
+
+    Parameters
+    ----------
+    filepath : path of the pbf file to write
+    features : list of required features of the header block
+    optional_features : list of optional features of the header block, e.g. Sort.Type_then_ID
+    """
+
+    def __init__(self, filepath, features=None, optional_features=None):
+        self.filepath = filepath
+        self.f = open(filepath, "wb")
+        self.blocks = 0
+
+        features = ["OsmSchema-V0.6", "DenseNodes"] + list(features or [])
+        self.f.write(header_blob(list(dict.fromkeys(features)), optional_features or []))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.f.close()
+
+    def write_raw(self, data):
+        """Write a blob header and blob copied from a pbf file"""
+        self.f.write(data)
+        self.blocks += 1
+
+    def write_block(self, ids, tags, rels, strings, coords=None):
+        """
+        Encode query results in a primitive block
+
+        Parameters
+        ----------
+        ids, tags, rels : query results arrays, rels must contain node ids of ways
+        strings : list of global strings, values in tags and relation roles are positions in strings
+        coords : lon, lat integer coordinates in nanodegrees of each node in ids
+        """
+
+        ids, tags, rels, coords = sort_results(ids, tags, rels, coords)
+        self.f.write(_blob("OSMData", primitive_block(ids, tags, rels, strings, coords)))
+        self.blocks += 1
+
+
+def sort_results(ids, tags, rels, coords=None):
+    """Sort results by osm type and id, reorder tags, rels and coordinates"""
+
+    order = np.lexsort((ids[:, 0], ids[:, 1]))
+    inverse = np.empty_like(order)
+    inverse[order] = np.arange(len(order))
+
+    ids = ids[order]
+    if coords is not None:
+        coords = coords[order]
+    if tags is not None:
+        tags = tags.copy()
+        tags[:, 0] = inverse[tags[:, 0]]
+        tags = tags[np.argsort(tags[:, 0], kind="stable")]
+    if rels is not None:
+        rels = rels.copy()
+        rels[:, 0] = inverse[rels[:, 0]]
+        rels = rels[np.argsort(rels[:, 0], kind="stable")]
+
+    return ids, tags, rels, coords
+
+
+# -------------------------------------------------------------
+# blocks
+
+
+def header_blob(features, optional_features):
+    """Encode a header block in a blob"""
+
+    data = b"".join(_field_bytes(4, f.encode()) for f in features)
+    data += b"".join(_field_bytes(5, f.encode()) for f in optional_features)
+    data += _field_bytes(16, WRITING_PROGRAM.encode())
+    return _blob("OSMHeader", data)
+
+
+def primitive_block(ids, tags, rels, strings, coords=None):
+    """Encode results sorted by osm type in a primitive block with one group by osm type"""
+
+    table, tags, roles = _stringtable(ids, tags, rels, strings)
+
+    tag_offsets = _offsets(tags, len(ids))
+    rel_offsets = _offsets(rels, len(ids))
+
+    data = _field_bytes(1, b"".join(_field_bytes(1, s.encode()) for s in table))
+
+    types = ids[:, 1]
+    nodes = np.flatnonzero(types == 0)
+    if len(nodes) > 0:
+        group = dense_nodes(ids[nodes], tags, tag_offsets, nodes, coords[nodes])
+        data += _field_bytes(2, _field_bytes(2, group))
+
+    ways = np.flatnonzero(types == 1)
+    if len(ways) > 0:
+        group = b"".join(
+            _field_bytes(3, way(ids[i], tags, tag_offsets, i, rels, rel_offsets))
+            for i in ways
+        )
+        data += _field_bytes(2, group)
+
+    relations = np.flatnonzero(types == 2)
+    if len(relations) > 0:
+        group = b"".join(
+            _field_bytes(4, relation(ids[i], tags, tag_offsets, i, rels, roles, rel_offsets))
+            for i in relations
+        )
+        data += _field_bytes(2, group)
+
+    return data
+
+
+def _stringtable(ids, tags, rels, strings):
+    """
+    Local string table of a block, first string is empty,
+    returns table, tags and relation roles as local positions
+    """
+
+    used = []
+    if tags is not None:
+        used.extend([tags[:, 1], tags[:, 2]])
+
+    roles = None
+    if rels is not None:
+        roles = np.where(ids[rels[:, 0], 1] == 2, rels[:, 3], -1)
+        used.append(roles[roles >= 0])
+
+    if not used:
+        return [""], tags, roles
+
+    uniq = np.unique(np.concatenate(used))
+    if tags is not None:
+        tags = tags.copy()
+        tags[:, 1:] = np.searchsorted(uniq, tags[:, 1:]) + 1
+    if roles is not None:
+        roles = np.searchsorted(uniq, roles) + 1
+
+    return [""] + [strings[i] for i in uniq], tags, roles
+
+
+def _offsets(res, length):
+    """start and end offsets in res rows of each position"""
+    if res is None:
+        return np.zeros(length + 1, dtype=np.int64)
+    return np.searchsorted(res[:, 0], np.arange(length + 1))
+
+
+# -------------------------------------------------------------
+# osm objects
+
+
+def dense_nodes(ids, tags, tag_offsets, positions, coords):
+    """Encode nodes in a dense nodes message, coords are lon and lat in nanodegrees"""
+
+    lon = np.round(coords[:, 0] / GRANULARITY).astype(np.int64)
+    lat = np.round(coords[:, 1] / GRANULARITY).astype(np.int64)
+
+    data = _field_packed(1, ids[:, 0], signed=True, delta=True)
+    if ids.shape[1] > 2:
+        info = _field_packed(1, ids[:, 2])
+        info += _field_packed(2, ids[:, 3], signed=True, delta=True)
+        info += _field_packed(3, ids[:, 4], signed=True, delta=True)
+        data += _field_bytes(5, info)
+    data += _field_packed(8, lat, signed=True, delta=True)
+    data += _field_packed(9, lon, signed=True, delta=True)
+
+    # keys and values of each node, ended by 0
+    if tags is not None:
+        starts, ends = tag_offsets[positions], tag_offsets[positions + 1]
+        counts = ends - starts
+        keyvals = np.zeros(2 * counts.sum() + len(positions), dtype=np.int64)
+
+        first = np.cumsum(2 * counts + 1) - (2 * counts + 1)
+        rows = np.repeat(np.arange(len(positions)), counts)
+        pos = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        src = np.repeat(starts, counts) + pos
+
+        keyvals[first[rows] + 2 * pos] = tags[src, 1]
+        keyvals[first[rows] + 2 * pos + 1] = tags[src, 2]
+        data += _field_packed(10, keyvals)
+
+    return data
+
+
+def way(ids, tags, tag_offsets, position, rels, rel_offsets):
+    """Encode a way message"""
+
+    data = _field_varint(1, ids[0])
+    data += _tags(tags, tag_offsets, position)
+    data += _info(ids)
+
+    refs = rels[rel_offsets[position] : rel_offsets[position + 1], 1]
+    data += _field_packed(8, refs, signed=True, delta=True)
+
+    return data
+
+
+def relation(ids, tags, tag_offsets, position, rels, roles, rel_offsets):
+    """Encode a relation message"""
+
+    data = _field_varint(1, ids[0])
+    data += _tags(tags, tag_offsets, position)
+    data += _info(ids)
+
+    st, end = rel_offsets[position], rel_offsets[position + 1]
+    data += _field_packed(8, roles[st:end])
+    data += _field_packed(9, rels[st:end, 1], signed=True, delta=True)
+    data += _field_packed(10, rels[st:end, 2])
+
+    return data
+
+
+def _tags(tags, tag_offsets, position):
+    if tags is None:
+        return b""
+    st, end = tag_offsets[position], tag_offsets[position + 1]
+    return _field_packed(2, tags[st:end, 1]) + _field_packed(3, tags[st:end, 2])
+
+
+def _info(ids):
+    if len(ids) < 5:
+        return b""
+    version, timestamp, changeset = (int(x) for x in ids[2:5])
+    info = _field_varint(1, version) + _field_varint(2, timestamp) + _field_varint(3, changeset)
+    return _field_bytes(4, info)
+
+
+# -------------------------------------------------------------
+# protobuf encoding
+
+
+def _blob(blobtype, data):
+    """Encode zlib compressed data in a blob, preceded by its blob header and length"""
+
+    blob = _field_varint(2, len(data)) + _field_bytes(3, zlib.compress(data))
+    header = _field_bytes(1, blobtype.encode()) + _field_varint(3, len(blob))
+    return pack("!L", len(header)) + header + blob
+
+
+def _field_varint(key, value):
+    return _varint(key << 3) + _varint(int(value))
+
+
+def _field_bytes(key, value):
+    return _varint((key << 3) | 2) + _varint(len(value)) + value
+
+
+def _field_packed(key, values, signed=False, delta=False):
+    """Encode an array of integers in a packed field"""
+
+    values = np.asarray(values, dtype=np.int64)
+    if len(values) == 0:
+        return b""
+    if delta:
+        values = np.diff(values, prepend=0)
+    if signed:
+        values = (values << 1) ^ (values >> 63)
+
+    # numpy encoding is faster for large arrays only
+    if len(values) < VECTORIZE_SIZE:
+        return _field_bytes(key, b"".join(_varint(v) for v in values.tolist()))
+    return _field_bytes(key, _varints(values.view(np.uint64)))
+
+
+def _varint(value):
+    """Encode an integer in varint bytes, negative integers as 64 bits two's complement"""
+
+    value &= MASK64
+    res = bytearray()
+    while value > 0x7F:
+        res.append((value & 0x7F) | 0x80)
+        value >>= 7
+    res.append(value)
+    return bytes(res)
+
+
+def _varints(values):
+    """Encode an array of unsigned 64 bits integers in varints bytes"""
+
+    values = values.astype(np.uint64)
+    nbytes = np.ones(len(values), dtype=np.int64)
+    for k in range(1, 10):
+        nbytes += values >= np.uint64(1 << (7 * k))
+
+    res = np.empty(nbytes.sum(), dtype=np.uint8)
+    starts = np.cumsum(nbytes) - nbytes
+
+    for k in range(nbytes.max()):
+        mask = nbytes > k
+        byte = (values[mask] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (nbytes[mask] > k + 1).astype(np.uint64) << np.uint64(7)
+        res[starts[mask] + k] = byte | more
+
+    return res.tobytes()